@@ -1,7 +1,64 @@
 import datetime
 import uuid # Import uuid for TransactionGuid
 
+
+def _parse_db_datetime(dt_str):
+    """Parses an ISO datetime string from the DB; empty or invalid values become None."""
+    if dt_str:
+        try:
+            return datetime.datetime.fromisoformat(dt_str)
+        except ValueError:
+            return None
+    return None
+
+
+class _LazyTimestamp:
+    """
+    Descriptor for timestamp fields. Rows hydrated from SQLite keep the raw ISO
+    string in the backing slot; it is parsed to a datetime the first time the
+    field is read, so list screens that never touch a timestamp never pay for it.
+    """
+    def __init__(self, slot):
+        self.slot = slot
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        value = getattr(obj, self.slot)
+        if isinstance(value, str):
+            value = _parse_db_datetime(value)
+            setattr(obj, self.slot, value)
+        return value
+
+    def __set__(self, obj, value):
+        setattr(obj, self.slot, value)
+
+
 class WeighingTransaction:
+    __slots__ = (
+        "id", "transaction_guid", "vehicle_number", "vehicle_type_id",
+        "material_type_id", "customer_id",
+        "first_weight", "_first_weight_timestamp",
+        "second_weight", "_second_weight_timestamp",
+        "net_weight", "status", "operator_id", "remarks", "charges",
+        "_created_at", "_last_updated_at",
+    )
+
+    # Column order expected by from_row(); repositories SELECT exactly these columns.
+    DB_COLUMNS = (
+        "Id", "TransactionGuid", "VehicleNumber", "VehicleTypeId",
+        "MaterialTypeId", "CustomerId",
+        "FirstWeight", "FirstWeightTimestamp",
+        "SecondWeight", "SecondWeightTimestamp",
+        "NetWeight", "Status", "OperatorId", "Remarks", "Charges",
+        "CreatedAt", "LastUpdatedAt",
+    )
+
+    first_weight_timestamp = _LazyTimestamp("_first_weight_timestamp")
+    second_weight_timestamp = _LazyTimestamp("_second_weight_timestamp")
+    created_at = _LazyTimestamp("_created_at")
+    last_updated_at = _LazyTimestamp("_last_updated_at")
+
     def __init__(self, id=None, transaction_guid=None, vehicle_number=None, vehicle_type_id=None,
                  material_type_id=None, customer_id=None,
                  first_weight=None, first_weight_timestamp=None,
@@ -11,28 +68,44 @@ class WeighingTransaction:
                  remarks=None,
                  charges=None, # ADDED: New field for charges
                  created_at=None, last_updated_at=None): # Renamed updated_at to last_updated_at
-        
+
         self.id = id
         self.transaction_guid = transaction_guid if transaction_guid else str(uuid.uuid4()) # Generate UUID if not provided
         self.vehicle_number = vehicle_number
         self.vehicle_type_id = vehicle_type_id
         self.material_type_id = material_type_id
         self.customer_id = customer_id
-        
+
         self.first_weight = first_weight
         self.first_weight_timestamp = first_weight_timestamp
         self.second_weight = second_weight
         self.second_weight_timestamp = second_weight_timestamp
-        
+
         self.net_weight = net_weight
         self.status = status
         self.operator_id = operator_id
         self.remarks = remarks
         self.charges = charges # Assign the new charges field
-        
+
         self.created_at = created_at if created_at else datetime.datetime.now()
         self.last_updated_at = last_updated_at if last_updated_at else datetime.datetime.now()
 
+    @classmethod
+    def from_row(cls, row):
+        """
+        Fast hydrate from a DB row in DB_COLUMNS order (plain tuple or sqlite3.Row).
+        Skips __init__, so no GUID/timestamp defaults are generated for stored rows,
+        and timestamps stay as strings until first accessed.
+        """
+        t = cls.__new__(cls)
+        (t.id, t.transaction_guid, t.vehicle_number, t.vehicle_type_id,
+         t.material_type_id, t.customer_id,
+         t.first_weight, t._first_weight_timestamp,
+         t.second_weight, t._second_weight_timestamp,
+         t.net_weight, t.status, t.operator_id, t.remarks, t.charges,
+         t._created_at, t._last_updated_at) = row
+        return t
+
     def to_dict(self):
         return {
             "id": self.id,
@@ -79,4 +152,3 @@ class WeighingTransaction:
             created_at=parse_datetime(data.get("created_at")),
             last_updated_at=parse_datetime(data.get("last_updated_at"))
         )
-
@@ -0,0 +1,201 @@
+import sqlite3
+from resource_utils import resource_path
+from Model.report_model import day_bounds
+from Model.turnaround_model import DWELL_MINUTES
+
+# Group-by dimensions: name -> (expression over WeighingTransactions WT, expression over DailySummary DS).
+# None in the second slot means DailySummary can't answer it.
+DIMENSIONS = {
+    "day": ("DATE(WT.FirstWeightTimestamp)", "NULLIF(DS.SummaryDate, '')"),
+    "week": ("strftime('%Y-%W', WT.FirstWeightTimestamp)", "strftime('%Y-%W', NULLIF(DS.SummaryDate, ''))"),
+    "month": ("strftime('%Y-%m', WT.FirstWeightTimestamp)", "strftime('%Y-%m', NULLIF(DS.SummaryDate, ''))"),
+    "year": ("strftime('%Y', WT.FirstWeightTimestamp)", "strftime('%Y', NULLIF(DS.SummaryDate, ''))"),
+    "hour": ("strftime('%H', WT.FirstWeightTimestamp)", None),
+    "customer": ("C.Name", "C.Name"),
+    "material": ("MT.name", "MT.name"),
+    "vehicle_type": ("VT.Name", "VT.Name"),
+    "operator": ("U.Username", None),
+    "status": ("WT.Status", None),
+    "vehicle_number": ("WT.VehicleNumber", None),
+}
+
+# Measures: name -> (aggregate over WT, aggregate over DailySummary DS or None)
+MEASURES = {
+    "count": ("COUNT(*)", "SUM(DS.TransactionCount)"),
+    "total_net_weight": ("TOTAL(WT.NetWeight)", "TOTAL(DS.TotalNetWeight)"),
+    # Averages skip NULLs (pending weighings), which the rollup's counts can't tell apart
+    "avg_net_weight": ("AVG(WT.NetWeight)", None),
+    "total_charges": ("TOTAL(WT.Charges)", "TOTAL(DS.TotalCharges)"),
+    "avg_charges": ("AVG(WT.Charges)", None),
+    "avg_turnaround_minutes": (
+        f"AVG(CASE WHEN WT.SecondWeightTimestamp IS NOT NULL THEN {DWELL_MINUTES} END)", None),
+    "max_turnaround_minutes": (
+        f"MAX(CASE WHEN WT.SecondWeightTimestamp IS NOT NULL THEN {DWELL_MINUTES} END)", None),
+}
+
+# Measures whose per-column values add up to the row total; averages and maxima don't
+ADDITIVE_MEASURES = ("count", "total_net_weight", "total_charges")
+
+# Equality filters: name -> (column on WT, column on DailySummary DS or None)
+FILTERS = {
+    "customer_id": ("WT.CustomerId", "DS.CustomerId"),
+    "material_type_id": ("WT.MaterialTypeId", "DS.MaterialTypeId"),
+    "vehicle_type_id": ("WT.VehicleTypeId", "DS.VehicleTypeId"),
+    "operator_id": ("WT.OperatorId", None),
+    "status": ("WT.Status", None),
+}
+
+
+class AggregationRepository:
+    """
+    Compiles (dimensions, measures, filters) into one GROUP BY query.
+
+    Queries that only need dates, customer, material and vehicle type with
+    count / weight / charge measures are answered from the DailySummary rollup
+    (a few rows per day). Anything else runs against WeighingTransactions, with
+    the date range applied as a half-open FirstWeightTimestamp range so it
+    seeks the index.
+    """
+    def __init__(self, db_path="weighbridge.db"):
+        self.db_path = resource_path(db_path)
+        self._rollup_ready = False
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @staticmethod
+    def _validate(dimensions, measures, filters):
+        for name in dimensions:
+            if name not in DIMENSIONS:
+                raise ValueError(f"Unknown dimension: {name}. Allowed are {list(DIMENSIONS.keys())}")
+        if not measures:
+            raise ValueError("At least one measure is required.")
+        for name in measures:
+            if name not in MEASURES:
+                raise ValueError(f"Unknown measure: {name}. Allowed are {list(MEASURES.keys())}")
+        for name in filters:
+            if name not in FILTERS and name not in ("date_from", "date_to"):
+                raise ValueError(f"Unknown filter: {name}. Allowed are {['date_from', 'date_to'] + list(FILTERS.keys())}")
+
+    def _rollup_available(self):
+        """DailySummary is created by ReportRepository; until it exists everything reads WeighingTransactions."""
+        if not self._rollup_ready:
+            with self._connect() as conn:
+                self._rollup_ready = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'DailySummary'").fetchone() is not None
+        return self._rollup_ready
+
+    @staticmethod
+    def _can_use_rollup(dimensions, measures, filters):
+        return (all(DIMENSIONS[d][1] for d in dimensions)
+                and all(MEASURES[m][1] for m in measures)
+                and all(name in ("date_from", "date_to") or FILTERS[name][1] for name in filters))
+
+    def build_query(self, dimensions, measures, filters=None):
+        """Returns (sql, params, source) where source is 'DailySummary' or 'WeighingTransactions'."""
+        filters = {k: v for k, v in (filters or {}).items() if v not in (None, "")}
+        self._validate(dimensions, measures, filters)
+        use_rollup = self._can_use_rollup(dimensions, measures, filters) and self._rollup_available()
+        slot = 1 if use_rollup else 0
+
+        select = [f"{DIMENSIONS[d][slot]} AS {d}" for d in dimensions]
+        select += [f"{MEASURES[m][slot]} AS {m}" for m in measures]
+
+        if use_rollup:
+            source = '''
+                FROM DailySummary DS
+                LEFT JOIN Customers C ON DS.CustomerId = C.Id
+                LEFT JOIN MaterialTypes MT ON DS.MaterialTypeId = MT.Id
+                LEFT JOIN VehicleTypes VT ON DS.VehicleTypeId = VT.Id
+            '''
+            date_column = "DS.SummaryDate"
+        else:
+            source = '''
+                FROM WeighingTransactions WT
+                LEFT JOIN Customers C ON WT.CustomerId = C.Id
+                LEFT JOIN MaterialTypes MT ON WT.MaterialTypeId = MT.Id
+                LEFT JOIN VehicleTypes VT ON WT.VehicleTypeId = VT.Id
+                LEFT JOIN Users U ON WT.OperatorId = U.Id
+            '''
+            date_column = "WT.FirstWeightTimestamp"
+
+        conditions, params = [], []
+        start, end = day_bounds(filters.get("date_from"), filters.get("date_to"))
+        if start:
+            conditions.append(f"{date_column} >= ?")
+            params.append(start)
+        if end:
+            conditions.append(f"{date_column} < ?")
+            params.append(end)
+            if use_rollup:
+                conditions.append("DS.SummaryDate <> ''")
+        for name, value in filters.items():
+            if name in FILTERS:
+                conditions.append(f"{FILTERS[name][slot]} = ?")
+                params.append(value)
+
+        sql = f"SELECT {', '.join(select)} {source}"
+        if conditions:
+            sql += f" WHERE {' AND '.join(conditions)}"
+        if dimensions:
+            positions = ", ".join(str(i + 1) for i in range(len(dimensions)))
+            sql += f" GROUP BY {positions} ORDER BY {positions}"
+        return sql, params, ("DailySummary" if use_rollup else "WeighingTransactions")
+
+    def aggregate(self, dimensions, measures, filters=None):
+        """
+        Runs the aggregation and returns a list of dicts with one key per
+        dimension and measure, e.g.
+            aggregate(["customer", "material", "week"], ["total_net_weight", "total_charges"],
+                      {"date_from": "2024-01-01", "date_to": "2024-03-31"})
+        """
+        sql, params, source = self.build_query(dimensions, measures, filters)
+        with self._connect() as conn:
+            return [dict(row) for row in conn.execute(sql, params)]
+
+
+# Keys of the pivoted cells. Column values are wrapped in a tuple and the total
+# has its own, so no value (a customer named "Total", or one named after a row
+# dimension) can overwrite another cell.
+TOTAL = ("total",)
+
+
+def column_cell(label):
+    return ("column", label)
+
+
+def pivot(rows, row_dimensions, column_dimension, measure, totals=None, fill=0):
+    """
+    Pivots aggregate rows: one output row per distinct row_dimensions tuple, one
+    column per distinct column_dimension value holding `measure`.
+    Returns (column_labels, table) where each table row is a dict keyed by the
+    row dimensions, then column_cell(label) per column, plus TOTAL.
+
+    The total of an additive measure (ADDITIVE_MEASURES) is the sum of its
+    cells. Averages and maxima can't be summed: pass `totals`, the same
+    aggregation grouped by row_dimensions alone, and the total is read from it.
+    """
+    labels = [str(k) for k in sorted({row[column_dimension] for row in rows}, key=lambda k: (k is None, str(k)))]
+    additive = measure in ADDITIVE_MEASURES
+    table = {}
+    for row in rows:
+        key = tuple(row[d] for d in row_dimensions)
+        out = table.get(key)
+        if out is None:
+            out = {d: row[d] for d in row_dimensions}
+            out.update({column_cell(label): fill for label in labels})
+            out[TOTAL] = 0 if additive else None
+            table[key] = out
+        value = row[measure]
+        out[column_cell(str(row[column_dimension]))] = value
+        if additive:
+            out[TOTAL] += value or 0
+    if not additive and totals is not None:
+        for total_row in totals:
+            out = table.get(tuple(total_row[d] for d in row_dimensions))
+            if out is not None:
+                out[TOTAL] = total_row[measure]
+    ordered = [table[key] for key in sorted(table, key=lambda k: tuple((v is None, str(v)) for v in k))]
+    return labels, ordered
@@ -1,70 +1,241 @@
 import sqlite3
+import datetime
 from resource_utils import resource_path
+from utils.db_initializer import load_schema
+
+_REBUILD_DAILY_SUMMARY = """
+    INSERT INTO DailySummary (SummaryDate, MaterialTypeId, CustomerId, VehicleTypeId,
+                              TransactionCount, TotalNetWeight, TotalCharges)
+    SELECT IFNULL(DATE(FirstWeightTimestamp), ''), IFNULL(MaterialTypeId, 0),
+           IFNULL(CustomerId, 0), IFNULL(VehicleTypeId, 0),
+           COUNT(*), TOTAL(NetWeight), TOTAL(Charges)
+    FROM WeighingTransactions
+    GROUP BY 1, 2, 3, 4
+"""
+
+def day_bounds(date_from=None, date_to=None):
+    """
+    Turns inclusive calendar days ('YYYY-MM-DD' or date) into a half-open
+    [start, end) pair of ISO strings. Stored timestamps are ISO strings, so
+    `col >= start AND col < end` matches exactly those days and can seek the
+    FirstWeightTimestamp index, unlike DATE(col) = ?.
+    """
+    def _as_date(value):
+        if isinstance(value, datetime.datetime):
+            return value.date()
+        if isinstance(value, datetime.date):
+            return value
+        return datetime.date.fromisoformat(str(value)[:10])
+
+    start = _as_date(date_from).isoformat() if date_from else None
+    end = (_as_date(date_to) + datetime.timedelta(days=1)).isoformat() if date_to else None
+    return start, end
+
+
+def _date_conditions(date_from=None, date_to=None, column="WT.FirstWeightTimestamp"):
+    """SQL conditions and params for an inclusive day range on `column`."""
+    start, end = day_bounds(date_from, date_to)
+    conditions, params = [], []
+    if start:
+        conditions.append(f"{column} >= ?")
+        params.append(start)
+    if end:
+        conditions.append(f"{column} < ?")
+        params.append(end)
+    return conditions, params
+
+
+_REBUILD_SEARCH_INDEX = """
+    INSERT INTO TransactionSearch (rowid, VehicleNumber, CustomerName, MaterialName, OperatorName, Remarks)
+    SELECT WT.Id, WT.VehicleNumber, C.Name, MT.name, U.Username, WT.Remarks
+    FROM WeighingTransactions WT
+    LEFT JOIN Customers C ON WT.CustomerId = C.Id
+    LEFT JOIN MaterialTypes MT ON WT.MaterialTypeId = MT.Id
+    LEFT JOIN Users U ON WT.OperatorId = U.Id
+"""
+
+# Trigram tokens are three characters; shorter keywords can't use the index
+_MIN_FTS_KEYWORD = 3
+
 
 class ReportRepository:
+    # Column order of the joined transaction rows returned by the report queries
+    REPORT_COLUMNS = (
+        "Id", "TransactionGuid", "VehicleNumber", "VehicleTypeName",
+        "MaterialName", "CustomerName",
+        "FirstWeight", "FirstWeightTimestamp", "SecondWeight", "SecondWeightTimestamp",
+        "NetWeight", "Charges", "Status", "OperatorName",
+        "Remarks", "CreatedAt", "LastUpdatedAt",
+    )
+
+    # Search box column -> (expressions for the LIKE fallback, TransactionSearch column).
+    # None means the column isn't indexed; "*" searches every indexed column.
+    _SEARCH_COLUMNS = {
+        "VehicleNumber": (("WT.VehicleNumber",), "VehicleNumber"),
+        "CustomerName": (("C.Name",), "CustomerName"),
+        "MaterialName": (("MT.name",), "MaterialName"),
+        "Status": (("WT.Status",), None),
+        "VehicleTypeName": (("VT.Name",), None),
+        "OperatorName": (("U.Username",), "OperatorName"),
+        "Remarks": (("WT.Remarks",), "Remarks"),
+        "AllFields": (("WT.VehicleNumber", "C.Name", "MT.name", "U.Username", "WT.Remarks"), "*"),
+    }
+
     def __init__(self, db_path="weighbridge.db"):
         self.db_path = resource_path(db_path)
         print(f"DEBUG: ReportRepository initialized. Using DB at: {self.db_path}")
+        self._summary_ready = self._ensure_daily_summary()
+        self._search_ready = self._ensure_search_index()
 
     def _connect(self):
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
         return conn
 
+    def _ensure_daily_summary(self):
+        """Creates the DailySummary rollup and its triggers; backfills it the first time."""
+        with self._connect() as conn:
+            tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+            if "WeighingTransactions" not in tables:
+                return False  # Created later by WeighingTransactionRepository; retried on next read
+            conn.executescript(load_schema("create_weighing_transactions_daily_summary.sql"))
+        if "DailySummary" not in tables:
+            self.rebuild_daily_summary()
+        return True
+
+    def _ensure_search_index(self):
+        """Creates the TransactionSearch FTS index and its triggers; backfills it the first time."""
+        with self._connect() as conn:
+            tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+            if not {"WeighingTransactions", "Customers", "MaterialTypes", "Users"} <= tables:
+                return False
+            try:
+                conn.executescript(load_schema("create_weighing_transactions_search.sql"))
+            except sqlite3.OperationalError as e:
+                # SQLite built without FTS5 or older than 3.34 (no trigram tokenizer)
+                print(f"DEBUG: ReportRepository full-text search unavailable, using LIKE: {e}")
+                return False
+        if "TransactionSearch" not in tables:
+            self.rebuild_search_index()
+        return True
+
+    def rebuild_search_index(self):
+        """Repopulates TransactionSearch from WeighingTransactions and the master tables."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM TransactionSearch")
+            conn.execute(_REBUILD_SEARCH_INDEX)
+            count = conn.execute("SELECT COUNT(*) FROM TransactionSearch").fetchone()[0]
+        print(f"DEBUG: ReportRepository rebuilt TransactionSearch ({count} rows).")
+        return count
+
+    def _keyword_condition(self, column, keyword):
+        """
+        WHERE fragment and params for a substring search on `column`. Uses the
+        trigram index when it can, otherwise falls back to LIKE '%keyword%'.
+        """
+        if column not in self._SEARCH_COLUMNS:
+            raise ValueError(f"Invalid column selected for search: {column}. Allowed are {list(self._SEARCH_COLUMNS.keys())}")
+        like_exprs, fts_column = self._SEARCH_COLUMNS[column]
+
+        if fts_column and self._search_ready and len(keyword) >= _MIN_FTS_KEYWORD:
+            phrase = '"' + keyword.replace('"', '""') + '"'
+            match = phrase if fts_column == "*" else f"{fts_column} : {phrase}"
+            return "WT.Id IN (SELECT rowid FROM TransactionSearch WHERE TransactionSearch MATCH ?)", [match]
+
+        condition = " OR ".join(f"{expr} LIKE ?" for expr in like_exprs)
+        return f"({condition})", [f"%{keyword}%"] * len(like_exprs)
+
+    def _daily_summary_available(self):
+        if not self._summary_ready:
+            self._summary_ready = self._ensure_daily_summary()
+        return self._summary_ready
+
+    def rebuild_daily_summary(self):
+        """Recomputes DailySummary from WeighingTransactions in one transaction. Returns the row count."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM DailySummary")
+            conn.execute(_REBUILD_DAILY_SUMMARY)
+            count = conn.execute("SELECT COUNT(*) FROM DailySummary").fetchone()[0]
+        print(f"DEBUG: ReportRepository rebuilt DailySummary ({count} rows).")
+        return count
+
+    def _fetch_period_summary(self, period_expr):
+        if not self._daily_summary_available():
+            return []
+        query = f'''
+            SELECT {period_expr} AS Period,
+                   SUM(TransactionCount) AS TotalTransactions,
+                   SUM(TotalNetWeight) AS TotalNetWeight,
+                   SUM(TotalCharges) AS TotalCharges
+            FROM DailySummary
+            WHERE SummaryDate <> ''
+            GROUP BY Period
+            ORDER BY Period DESC;
+        '''
+        with self._connect() as conn:
+            return conn.execute(query).fetchall()
+
     def fetch_daily_summary(self):
+        if not self._daily_summary_available():
+            return []
+        # Reads the DailySummary rollup (a handful of rows per day) instead of scanning WeighingTransactions
         query = '''
-            SELECT DATE(FirstWeightTimestamp) AS TransactionDate,
-                   COUNT(*) AS TotalTransactions,
-                   SUM(NetWeight) AS TotalNetWeight,
-                   SUM(Charges) AS TotalCharges
-            FROM WeighingTransactions
-            GROUP BY DATE(FirstWeightTimestamp)
+            SELECT NULLIF(SummaryDate, '') AS TransactionDate,
+                   SUM(TransactionCount) AS TotalTransactions,
+                   SUM(TotalNetWeight) AS TotalNetWeight,
+                   SUM(TotalCharges) AS TotalCharges
+            FROM DailySummary
+            GROUP BY SummaryDate
             ORDER BY TransactionDate DESC;
         '''
         with self._connect() as conn:
             return conn.execute(query).fetchall()
 
+    def fetch_weekly_summary(self):
+        """Totals per week (Period = 'YYYY-WW', weeks starting Monday)."""
+        return self._fetch_period_summary("strftime('%Y-%W', SummaryDate)")
+
+    def fetch_monthly_summary(self):
+        """Totals per month (Period = 'YYYY-MM')."""
+        return self._fetch_period_summary("strftime('%Y-%m', SummaryDate)")
+
     def fetch_available_dates(self):
-        # --- START MODIFICATION ---
+        if not self._daily_summary_available():
+            return []
+        # Distinct days come straight off the DailySummary primary key
         query = '''
-            SELECT DISTINCT DATE(FirstWeightTimestamp) AS TransactionDate
-            FROM WeighingTransactions
-            WHERE FirstWeightTimestamp IS NOT NULL -- ADDED: Exclude NULL timestamps
+            SELECT SummaryDate AS TransactionDate
+            FROM DailySummary
+            WHERE SummaryDate <> ''
+            GROUP BY SummaryDate
             ORDER BY TransactionDate DESC;
         '''
-        # --- END MODIFICATION ---
         with self._connect() as conn:
             return [row["TransactionDate"] for row in conn.execute(query)]
 
     def fetch_transactions_by_date(self, date):
-        query = '''
+        return self.fetch_transactions_in_range(date, date)
+
+    def fetch_transactions_in_range(self, date_from=None, date_to=None):
+        """Transactions whose first weighing falls on date_from..date_to (inclusive days)."""
+        conditions, params = _date_conditions(date_from, date_to)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        query = f'''
             SELECT WT.VehicleNumber, NetWeight, Charges, Status,
                    VT.Name AS VehicleTypeName,
                    U.Username AS OperatorName
             FROM WeighingTransactions WT
             LEFT JOIN VehicleTypes VT ON WT.VehicleTypeId = VT.Id
             LEFT JOIN Users U ON WT.OperatorId = U.Id
-            WHERE DATE(FirstWeightTimestamp) = ?
+            {where}
             ORDER BY FirstWeightTimestamp;
         '''
         with self._connect() as conn:
-            return conn.execute(query, (date,)).fetchall()
+            return conn.execute(query, params).fetchall()
 
     def search_transactions(self, column, keyword):
-        allowed_columns = {
-            "VehicleNumber": "WT.VehicleNumber",
-            "CustomerName": "C.Name",
-            "MaterialName": "MT.name",
-            "Status": "WT.Status",
-            "VehicleTypeName": "VT.Name",
-            "OperatorName": "U.Username"
-        }
-
-        if column not in allowed_columns:
-            raise ValueError(f"Invalid column selected for search: {column}. Allowed are {list(allowed_columns.keys())}")
-
-        safe_column = allowed_columns[column]
-        
+        condition, params = self._keyword_condition(column, keyword)
+
         base_query = '''
             SELECT WT.Id, WT.TransactionGuid, WT.VehicleNumber,
                    VT.Name AS VehicleTypeName,
@@ -80,10 +251,10 @@ class ReportRepository:
             LEFT JOIN VehicleTypes VT ON WT.VehicleTypeId = VT.Id
         '''
         
-        query = f"{base_query} WHERE {safe_column} LIKE ? ORDER BY WT.FirstWeightTimestamp DESC;"
+        query = f"{base_query} WHERE {condition} ORDER BY WT.FirstWeightTimestamp DESC;"
 
         with self._connect() as conn:
-            return conn.execute(query, (f"%{keyword}%",)).fetchall()
+            return conn.execute(query, params).fetchall()
 
     def fetch_all_transactions(self):
         query = '''
@@ -119,18 +290,27 @@ class ReportRepository:
             query = "SELECT * FROM WeighingTransactions ORDER BY FirstWeightTimestamp DESC"
             return conn.execute(query).fetchall()
 
-    def fetch_combined_filtered_transactions(self, column=None, keyword=None, date=None):
+    def _build_combined_query(self, column=None, keyword=None, date=None, date_from=None, date_to=None,
+                              short_timestamps=False):
         """
-        Fetches transactions applying both text search and date filter.
+        SQL and params for the Report screen's search + date filter.
+        short_timestamps formats the four timestamp columns as 'YYYY-MM-DD HH:MM' in SQL.
         """
-        base_query = '''
+        if short_timestamps:
+            # strftime() is NULL for non-ISO text; keep the stored value then, like _short_timestamp
+            ts = {col: f"COALESCE(strftime('%Y-%m-%d %H:%M', WT.{col}), WT.{col}) AS {col}"
+                  for col in ("FirstWeightTimestamp", "SecondWeightTimestamp", "CreatedAt", "LastUpdatedAt")}
+        else:
+            ts = {col: f"WT.{col}"
+                  for col in ("FirstWeightTimestamp", "SecondWeightTimestamp", "CreatedAt", "LastUpdatedAt")}
+        base_query = f'''
             SELECT WT.Id, WT.TransactionGuid, WT.VehicleNumber,
                    VT.Name AS VehicleTypeName,
                    MT.name AS MaterialName, C.Name AS CustomerName,
-                   WT.FirstWeight, WT.FirstWeightTimestamp, WT.SecondWeight,
-                   WT.SecondWeightTimestamp, WT.NetWeight, WT.Charges,
+                   WT.FirstWeight, {ts["FirstWeightTimestamp"]}, WT.SecondWeight,
+                   {ts["SecondWeightTimestamp"]}, WT.NetWeight, WT.Charges,
                    WT.Status, U.Username AS OperatorName, WT.Remarks,
-                   WT.CreatedAt, WT.LastUpdatedAt
+                   {ts["CreatedAt"]}, {ts["LastUpdatedAt"]}
             FROM WeighingTransactions WT
             LEFT JOIN MaterialTypes MT ON WT.MaterialTypeId = MT.Id
             LEFT JOIN Customers C ON WT.CustomerId = C.Id
@@ -140,31 +320,83 @@ class ReportRepository:
         conditions = []
         params = []
         
-        allowed_search_columns = {
-            "VehicleNumber": "WT.VehicleNumber",
-            "CustomerName": "C.Name",
-            "MaterialName": "MT.name",
-            "Status": "WT.Status",
-            "VehicleTypeName": "VT.Name",
-            "OperatorName": "U.Username"
-        }
-
         if keyword and column:
-            if column not in allowed_search_columns:
-                raise ValueError(f"Invalid column selected for search: {column}.")
-            
-            conditions.append(f"{allowed_search_columns[column]} LIKE ?")
-            params.append(f"%{keyword}%")
+            condition, keyword_params = self._keyword_condition(column, keyword)
+            conditions.append(condition)
+            params.extend(keyword_params)
 
         if date and date != "All Dates":
-            conditions.append("DATE(FirstWeightTimestamp) = ?")
-            params.append(date)
+            date_from = date_to = date
+        date_sql, date_params = _date_conditions(date_from, date_to)
+        conditions.extend(date_sql)
+        params.extend(date_params)
 
-        if conditions:
-            query = f"{base_query} WHERE {' AND '.join(conditions)} ORDER BY WT.FirstWeightTimestamp DESC;"
-        else:
-            query = f"{base_query} ORDER BY WT.FirstWeightTimestamp DESC;"
-            
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        # Id breaks ties so LIMIT/OFFSET pages are stable
+        return f"{base_query} {where} ORDER BY WT.FirstWeightTimestamp DESC, WT.Id DESC", params
+
+    def fetch_combined_filtered_transactions(self, column=None, keyword=None, date=None,
+                                             date_from=None, date_to=None):
+        """
+        Fetches transactions applying both text search and date filter.
+        `date` selects a single day; date_from/date_to select an inclusive range of days.
+        """
+        query, params = self._build_combined_query(column, keyword, date, date_from, date_to)
         with self._connect() as conn:
             return conn.execute(query, params).fetchall()
 
+    def fetch_combined_filtered_page(self, column=None, keyword=None, date=None,
+                                     date_from=None, date_to=None, limit=500, offset=0, conn=None):
+        """
+        One page of fetch_combined_filtered_transactions, for the paged report grid.
+        Pass `conn` to run on a caller-owned connection (e.g. the live search worker's).
+        """
+        query, params = self._build_combined_query(column, keyword, date, date_from, date_to)
+        with (conn or self._connect()) as conn:
+            return conn.execute(f"{query} LIMIT ? OFFSET ?", params + [limit, offset]).fetchall()
+
+    def count_combined_filtered_transactions(self, column=None, keyword=None, date=None,
+                                             date_from=None, date_to=None, conn=None):
+        # Without a keyword the count is a sum over a few DailySummary rows
+        if not (keyword and column) and self._daily_summary_available():
+            if date and date != "All Dates":
+                date_from = date_to = date
+            start, end = day_bounds(date_from, date_to)
+            conditions, params = [], []
+            if start:
+                conditions.append("SummaryDate >= ?")
+                params.append(start)
+            if end:
+                conditions.append("SummaryDate < ?")
+                params.append(end)
+            if start or end:
+                conditions.append("SummaryDate <> ''")
+            where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            with (conn or self._connect()) as conn:
+                return conn.execute(f"SELECT IFNULL(SUM(TransactionCount), 0) FROM DailySummary {where}",
+                                    params).fetchone()[0]
+
+        query, params = self._build_combined_query(column, keyword, date, date_from, date_to)
+        with (conn or self._connect()) as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM ({query})", params).fetchone()[0]
+
+    def iter_combined_filtered_transactions(self, column=None, keyword=None, date=None,
+                                            date_from=None, date_to=None, chunk_size=1000,
+                                            short_timestamps=False):
+        """
+        Same rows as fetch_combined_filtered_transactions, streamed as lists of
+        plain tuples (REPORT_COLUMNS order) of at most chunk_size rows, so large
+        exports never hold the whole result in memory.
+        """
+        query, params = self._build_combined_query(column, keyword, date, date_from, date_to,
+                                                   short_timestamps=short_timestamps)
+        conn = sqlite3.connect(self.db_path)
+        try:
+            cursor = conn.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield rows
+        finally:
+            conn.close()
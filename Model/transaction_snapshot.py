@@ -0,0 +1,273 @@
+import sqlite3
+import datetime
+import numpy as np
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+_SECONDS_PER_DAY = 86400
+
+
+def _to_epoch(value):
+    """ISO string / datetime -> seconds since 1970 (naive, local wall clock). None/invalid -> NaN."""
+    if not value:
+        return np.nan
+    if isinstance(value, str):
+        try:
+            value = datetime.datetime.fromisoformat(value)
+        except ValueError:
+            return np.nan
+    elif isinstance(value, datetime.date) and not isinstance(value, datetime.datetime):
+        value = datetime.datetime(value.year, value.month, value.day)
+    return (value - _EPOCH).total_seconds()
+
+
+class _Dictionary:
+    """Dictionary encoding: maps each distinct value to a small integer code."""
+    def __init__(self):
+        self.values = []
+        self._codes = {}
+
+    def encode(self, value):
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self._codes[value] = code
+            self.values.append(value)
+        return code
+
+    def code_of(self, value):
+        return self._codes.get(value, -1)
+
+
+class TransactionSnapshot:
+    """
+    Columnar, in-memory copy of WeighingTransactions for report aggregations.
+
+    Weights, charges and timestamps are NumPy float arrays (NaN for NULL,
+    timestamps as epoch seconds); vehicle number, customer, material, vehicle
+    type and status are dictionary-encoded into int32 code arrays. refresh()
+    pulls only rows whose Id or LastUpdatedAt is past the last watermark, so
+    after the first load a refresh costs a couple of index seeks. Deletes are
+    found by comparing Ids with the table and dropped in place. Filters and
+    group-bys then run vectorised over the arrays instead of going back to SQL.
+
+    db_path is used as given; pass an already resolved path such as
+    ReportRepository.db_path.
+    """
+    _FLOAT_COLUMNS = ("first_weight", "second_weight", "net_weight", "charges",
+                      "first_ts", "second_ts", "created_ts", "updated_ts")
+    _CODE_COLUMNS = ("vehicle_number", "customer", "material", "vehicle_type", "status")
+
+    # Maps group_totals(by=...) names to the dictionary-encoded column
+    GROUPABLE = {
+        "vehicle_number": "vehicle_number",
+        "customer": "customer",
+        "material": "material",
+        "vehicle_type": "vehicle_type",
+        "status": "status",
+    }
+
+    def __init__(self, db_path="weighbridge.db", initial_capacity=1024):
+        self.db_path = db_path
+        self._initial_capacity = initial_capacity
+        self._reset()
+
+    _SELECT = """
+        SELECT Id, VehicleNumber, CustomerId, MaterialTypeId, VehicleTypeId, Status,
+               FirstWeight, SecondWeight, NetWeight, Charges,
+               FirstWeightTimestamp, SecondWeightTimestamp, CreatedAt, LastUpdatedAt
+        FROM WeighingTransactions
+    """
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path)
+
+    def _reset(self):
+        capacity = self._initial_capacity
+        self.size = 0
+        self.ids = np.zeros(capacity, dtype=np.int64)
+        for name in self._FLOAT_COLUMNS:
+            setattr(self, name, np.full(capacity, np.nan))
+        self.dictionaries = {}
+        for name in self._CODE_COLUMNS:
+            setattr(self, f"{name}_code", np.full(capacity, -1, dtype=np.int32))
+            self.dictionaries[name] = _Dictionary()
+        self._row_of_id = {}
+        self._max_id = 0
+        self._watermark = ""
+
+    def _ensure_capacity(self, needed):
+        capacity = len(self.ids)
+        if needed <= capacity:
+            return
+        new_capacity = max(needed, int(capacity * 1.5) + 1)
+        for name in ("ids",) + self._FLOAT_COLUMNS + tuple(f"{c}_code" for c in self._CODE_COLUMNS):
+            old = getattr(self, name)
+            fill = -1 if name.endswith("_code") else (0 if name == "ids" else np.nan)
+            grown = np.full(new_capacity, fill, dtype=old.dtype)
+            grown[:capacity] = old
+            setattr(self, name, grown)
+
+    # --- Loading ---
+    def rebuild(self):
+        """Drops everything and reloads the whole table."""
+        self._reset()
+        return self.refresh()
+
+    def refresh(self, conn=None):
+        """
+        Applies inserts/updates since the last refresh. Returns the number of rows
+        applied. Deletes can't be seen through a watermark, so if the row count or
+        the highest Id no longer matches the table, the Ids are compared with the
+        table's: deleted rows are dropped and rows the watermark missed are loaded.
+
+        conn: an open connection to use (e.g. a background runner's); by default
+        one is opened for the call.
+        """
+        if conn is None:
+            with self._connect() as own_conn:
+                return self.refresh(own_conn)
+
+        rows = conn.execute(f"{self._SELECT} WHERE Id > ? UNION {self._SELECT} WHERE LastUpdatedAt >= ?",
+                            (self._max_id, self._watermark)).fetchall()
+        table_count, table_max_id = conn.execute(
+            "SELECT COUNT(*), COALESCE(MAX(Id), 0) FROM WeighingTransactions").fetchone()
+
+        for row in rows:
+            self._apply(row)
+        if table_count != self.size or table_max_id != self._max_id:
+            return len(rows) + self._sync_ids(conn, table_max_id)
+        return len(rows)
+
+    def _sync_ids(self, conn, table_max_id):
+        """Drops rows deleted from the table and loads rows the watermarks missed. Returns rows loaded."""
+        table_ids = np.fromiter((row[0] for row in conn.execute("SELECT Id FROM WeighingTransactions")),
+                                dtype=np.int64)
+        n = self.size
+        keep = np.isin(self.ids[:n], table_ids)
+        if not keep.all():
+            self._compact(keep)
+        missing = np.setdiff1d(table_ids, self.ids[:self.size]).tolist()
+        for start in range(0, len(missing), 500):
+            chunk = missing[start:start + 500]
+            placeholders = ", ".join("?" * len(chunk))
+            for row in conn.execute(f"{self._SELECT} WHERE Id IN ({placeholders})", chunk).fetchall():
+                self._apply(row)
+        # A deleted highest Id can be handed out again; watch for Ids above the table's
+        self._max_id = table_max_id
+        return len(missing)
+
+    def _compact(self, keep):
+        """Keeps the rows where `keep` is True, in order, and renumbers them."""
+        n, kept = self.size, int(keep.sum())
+        for name in ("ids",) + self._FLOAT_COLUMNS + tuple(f"{c}_code" for c in self._CODE_COLUMNS):
+            column = getattr(self, name)
+            column[:kept] = column[:n][keep]
+            column[kept:n] = -1 if name.endswith("_code") else (0 if name == "ids" else np.nan)
+        self.size = kept
+        self._row_of_id = {tid: index for index, tid in enumerate(self.ids[:kept].tolist())}
+
+    def _apply(self, row):
+        (tid, vehicle_number, customer_id, material_id, vehicle_type_id, status,
+         first_weight, second_weight, net_weight, charges,
+         first_ts, second_ts, created_at, last_updated_at) = row
+
+        index = self._row_of_id.get(tid)
+        if index is None:
+            index = self.size
+            self._ensure_capacity(index + 1)
+            self._row_of_id[tid] = index
+            self.ids[index] = tid
+            self.size += 1
+
+        self.first_weight[index] = np.nan if first_weight is None else first_weight
+        self.second_weight[index] = np.nan if second_weight is None else second_weight
+        self.net_weight[index] = np.nan if net_weight is None else net_weight
+        self.charges[index] = np.nan if charges is None else charges
+        self.first_ts[index] = _to_epoch(first_ts)
+        self.second_ts[index] = _to_epoch(second_ts)
+        self.created_ts[index] = _to_epoch(created_at)
+        self.updated_ts[index] = _to_epoch(last_updated_at)
+
+        d = self.dictionaries
+        self.vehicle_number_code[index] = d["vehicle_number"].encode(vehicle_number)
+        self.customer_code[index] = d["customer"].encode(customer_id)
+        self.material_code[index] = d["material"].encode(material_id)
+        self.vehicle_type_code[index] = d["vehicle_type"].encode(vehicle_type_id)
+        self.status_code[index] = d["status"].encode(status)
+
+        if tid > self._max_id:
+            self._max_id = tid
+        if last_updated_at and last_updated_at > self._watermark:
+            self._watermark = last_updated_at
+
+    # --- Vectorised queries ---
+    def mask(self, date_from=None, date_to=None, status=None, customer_id=None,
+             material_type_id=None, vehicle_type_id=None, vehicle_number=None):
+        """
+        Boolean row mask for the given filters. Dates filter FirstWeightTimestamp on
+        the half-open range [date_from, date_to); pass date objects or ISO strings.
+        """
+        n = self.size
+        result = np.ones(n, dtype=bool)
+        if date_from is not None:
+            result &= self.first_ts[:n] >= _to_epoch(date_from)
+        if date_to is not None:
+            result &= self.first_ts[:n] < _to_epoch(date_to)
+        for column, value in (("status", status), ("customer", customer_id),
+                              ("material", material_type_id), ("vehicle_type", vehicle_type_id),
+                              ("vehicle_number", vehicle_number)):
+            if value is not None:
+                code = self.dictionaries[column].code_of(value)
+                result &= getattr(self, f"{column}_code")[:n] == code
+        return result
+
+    def totals(self, mask=None):
+        """Count, total net weight and total charges for the masked rows."""
+        n = self.size
+        selected = slice(None) if mask is None else mask
+        net = self.net_weight[:n][selected]
+        charges = self.charges[:n][selected]
+        return {
+            "TotalTransactions": int(net.shape[0]),
+            "TotalNetWeight": float(np.nansum(net)),
+            "TotalCharges": float(np.nansum(charges)),
+        }
+
+    def group_totals(self, by, mask=None):
+        """
+        Count / net weight / charges per distinct value of `by` (one of GROUPABLE,
+        or "day" for the calendar date of FirstWeightTimestamp).
+        Returns a list of dicts sorted by key, skipping empty groups.
+        """
+        n = self.size
+        if mask is None:
+            mask = np.ones(n, dtype=bool)
+
+        if by == "day":
+            days = np.floor(self.first_ts[:n][mask] / _SECONDS_PER_DAY)
+            valid = ~np.isnan(days)
+            keys_arr, codes = np.unique(days[valid], return_inverse=True)
+            labels = [(_EPOCH + datetime.timedelta(days=int(k))).date().isoformat() for k in keys_arr]
+            net = self.net_weight[:n][mask][valid]
+            charges = self.charges[:n][mask][valid]
+        elif by in self.GROUPABLE:
+            column = self.GROUPABLE[by]
+            codes = getattr(self, f"{column}_code")[:n][mask]
+            labels = self.dictionaries[column].values
+            net = self.net_weight[:n][mask]
+            charges = self.charges[:n][mask]
+        else:
+            raise ValueError(f"Cannot group by {by!r}. Allowed are {['day'] + list(self.GROUPABLE)}")
+
+        size = len(labels)
+        counts = np.bincount(codes, minlength=size)
+        net_sums = np.bincount(codes, weights=np.nan_to_num(net), minlength=size)
+        charge_sums = np.bincount(codes, weights=np.nan_to_num(charges), minlength=size)
+
+        groups = [
+            {"Key": labels[i], "TotalTransactions": int(counts[i]),
+             "TotalNetWeight": float(net_sums[i]), "TotalCharges": float(charge_sums[i])}
+            for i in np.nonzero(counts)[0]
+        ]
+        groups.sort(key=lambda g: (g["Key"] is None, g["Key"]))
+        return groups
@@ -0,0 +1,128 @@
+import sqlite3
+import datetime
+from resource_utils import resource_path
+from Model.report_model import day_bounds
+
+# Minutes between the two weighings; julianday() accepts the ISO strings the repository stores
+# (rounded to 2 places: julianday is a float in days and leaves noise like 0.99999994)
+DWELL_MINUTES = "ROUND((julianday(WT.SecondWeightTimestamp) - julianday(WT.FirstWeightTimestamp)) * 1440, 2)"
+
+# Grouping keys for percentile breakdowns: name -> SQL expression
+GROUPS = {
+    "hour": "strftime('%H', WT.FirstWeightTimestamp)",
+    "customer": "C.Name",
+    "material": "MT.name",
+}
+
+DEFAULT_PERCENTILES = (50, 90, 95)
+
+
+def percentile(sorted_values, pct):
+    """Linear-interpolated percentile of an already sorted list (same as numpy's default)."""
+    if not sorted_values:
+        return None
+    position = (len(sorted_values) - 1) * pct / 100.0
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    fraction = position - lower
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * fraction
+
+
+class TurnaroundRepository:
+    """
+    Truck turnaround analytics from the two weigh timestamps.
+
+    Dwell time is the gap between first and second weighing of a completed
+    transaction. Trucks still inside the yard are the Pending transactions; they
+    are read through the partial index IX_WeighingTransactions_Pending, which
+    only holds pending rows, so the list stays cheap however large the history
+    grows. (The home screen's live count is WeighingTransactionRepository.count_pending.)
+    """
+    def __init__(self, db_path="weighbridge.db"):
+        self.db_path = resource_path(db_path)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @staticmethod
+    def _completed_conditions(date_from=None, date_to=None):
+        conditions = [
+            "WT.Status = 'Completed'",
+            "WT.FirstWeightTimestamp IS NOT NULL",
+            "WT.SecondWeightTimestamp IS NOT NULL",
+        ]
+        params = []
+        start, end = day_bounds(date_from, date_to)
+        if start:
+            conditions.append("WT.FirstWeightTimestamp >= ?")
+            params.append(start)
+        if end:
+            conditions.append("WT.FirstWeightTimestamp < ?")
+            params.append(end)
+        return conditions, params
+
+    def fetch_dwell_times(self, date_from=None, date_to=None):
+        """Per-transaction dwell time in minutes for completed weighings, oldest first."""
+        conditions, params = self._completed_conditions(date_from, date_to)
+        query = f'''
+            SELECT WT.Id, WT.VehicleNumber, C.Name AS CustomerName, MT.name AS MaterialName,
+                   WT.FirstWeightTimestamp, WT.SecondWeightTimestamp,
+                   {DWELL_MINUTES} AS DwellMinutes
+            FROM WeighingTransactions WT
+            LEFT JOIN Customers C ON WT.CustomerId = C.Id
+            LEFT JOIN MaterialTypes MT ON WT.MaterialTypeId = MT.Id
+            WHERE {' AND '.join(conditions)}
+            ORDER BY WT.FirstWeightTimestamp
+        '''
+        with self._connect() as conn:
+            return [dict(row) for row in conn.execute(query, params)]
+
+    def fetch_dwell_percentiles(self, group_by="hour", date_from=None, date_to=None,
+                                percentiles=DEFAULT_PERCENTILES):
+        """
+        Dwell-time percentiles per hour of day, customer or material, e.g.
+            [{"group": "08", "count": 41, "avg": 22.5, "p50": 18.0, "p90": 40.2, "p95": 51.7}, ...]
+        Negative gaps (clock corrections) are ignored.
+        """
+        if group_by not in GROUPS:
+            raise ValueError(f"Unknown group: {group_by}. Allowed are {list(GROUPS.keys())}")
+        conditions, params = self._completed_conditions(date_from, date_to)
+        query = f'''
+            SELECT {GROUPS[group_by]} AS GroupKey, {DWELL_MINUTES} AS DwellMinutes
+            FROM WeighingTransactions WT
+            LEFT JOIN Customers C ON WT.CustomerId = C.Id
+            LEFT JOIN MaterialTypes MT ON WT.MaterialTypeId = MT.Id
+            WHERE {' AND '.join(conditions)}
+        '''
+        groups = {}
+        with self._connect() as conn:
+            for key, minutes in conn.execute(query, params):
+                if minutes is not None and minutes >= 0:
+                    groups.setdefault(key, []).append(minutes)
+
+        result = []
+        for key in sorted(groups, key=lambda k: (k is None, str(k))):
+            values = sorted(groups[key])
+            row = {"group": key, "count": len(values), "avg": sum(values) / len(values)}
+            for pct in percentiles:
+                row[f"p{pct}"] = percentile(values, pct)
+            result.append(row)
+        return result
+
+    def fetch_in_yard(self, now=None):
+        """Pending transactions with minutes spent in the yard so far, longest waiting first."""
+        now = (now or datetime.datetime.now()).isoformat()
+        query = '''
+            SELECT WT.Id, WT.VehicleNumber, C.Name AS CustomerName, MT.name AS MaterialName,
+                   WT.FirstWeightTimestamp,
+                   ROUND((julianday(?) - julianday(WT.FirstWeightTimestamp)) * 1440, 2) AS MinutesInYard
+            FROM WeighingTransactions WT
+            LEFT JOIN Customers C ON WT.CustomerId = C.Id
+            LEFT JOIN MaterialTypes MT ON WT.MaterialTypeId = MT.Id
+            WHERE WT.Status = 'Pending'
+            ORDER BY WT.FirstWeightTimestamp
+        '''
+        with self._connect() as conn:
+            return [dict(row) for row in conn.execute(query, (now,))]
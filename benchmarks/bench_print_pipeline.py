@@ -0,0 +1,203 @@
+"""
+Print pipeline: where the time goes between "print" and the printer.
+
+Stages, each reported as p50/p90/p99/max milliseconds:
+    fetch         PrinterViewModel.get_transaction_by_id
+    receipt pdf   ReceiptPrinter.generate_receipt_pdf, first render (ReceiptStore miss)
+    reprint pdf   the same call again (ReceiptStore hit)
+    escpos        EscPosRenderer.render, the thermal-printer byte stream
+    slip pdf      WeighbridgeSlipGenerator.generate_slip_pdf with a preloaded MasterDataResolver
+    handoff       PrintSpooler.submit() until a stub backend receives the file
+    end to end    PrintSpooler.submit() until the job is marked Done
+
+The spooler stages use transactions not rendered before, so each job
+includes a first render, as a new weighing would.
+
+The stub backend stands in for the printer (--print-ms simulates its
+latency), so nothing is printed. --profile writes cProfile stats for the
+whole run and prints the top functions; --tracemalloc prints the largest
+allocation sites and the peak.
+
+Run from the project root:
+    python -m benchmarks.bench_print_pipeline --rows 20000 --samples 200 [--profile print.prof] [--tracemalloc 15]
+"""
+import io
+import os
+import time
+import pstats
+import random
+import sqlite3
+import cProfile
+import argparse
+import tempfile
+import threading
+import contextlib
+import tracemalloc
+
+from Model.turnaround_model import percentile
+from Model.WeighingTransactionModel import WeighingTransaction
+from repositories.master_data_resolver import MasterDataResolver
+from utils.app_config import AppConfig, validate
+from utils.escpos import EscPosRenderer
+from utils.print_spooler import PrintSpooler
+from viewmodels.pri import ReceiptPrinter, configure_print_logging
+from tests.fixtures import seed_database
+
+
+class _StubBackend:
+    """Records when each file arrives instead of printing it."""
+    name = "stub"
+
+    def __init__(self, print_ms=0.0):
+        self.print_ms = print_ms
+        self.received = [] # perf_counter() at each print_file call
+
+    def print_file(self, path):
+        received_at = time.perf_counter()
+        os.path.getsize(path) # The real backends read the file
+        self.received.append(received_at)
+        if self.print_ms:
+            time.sleep(self.print_ms / 1000)
+
+
+class _PinnedPrinter(ReceiptPrinter):
+    """ReceiptPrinter on the benchmark's config; never follows the real config.json."""
+    def refresh(self):
+        return self
+
+
+def _summary(name, samples_ms):
+    ordered = sorted(samples_ms)
+    p50, p90, p99 = (percentile(ordered, pct) for pct in (50, 90, 99))
+    print(f"{name:<12} {len(ordered):>6} {p50:9.3f} {p90:9.3f} {p99:9.3f} {ordered[-1]:9.3f}")
+
+
+def _timed(fn, items):
+    samples = []
+    for item in items:
+        t0 = time.perf_counter()
+        fn(item)
+        samples.append((time.perf_counter() - t0) * 1000)
+    return samples
+
+
+def _spooler_stage(db_path, printer, ids, print_ms):
+    backend = _StubBackend(print_ms)
+    done = {}
+    finished = threading.Condition()
+
+    def on_status(job):
+        if job["Status"] in ("Done", "Failed"):
+            with finished:
+                done[job["Id"]] = (time.perf_counter(), job["Status"])
+                finished.notify_all()
+
+    spooler = PrintSpooler(db_path, render=printer.render_transaction, backend=backend, poll_interval=0.05).start()
+    handoff, end_to_end, failed = [], [], 0
+    try:
+        for transaction_id in ids:
+            before = len(backend.received)
+            t0 = time.perf_counter()
+            job_id = spooler.submit(transaction_id, on_status=on_status)
+            with finished:
+                while job_id not in done:
+                    # No Tk loop here: deliver the spooler's status callbacks ourselves
+                    spooler.dispatcher.run_pending()
+                    finished.wait(0.001)
+            arrived = backend.received[before:]
+            finished_at, status = done[job_id]
+            if status != "Done" or not arrived:
+                failed += 1
+                continue
+            handoff.append((arrived[0] - t0) * 1000)
+            end_to_end.append((finished_at - t0) * 1000)
+    finally:
+        spooler.shutdown(wait=True)
+    return handoff, end_to_end, failed
+
+
+def run(db_path, work_dir, samples, print_ms, template_path):
+    # Keep the receipt printer's log out of the working directory
+    configure_print_logging(os.path.join(work_dir, "print_log.txt"))
+    config = AppConfig(validate({
+        "database_path": db_path,
+        "receipt_template": template_path,
+        "receipt_store_folder": os.path.join(work_dir, "store"),
+        "print_backend": "file",
+        "print_drop_folder": os.path.join(work_dir, "drop"),
+    }))
+    printer = _PinnedPrinter(config)
+    with sqlite3.connect(db_path) as conn:
+        max_id = conn.execute("SELECT MAX(Id) FROM WeighingTransactions").fetchone()[0]
+    rng = random.Random(11)
+    picked = rng.sample(range(1, max_id + 1), min(2 * samples, max_id))
+    ids, spool_ids = picked[:len(picked) // 2], picked[len(picked) // 2:]
+
+    print(f"{'stage':<12} {'n':>6} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    _summary("fetch", _timed(printer.viewmodel.get_transaction_by_id, ids))
+
+    transactions = [printer.viewmodel.get_transaction_by_id(i) for i in ids]
+    _summary("receipt pdf", _timed(printer.generate_receipt_pdf, transactions))
+    _summary("reprint pdf", _timed(printer.generate_receipt_pdf, transactions))
+    _summary("escpos", _timed(EscPosRenderer(printer.template).render, transactions))
+
+    from print_log import WeighbridgeSlipGenerator
+    slips = WeighbridgeSlipGenerator("BENCH", "-", "-", "-", output_dir=os.path.join(work_dir, "slips"),
+                                     resolver=MasterDataResolver(db_path))
+    columns = ", ".join(WeighingTransaction.DB_COLUMNS)
+    with sqlite3.connect(db_path) as conn:
+        models = [WeighingTransaction.from_row(conn.execute(
+            f"SELECT {columns} FROM WeighingTransactions WHERE Id = ?", (i,)).fetchone()) for i in ids]
+    with contextlib.redirect_stdout(io.StringIO()):
+        slip_samples = _timed(lambda t: slips.generate_slip_pdf(t, f"slip_{t.id}.pdf"), models)
+    _summary("slip pdf", slip_samples)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        handoff, end_to_end, failed = _spooler_stage(db_path, printer, spool_ids, print_ms)
+    _summary("handoff", handoff)
+    _summary("end to end", end_to_end)
+    if failed:
+        print(f"⚠️ {failed} spooler job(s) failed")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--samples", type=int, default=200)
+    parser.add_argument("--print-ms", type=float, default=0.0, help="Simulated printer latency per job")
+    parser.add_argument("--template", default="receipt_template.json")
+    parser.add_argument("--profile", metavar="FILE", help="Write cProfile stats for the run to FILE")
+    parser.add_argument("--tracemalloc", type=int, metavar="N", default=0, help="Show the top N allocation sites")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        seed_database(db_path, args.rows)
+        print(f"rows: {args.rows:,}   samples: {args.samples}   simulated print: {args.print_ms} ms")
+
+        profiler = cProfile.Profile() if args.profile else None
+        if args.tracemalloc:
+            tracemalloc.start(10)
+        if profiler:
+            profiler.enable()
+        try:
+            run(db_path, tmp, args.samples, args.print_ms, os.path.abspath(args.template))
+        finally:
+            if profiler:
+                profiler.disable()
+            if args.tracemalloc:
+                snapshot = tracemalloc.take_snapshot()
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+        if profiler:
+            profiler.dump_stats(args.profile)
+            print(f"\ncProfile stats written to {args.profile} (top 15 by cumulative time):")
+            pstats.Stats(profiler).sort_stats("cumulative").print_stats(15)
+        if args.tracemalloc:
+            print(f"\ntracemalloc: peak {peak / 1024 / 1024:.1f} MB, top {args.tracemalloc} sites:")
+            for stat in snapshot.statistics("lineno")[:args.tracemalloc]:
+                print(f"  {stat}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Receipt PDFs: the old ReceiptPrinter.generate_receipt_pdf (header, labels and
+rules redrawn with canvas calls for both copies on the page) against the
+JSON template, whose static part is drawn once per document as a form XObject.
+
+Reports time and bytes per receipt for one-receipt files (the print path) and
+for one multi-page file (batch reprints).
+
+Run from the project root:
+    python -m benchmarks.bench_receipt_template --receipts 500
+"""
+import os
+import time
+import argparse
+import tempfile
+
+from num2words import num2words
+from reportlab.pdfgen import canvas
+from reportlab.lib.pagesizes import A4
+
+from utils.receipt_template import ReceiptTemplate
+
+
+def _legacy_draw_page(c, transaction):
+    """Body of the old generate_receipt_pdf, kept verbatim for comparison."""
+    page_width, page_height = A4
+    half_height = page_height / 2
+
+    def draw_receipt(y_offset: float):
+        left_x = 60
+        line_y = y_offset + 260
+        c.setFont("Helvetica-Bold", 14)
+        c.drawCentredString(page_width / 2, line_y, "AGM BLUE METALS")
+        c.setFont("Helvetica", 10)
+        for text in ["GST NO: 33AARFA8461G1Z9", "144/1-C, Karanampettai,", "COIMBATORE, TAMILNADU, 641401."]:
+            line_y -= 15
+            c.drawCentredString(page_width / 2, line_y, text)
+        line_y -= 30
+        c.drawString(left_x, line_y, f"SL NO       : {transaction['Id']}")
+        c.drawString(left_x, line_y - 15, f"MATERIAL    : {transaction.get('MaterialName', '-')}")
+        c.drawRightString(page_width - 60, line_y, f"VEHICLE NO : {transaction['VehicleNumber']}")
+        c.drawRightString(page_width - 60, line_y - 15, f"CUSTOMER     : {transaction.get('CustomerName', '-')}")
+        line_y -= 30
+        c.line(left_x, line_y, page_width - 60, line_y)
+        line_y -= 20
+        c.drawString(left_x, line_y, f"GROSS WEIGHT : {transaction['FirstWeight']} Tons")
+        c.drawString(left_x, line_y - 15, f"TARE WEIGHT  : {transaction['SecondWeight']} Tons")
+        c.drawString(left_x, line_y - 30, f"NET WEIGHT   : {transaction['NetWeight']} Tons")
+        c.drawRightString(page_width - 60, line_y, f"DATE TIME (Gross): {transaction['FirstWeightTimestamp']}")
+        c.drawRightString(page_width - 60, line_y - 15, f"DATE TIME (Tare) : {transaction['SecondWeightTimestamp']}")
+        charges = transaction.get("Charges")
+        charges_str = f"{charges:.2f}" if charges is not None else "0.00"
+        c.drawRightString(page_width - 60, line_y - 30, f"CHARGES         : Rs. {charges_str}")
+        line_y -= 50
+        c.line(left_x, line_y, page_width - 60, line_y)
+        net_words = num2words(int(transaction["NetWeight"] or 0)).upper()
+        c.drawString(left_x, line_y - 20, f"NET WT (in words): {net_words} TONS")
+        c.drawString(left_x, line_y - 50, "OPERATOR SIGNATURE ___________________________")
+
+    draw_receipt(half_height)
+    draw_receipt(0)
+    c.showPage()
+
+
+def _legacy_render(file_path, transactions):
+    c = canvas.Canvas(file_path, pagesize=A4)
+    for transaction in transactions:
+        _legacy_draw_page(c, transaction)
+    c.save()
+
+
+def _make_transactions(count):
+    return [{
+        "Id": i, "VehicleNumber": f"TN{i % 90 + 10}AB{i % 9000 + 1000}",
+        "MaterialName": "20mm Jelly", "CustomerName": f"Customer {i % 150}",
+        "FirstWeight": 32.5 + i % 7, "SecondWeight": 11.2, "NetWeight": 21.3 + i % 7,
+        "FirstWeightTimestamp": "2024-05-01T08:15:00", "SecondWeightTimestamp": "2024-05-01T08:41:00",
+        "Charges": 150.0,
+    } for i in range(1, count + 1)]
+
+
+def _single_files(render, transactions, out_dir, tag):
+    start = time.perf_counter()
+    total_bytes = 0
+    for i, transaction in enumerate(transactions):
+        path = os.path.join(out_dir, f"{tag}_{i}.pdf")
+        render(path, [transaction])
+        total_bytes += os.path.getsize(path)
+    return time.perf_counter() - start, total_bytes
+
+
+def _one_file(render, transactions, out_dir, tag):
+    path = os.path.join(out_dir, f"{tag}_batch.pdf")
+    start = time.perf_counter()
+    render(path, transactions)
+    return time.perf_counter() - start, os.path.getsize(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--receipts", type=int, default=500)
+    parser.add_argument("--template", default="receipt_template.json")
+    args = parser.parse_args()
+
+    template = ReceiptTemplate.load(args.template)
+    transactions = _make_transactions(args.receipts)
+    n = len(transactions)
+
+    with tempfile.TemporaryDirectory() as out_dir:
+        for label, runner in (("one file per receipt", _single_files), ("one multi-page file", _one_file)):
+            legacy_s, legacy_bytes = runner(_legacy_render, transactions, out_dir, "legacy")
+            template_s, template_bytes = runner(template.render, transactions, out_dir, "template")
+            print(f"{label} ({n} receipts):")
+            print(f"  legacy   : {legacy_s / n * 1000:7.2f} ms/receipt  {legacy_bytes / n:9.0f} bytes/receipt")
+            print(f"  template : {template_s / n * 1000:7.2f} ms/receipt  {template_bytes / n:9.0f} bytes/receipt")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Report keyword search: LIKE '%keyword%' on the joined columns against the
+TransactionSearch trigram index.
+
+Run from the project root:
+    python -m benchmarks.bench_report_search --rows 1000000
+"""
+import io
+import os
+import time
+import argparse
+import tempfile
+import statistics
+import contextlib
+
+from Model.report_model import ReportRepository
+from tests.fixtures import seed_database
+
+
+# (column, keyword) pairs run against both implementations
+_SEARCHES = [
+    ("VehicleNumber", "AB1234"),
+    ("CustomerName", "Quarry 17"),
+    ("MaterialName", "M-Sand"),
+    ("Remarks", "weighbridge 42"),
+    ("AllFields", "TN45"),
+]
+
+
+def _median_ms(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples), len(result)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        seed_database(db_path, args.rows)
+        t0 = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            repo = ReportRepository(db_path=db_path)
+        print(f"rows: {args.rows:,}   index build: {time.perf_counter() - t0:.1f} s   "
+              f"fts available: {repo._search_ready}")
+
+        print(f"{'column':<14} {'keyword':<16} {'LIKE ms':>9} {'FTS ms':>9} {'rows':>7}")
+        for column, keyword in _SEARCHES:
+            repo._search_ready = False
+            like_ms, like_rows = _median_ms(lambda: repo.search_transactions(column, keyword), args.repeat)
+            repo._search_ready = True
+            fts_ms, fts_rows = _median_ms(lambda: repo.search_transactions(column, keyword), args.repeat)
+            flag = "" if like_rows == fts_rows else "  MISMATCH"
+            print(f"{column:<14} {keyword:<16} {like_ms:9.1f} {fts_ms:9.1f} {fts_rows:7}{flag}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+WeighingTransactionRepository.get_all() row mapping: the previous mapper
+(sqlite3.Row name lookups, nested parse helper, eager fromisoformat on four
+timestamps, full __init__) against the index-based, lazily-parsed from_row().
+
+The headline figure is get_all() end to end, compared with the 3x target.
+The mapping-only stage is shown separately; it is much faster, but SQL and
+fetch take most of what is left. The "load_transactions" lines add the
+newest-first ordering the transaction list needs: the old view model
+re-sorted on the parsed CreatedAt, the new one relies on the SQL ORDER BY.
+
+Run from the project root:
+    python -m benchmarks.bench_row_mapping --rows 100000
+"""
+import io
+import os
+import time
+import sqlite3
+import argparse
+import datetime
+import tempfile
+import contextlib
+
+from Model.WeighingTransactionModel import WeighingTransaction
+from repositories.WeighingTransactionRepository import WeighingTransactionRepository
+
+_TARGET = 3.0 # End-to-end get_all() speedup the row-mapping work aimed for
+
+
+def _legacy_row_to_model(row):
+    """The mapper get_all() used before from_row(), kept verbatim for comparison."""
+    def parse_db_datetime(dt_str):
+        if dt_str:
+            try:
+                return datetime.datetime.fromisoformat(dt_str)
+            except ValueError:
+                return None
+        return None
+
+    return WeighingTransaction(
+        id=row["Id"],
+        transaction_guid=row["TransactionGuid"],
+        vehicle_number=row["VehicleNumber"],
+        vehicle_type_id=row["VehicleTypeId"],
+        material_type_id=row["MaterialTypeId"],
+        customer_id=row["CustomerId"],
+        first_weight=row["FirstWeight"],
+        first_weight_timestamp=parse_db_datetime(row["FirstWeightTimestamp"]),
+        second_weight=row["SecondWeight"],
+        second_weight_timestamp=parse_db_datetime(row["SecondWeightTimestamp"]),
+        net_weight=row["NetWeight"],
+        status=row["Status"],
+        operator_id=row["OperatorId"],
+        remarks=row["Remarks"],
+        charges=row["Charges"],
+        created_at=parse_db_datetime(row["CreatedAt"]),
+        last_updated_at=parse_db_datetime(row["LastUpdatedAt"])
+    )
+
+
+def _legacy_fetch(conn):
+    conn.row_factory = sqlite3.Row
+    return conn.execute("SELECT * FROM WeighingTransactions ORDER BY CreatedAt DESC").fetchall()
+
+
+def _legacy_get_all(conn):
+    return [_legacy_row_to_model(row) for row in _legacy_fetch(conn)]
+
+
+def _legacy_load_transactions(conn):
+    """get_all() plus the re-sort _publish_transactions_for_display used to do."""
+    transactions = _legacy_get_all(conn)
+    transactions.sort(key=lambda x: x.created_at if isinstance(x.created_at, datetime.datetime) else datetime.datetime.min, reverse=True)
+    return transactions
+
+
+def _seed(repo, count):
+    start = datetime.datetime(2024, 1, 1, 6, 0, 0)
+    txns = []
+    for i in range(count):
+        first = start + datetime.timedelta(minutes=7 * i)
+        txns.append(WeighingTransaction(
+            vehicle_number=f"TN37AB{i % 5000:04d}",
+            vehicle_type_id=1 + i % 4,
+            material_type_id=1 + i % 6,
+            customer_id=1 + i % 40,
+            first_weight=12000.0,
+            first_weight_timestamp=first,
+            second_weight=30000.0,
+            second_weight_timestamp=first + datetime.timedelta(minutes=25),
+            net_weight=18000.0,
+            status="Completed",
+            operator_id=1,
+            remarks="bench",
+            charges=900.0,
+        ))
+    repo.add_many(txns)
+
+
+def _best_of(repeat, fn):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with contextlib.redirect_stdout(io.StringIO()):
+            repo = WeighingTransactionRepository(db_path=os.path.join(tmp, "bench.db"))
+            _seed(repo, args.rows)
+        legacy_conn = sqlite3.connect(repo.db_path)
+
+        # Mapping stage alone, on rows that have already been fetched
+        named_rows = _legacy_fetch(legacy_conn)
+        tuple_rows = repo._select("ORDER BY CreatedAt DESC").fetchall()
+        from_row = WeighingTransaction.from_row
+        legacy_map = _best_of(args.repeat, lambda: [_legacy_row_to_model(r) for r in named_rows])
+        lean_map = _best_of(args.repeat, lambda: [from_row(r) for r in tuple_rows])
+
+        # End to end: SQL + fetch + mapping
+        fetch_only = _best_of(args.repeat, lambda: repo._select("ORDER BY CreatedAt DESC").fetchall())
+        legacy = _best_of(args.repeat, lambda: _legacy_get_all(legacy_conn))
+        lean = _best_of(args.repeat, repo.get_all)
+
+        def _lean_touching_timestamps():
+            for t in repo.get_all():
+                t.first_weight_timestamp, t.second_weight_timestamp
+
+        lean_touched = _best_of(args.repeat, _lean_touching_timestamps)
+        legacy_load = _best_of(args.repeat, lambda: _legacy_load_transactions(legacy_conn))
+
+        speedup = legacy / lean
+        print(f"rows: {args.rows:,}")
+        print(f"get_all() end to end: {speedup:.1f}x against a 3x target "
+              f"({'met' if speedup >= _TARGET else 'NOT met'})")
+        print(f"  SQL + fetch, no mapping (floor)    {fetch_only:8.3f} s")
+        print(f"  legacy mapper                      {legacy:8.3f} s")
+        print(f"  from_row (timestamps untouched)    {lean:8.3f} s   {speedup:5.1f}x")
+        print(f"  from_row + read 2 timestamps/row   {lean_touched:8.3f} s   {legacy / lean_touched:5.1f}x")
+        print(f"  best possible with this fetch      {legacy / fetch_only:8.1f}x (mapping cost zero)")
+        print("load_transactions: get_all() + newest-first ordering")
+        print(f"  legacy (Python re-sort)            {legacy_load:8.3f} s")
+        print(f"  from_row (SQL order only)          {lean:8.3f} s   {legacy_load / lean:5.1f}x")
+        print("mapping stage only (rows already fetched)")
+        print(f"  legacy mapper                      {legacy_map:8.3f} s")
+        print(f"  from_row                           {lean_map:8.3f} s   {legacy_map / lean_map:5.1f}x")
+
+        legacy_conn.close()
+        repo.conn.close()
+
+
+if __name__ == "__main__":
+    main()
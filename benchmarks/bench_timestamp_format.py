@@ -0,0 +1,74 @@
+"""
+Timestamp formatting for the report PDF: per-cell pd.to_datetime (the old
+export_to_pdf), one vectorised pandas pass (format_timestamp_column, used by
+report.py's DataFrame export), per-cell fromisoformat (StreamingReportExporter
+when the source returns raw timestamps), and strftime() inside SQLite (the
+report screen's PDF export).
+
+Run from the project root:
+    python -m benchmarks.bench_timestamp_format --rows 200000
+"""
+import time
+import random
+import sqlite3
+import argparse
+import datetime
+
+import pandas as pd
+
+from utils.report_export import format_timestamp_column, _short_timestamp
+
+
+def _make_timestamps(count):
+    rng = random.Random(3)
+    start = datetime.datetime(2023, 1, 1)
+    values = [(start + datetime.timedelta(seconds=rng.randrange(60 * 86400), microseconds=rng.randrange(10 ** 6))).isoformat()
+              for _ in range(count)]
+    # A few NULLs, as pending transactions have no second weighing
+    for i in range(0, count, 50):
+        values[i] = None
+    return values
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200_000)
+    args = parser.parse_args()
+
+    values = _make_timestamps(args.rows)
+    series = pd.Series(values, dtype=object)
+
+    legacy_s, legacy = _timed(lambda: series.apply(
+        lambda x: pd.to_datetime(x).strftime('%Y-%m-%d %H:%M') if pd.notna(x) else None))
+    vector_s, vector = _timed(lambda: format_timestamp_column(series))
+    percell_s, percell = _timed(lambda: [_short_timestamp(v) or None for v in values])
+
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE T (Ts TEXT)")
+    conn.executemany("INSERT INTO T VALUES (?)", ((v,) for v in values))
+    raw_s, _ = _timed(lambda: conn.execute("SELECT Ts FROM T").fetchall())
+    sql_s, sql_rows = _timed(lambda: conn.execute(
+        "SELECT COALESCE(strftime('%Y-%m-%d %H:%M', Ts), Ts) FROM T").fetchall())
+    sql = [r[0] for r in sql_rows]
+
+    def _normalise(cells):
+        return [None if v is None or v != v else v for v in cells]  # NaN -> None
+
+    assert _normalise(legacy) == _normalise(vector) == percell == sql, "formatters disagree"
+
+    print(f"rows: {args.rows:,}")
+    print(f"  per-cell pd.to_datetime().strftime (old)  {legacy_s:8.3f} s")
+    print(f"  vectorised pd.to_datetime(...).dt.strftime {vector_s:8.3f} s   {legacy_s / vector_s:7.1f}x")
+    print(f"  per-cell datetime.fromisoformat            {percell_s:8.3f} s   {legacy_s / percell_s:7.1f}x")
+    print(f"  SQLite strftime() (minus plain fetch)      {max(sql_s - raw_s, 1e-6):8.3f} s   "
+          f"{legacy_s / max(sql_s - raw_s, 1e-6):7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
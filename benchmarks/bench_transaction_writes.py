@@ -0,0 +1,90 @@
+"""
+Rows/sec for WeighingTransactionRepository writes: one commit per row versus
+group commit versus a single batched unit of work.
+
+Run from the project root:
+    python -m benchmarks.bench_transaction_writes --rows 2000
+"""
+import os
+import io
+import time
+import argparse
+import tempfile
+import datetime
+import contextlib
+
+from Model.WeighingTransactionModel import WeighingTransaction
+from repositories.WeighingTransactionRepository import WeighingTransactionRepository
+
+
+def _make_transactions(count):
+    now = datetime.datetime.now()
+    return [
+        WeighingTransaction(
+            vehicle_number=f"TN37AB{i:04d}",
+            vehicle_type_id=1,
+            material_type_id=1,
+            customer_id=1,
+            first_weight=12000.0 + i,
+            first_weight_timestamp=now,
+            second_weight=30000.0 + i,
+            second_weight_timestamp=now,
+            net_weight=18000.0,
+            status="Completed",
+            operator_id=1,
+            charges=900.0,
+        )
+        for i in range(count)
+    ]
+
+
+def _fresh_repo(directory, name, **kwargs):
+    path = os.path.join(directory, name)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return WeighingTransactionRepository(db_path=path, **kwargs)
+
+
+def _timed(label, rows, fn):
+    # The repository prints a debug line per write; keep it out of the timing output
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+    print(f"{label:<28} {rows:>7} rows  {elapsed:8.3f} s  {rows / elapsed:12,.0f} rows/s")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--group-interval", type=float, default=0.05,
+                        help="group commit interval in seconds for the grouped run")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        single = _fresh_repo(tmp, "single.db")
+        txns = _make_transactions(args.rows)
+        base = _timed("add() commit per row", args.rows, lambda: [single.add(t) for t in txns])
+
+        grouped = _fresh_repo(tmp, "grouped.db", group_commit_interval=args.group_interval)
+        txns = _make_transactions(args.rows)
+
+        def _grouped_run():
+            for t in txns:
+                grouped.add(t)
+            grouped.flush()
+        _timed(f"add() group commit {args.group_interval}s", args.rows, _grouped_run)
+
+        batched = _fresh_repo(tmp, "batched.db")
+        txns = _make_transactions(args.rows)
+        batch = _timed("add_many() one transaction", args.rows, lambda: batched.add_many(txns))
+
+        _timed("update_many() one transaction", args.rows, lambda: batched.update_many(txns))
+        print(f"\nadd_many speedup over per-row commits: {base / batch:.1f}x")
+
+        for repo in (single, grouped, batched):
+            repo.conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,15 @@
+CREATE TABLE IF NOT EXISTS PrintJobs (
+    Id INTEGER PRIMARY KEY AUTOINCREMENT,
+    TransactionId INTEGER NOT NULL,
+    Backend TEXT,
+    Status TEXT NOT NULL DEFAULT 'Queued', -- 'Queued', 'Printing', 'Retry', 'Done', 'Failed'
+    Attempts INTEGER NOT NULL DEFAULT 0,
+    LastError TEXT,
+    NextAttemptAt DATETIME NOT NULL,
+    CreatedAt DATETIME NOT NULL,
+    UpdatedAt DATETIME NOT NULL,
+    FOREIGN KEY (TransactionId) REFERENCES WeighingTransactions(Id)
+);
+
+CREATE INDEX IF NOT EXISTS IX_PrintJobs_Status_NextAttemptAt
+    ON PrintJobs (Status, NextAttemptAt);
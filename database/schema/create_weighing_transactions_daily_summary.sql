@@ -0,0 +1,74 @@
+-- Per-day rollup of WeighingTransactions, maintained by triggers.
+-- NULL keys are stored as '' / 0 so they still collide in the primary key.
+CREATE TABLE IF NOT EXISTS DailySummary (
+    SummaryDate TEXT NOT NULL,
+    MaterialTypeId INTEGER NOT NULL,
+    CustomerId INTEGER NOT NULL,
+    VehicleTypeId INTEGER NOT NULL,
+    TransactionCount INTEGER NOT NULL DEFAULT 0,
+    TotalNetWeight REAL NOT NULL DEFAULT 0,
+    TotalCharges REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (SummaryDate, MaterialTypeId, CustomerId, VehicleTypeId)
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS TR_WeighingTransactions_DailySummary_Insert
+AFTER INSERT ON WeighingTransactions
+BEGIN
+    INSERT INTO DailySummary (SummaryDate, MaterialTypeId, CustomerId, VehicleTypeId,
+                              TransactionCount, TotalNetWeight, TotalCharges)
+    VALUES (IFNULL(DATE(NEW.FirstWeightTimestamp), ''), IFNULL(NEW.MaterialTypeId, 0),
+            IFNULL(NEW.CustomerId, 0), IFNULL(NEW.VehicleTypeId, 0),
+            1, IFNULL(NEW.NetWeight, 0), IFNULL(NEW.Charges, 0))
+    ON CONFLICT (SummaryDate, MaterialTypeId, CustomerId, VehicleTypeId) DO UPDATE SET
+        TransactionCount = TransactionCount + 1,
+        TotalNetWeight = TotalNetWeight + excluded.TotalNetWeight,
+        TotalCharges = TotalCharges + excluded.TotalCharges;
+END;
+
+CREATE TRIGGER IF NOT EXISTS TR_WeighingTransactions_DailySummary_Update
+AFTER UPDATE OF FirstWeightTimestamp, MaterialTypeId, CustomerId, VehicleTypeId, NetWeight, Charges
+ON WeighingTransactions
+BEGIN
+    UPDATE DailySummary SET
+        TransactionCount = TransactionCount - 1,
+        TotalNetWeight = TotalNetWeight - IFNULL(OLD.NetWeight, 0),
+        TotalCharges = TotalCharges - IFNULL(OLD.Charges, 0)
+    WHERE SummaryDate = IFNULL(DATE(OLD.FirstWeightTimestamp), '')
+      AND MaterialTypeId = IFNULL(OLD.MaterialTypeId, 0)
+      AND CustomerId = IFNULL(OLD.CustomerId, 0)
+      AND VehicleTypeId = IFNULL(OLD.VehicleTypeId, 0);
+    DELETE FROM DailySummary
+    WHERE SummaryDate = IFNULL(DATE(OLD.FirstWeightTimestamp), '')
+      AND MaterialTypeId = IFNULL(OLD.MaterialTypeId, 0)
+      AND CustomerId = IFNULL(OLD.CustomerId, 0)
+      AND VehicleTypeId = IFNULL(OLD.VehicleTypeId, 0)
+      AND TransactionCount <= 0;
+    INSERT INTO DailySummary (SummaryDate, MaterialTypeId, CustomerId, VehicleTypeId,
+                              TransactionCount, TotalNetWeight, TotalCharges)
+    VALUES (IFNULL(DATE(NEW.FirstWeightTimestamp), ''), IFNULL(NEW.MaterialTypeId, 0),
+            IFNULL(NEW.CustomerId, 0), IFNULL(NEW.VehicleTypeId, 0),
+            1, IFNULL(NEW.NetWeight, 0), IFNULL(NEW.Charges, 0))
+    ON CONFLICT (SummaryDate, MaterialTypeId, CustomerId, VehicleTypeId) DO UPDATE SET
+        TransactionCount = TransactionCount + 1,
+        TotalNetWeight = TotalNetWeight + excluded.TotalNetWeight,
+        TotalCharges = TotalCharges + excluded.TotalCharges;
+END;
+
+CREATE TRIGGER IF NOT EXISTS TR_WeighingTransactions_DailySummary_Delete
+AFTER DELETE ON WeighingTransactions
+BEGIN
+    UPDATE DailySummary SET
+        TransactionCount = TransactionCount - 1,
+        TotalNetWeight = TotalNetWeight - IFNULL(OLD.NetWeight, 0),
+        TotalCharges = TotalCharges - IFNULL(OLD.Charges, 0)
+    WHERE SummaryDate = IFNULL(DATE(OLD.FirstWeightTimestamp), '')
+      AND MaterialTypeId = IFNULL(OLD.MaterialTypeId, 0)
+      AND CustomerId = IFNULL(OLD.CustomerId, 0)
+      AND VehicleTypeId = IFNULL(OLD.VehicleTypeId, 0);
+    DELETE FROM DailySummary
+    WHERE SummaryDate = IFNULL(DATE(OLD.FirstWeightTimestamp), '')
+      AND MaterialTypeId = IFNULL(OLD.MaterialTypeId, 0)
+      AND CustomerId = IFNULL(OLD.CustomerId, 0)
+      AND VehicleTypeId = IFNULL(OLD.VehicleTypeId, 0)
+      AND TransactionCount <= 0;
+END;
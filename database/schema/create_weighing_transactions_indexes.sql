@@ -0,0 +1,24 @@
+-- Incremental refresh watermark for TransactionSnapshot
+CREATE INDEX IF NOT EXISTS IX_WeighingTransactions_LastUpdatedAt
+    ON WeighingTransactions (LastUpdatedAt);
+
+-- get_all() lists newest first without sorting the whole table
+CREATE INDEX IF NOT EXISTS IX_WeighingTransactions_CreatedAt
+    ON WeighingTransactions (CreatedAt);
+
+-- Report date filters use half-open ranges on FirstWeightTimestamp
+CREATE INDEX IF NOT EXISTS IX_WeighingTransactions_FirstWeightTimestamp
+    ON WeighingTransactions (FirstWeightTimestamp);
+
+-- Partial index holding only trucks still in the yard: the live yard count
+-- on the home screen reads this instead of scanning the whole history
+CREATE INDEX IF NOT EXISTS IX_WeighingTransactions_Pending
+    ON WeighingTransactions (FirstWeightTimestamp) WHERE Status = 'Pending';
+
+-- "Print Recent": newest completed transaction is one seek from the end of this index
+CREATE INDEX IF NOT EXISTS IX_WeighingTransactions_Status_LastUpdatedAt
+    ON WeighingTransactions (Status, LastUpdatedAt);
+
+-- ... and the same for one vehicle, without filtering the whole completed history row by row
+CREATE INDEX IF NOT EXISTS IX_WeighingTransactions_VehicleNumber_Status_LastUpdatedAt
+    ON WeighingTransactions (VehicleNumber, Status, LastUpdatedAt);
@@ -0,0 +1,80 @@
+-- Trigram full-text index for report keyword search (rowid = WeighingTransactions.Id).
+-- Needs SQLite 3.34+ (FTS5 trigram tokenizer).
+CREATE VIRTUAL TABLE IF NOT EXISTS TransactionSearch USING fts5(
+    VehicleNumber, CustomerName, MaterialName, OperatorName, Remarks,
+    tokenize = 'trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS TR_WeighingTransactions_Search_Insert
+AFTER INSERT ON WeighingTransactions
+BEGIN
+    INSERT INTO TransactionSearch (rowid, VehicleNumber, CustomerName, MaterialName, OperatorName, Remarks)
+    VALUES (NEW.Id, NEW.VehicleNumber,
+            (SELECT Name FROM Customers WHERE Id = NEW.CustomerId),
+            (SELECT name FROM MaterialTypes WHERE Id = NEW.MaterialTypeId),
+            (SELECT Username FROM Users WHERE Id = NEW.OperatorId),
+            NEW.Remarks);
+END;
+
+CREATE TRIGGER IF NOT EXISTS TR_WeighingTransactions_Search_Update
+AFTER UPDATE OF VehicleNumber, CustomerId, MaterialTypeId, OperatorId, Remarks
+ON WeighingTransactions
+BEGIN
+    DELETE FROM TransactionSearch WHERE rowid = OLD.Id;
+    INSERT INTO TransactionSearch (rowid, VehicleNumber, CustomerName, MaterialName, OperatorName, Remarks)
+    VALUES (NEW.Id, NEW.VehicleNumber,
+            (SELECT Name FROM Customers WHERE Id = NEW.CustomerId),
+            (SELECT name FROM MaterialTypes WHERE Id = NEW.MaterialTypeId),
+            (SELECT Username FROM Users WHERE Id = NEW.OperatorId),
+            NEW.Remarks);
+END;
+
+CREATE TRIGGER IF NOT EXISTS TR_WeighingTransactions_Search_Delete
+AFTER DELETE ON WeighingTransactions
+BEGIN
+    DELETE FROM TransactionSearch WHERE rowid = OLD.Id;
+END;
+
+-- Renaming or deleting a master record re-labels the transactions that reference it;
+-- after a delete the name is NULL, as the report's LEFT JOIN returns it
+CREATE TRIGGER IF NOT EXISTS TR_Customers_Search_Rename
+AFTER UPDATE OF Name ON Customers
+BEGIN
+    UPDATE TransactionSearch SET CustomerName = NEW.Name
+    WHERE rowid IN (SELECT Id FROM WeighingTransactions WHERE CustomerId = NEW.Id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS TR_MaterialTypes_Search_Rename
+AFTER UPDATE OF name ON MaterialTypes
+BEGIN
+    UPDATE TransactionSearch SET MaterialName = NEW.name
+    WHERE rowid IN (SELECT Id FROM WeighingTransactions WHERE MaterialTypeId = NEW.Id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS TR_Users_Search_Rename
+AFTER UPDATE OF Username ON Users
+BEGIN
+    UPDATE TransactionSearch SET OperatorName = NEW.Username
+    WHERE rowid IN (SELECT Id FROM WeighingTransactions WHERE OperatorId = NEW.Id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS TR_Customers_Search_Delete
+AFTER DELETE ON Customers
+BEGIN
+    UPDATE TransactionSearch SET CustomerName = NULL
+    WHERE rowid IN (SELECT Id FROM WeighingTransactions WHERE CustomerId = OLD.Id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS TR_MaterialTypes_Search_Delete
+AFTER DELETE ON MaterialTypes
+BEGIN
+    UPDATE TransactionSearch SET MaterialName = NULL
+    WHERE rowid IN (SELECT Id FROM WeighingTransactions WHERE MaterialTypeId = OLD.Id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS TR_Users_Search_Delete
+AFTER DELETE ON Users
+BEGIN
+    UPDATE TransactionSearch SET OperatorName = NULL
+    WHERE rowid IN (SELECT Id FROM WeighingTransactions WHERE OperatorId = OLD.Id);
+END;
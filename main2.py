@@ -1,35 +1,20 @@
-import os
-import json
-import subprocess
-from viewmodels.pri import ReceiptPrinter
-
-def load_config():
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-    config_path = os.path.join(base_dir, "config.json")
-    with open(config_path, "r") as f:
-        config = json.load(f)
-    # Resolve relative paths
-    config["database_path"] = os.path.join(base_dir, config.get("database_path", "weighbridge.db"))
-    config["sumatra_path"] = os.path.join(base_dir, config.get("sumatra_path", "SumatraPDF/SumatraPDF.exe"))
-    return config
+from viewmodels.pri import get_receipt_printer
+from utils.print_backends import PrintError
 
 def main():
-    config = load_config()
-    printer = ReceiptPrinter()  # now uses config internally — no args needed
+    printer = get_receipt_printer()  # shared printer, config.json loaded once by the ConfigService
 
     transaction_id = 7  # 👈 Change this to target a specific transaction
 
     transaction = printer.viewmodel.get_transaction_by_id(transaction_id)
     if transaction:
-        pdf_path = printer.generate_receipt_pdf(transaction)
-        print(f"📄 PDF saved at: {pdf_path}")
-        command = [printer.sumatra_path, "-print-to-default", "-silent", pdf_path]
-        exit_code = subprocess.call(command)
-
-        if exit_code == 0:
+        pdf_path = printer.generate_receipt(transaction)
+        print(f"📄 Receipt saved at: {pdf_path}")
+        try:
+            printer.print_file(pdf_path)
             print(f"✅ Successfully printed transaction ID {transaction_id}")
-        else:
-            print(f"❌ Print failed with exit code {exit_code}")
+        except PrintError as e:
+            print(f"❌ Print failed: {e}")
     else:
         print(f"❌ No transaction found for ID {transaction_id}")
 
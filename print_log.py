@@ -12,13 +12,18 @@ from Model.WeighingTransactionModel import WeighingTransaction
 class WeighbridgeSlipGenerator:
     """
     Generates a PDF weighbridge slip with company letterhead and transaction details.
+
+    Pass a shared MasterDataResolver to print vehicle type, customer and
+    material names instead of their ids; lookups are served from its cache.
     """
-    def __init__(self, company_name: str, company_address: str, company_phone: str, company_email: str, output_dir: str = "receipts"):
+    def __init__(self, company_name: str, company_address: str, company_phone: str, company_email: str, output_dir: str = "receipts",
+                 resolver=None):
         self.company_name = company_name
         self.company_address = company_address
         self.company_phone = company_phone
         self.company_email = company_email
         self.output_dir = output_dir
+        self.resolver = resolver
         os.makedirs(self.output_dir, exist_ok=True)
 
         self.styles = getSampleStyleSheet()
@@ -86,6 +91,11 @@ class WeighbridgeSlipGenerator:
         elements.append(Spacer(1, 5*mm))
         return elements
 
+    def _document(self, pdf_path):
+        return SimpleDocTemplate(pdf_path, pagesize=A4,
+                                 rightMargin=15*mm, leftMargin=15*mm,
+                                 topMargin=15*mm, bottomMargin=15*mm)
+
     def generate_slip_pdf(self, transaction: WeighingTransaction, output_filename: str = None) -> str:
         """
         Generates a PDF weighbridge slip for a given transaction.
@@ -107,10 +117,55 @@ class WeighbridgeSlipGenerator:
             output_filename = f"weighbridge_slip_{guid_prefix}_{datetime.datetime.now().strftime('%Y%m%d%H%M%S')}.pdf"
         
         pdf_path = os.path.join(self.output_dir, output_filename)
-        doc = SimpleDocTemplate(pdf_path, pagesize=A4,
-                                rightMargin=15*mm, leftMargin=15*mm,
-                                topMargin=15*mm, bottomMargin=15*mm)
-        
+        doc = self._document(pdf_path)
+        story = self._build_slip_story(transaction)
+
+        try:
+            doc.build(story)
+            print(f"PDF slip generated at: {pdf_path}")
+            return pdf_path
+        except Exception as e:
+            print(f"Error generating PDF: {e}")
+            raise
+
+    def generate_batch_pdf(self, transactions, output_filename: str, progress=None) -> str:
+        """
+        Renders many slips into one multi-page PDF, one slip per page.
+
+        Args:
+            transactions: Iterable of WeighingTransaction objects (may be a generator).
+            output_filename: Name of the PDF inside output_dir.
+            progress: Optional callable(slips_done) called as each slip is laid out.
+
+        Returns:
+            The path to the generated PDF file.
+        """
+        pdf_path = os.path.join(self.output_dir, output_filename)
+        story = []
+        count = 0
+        for transaction in transactions:
+            if count:
+                story.append(PageBreak())
+            story.extend(self._build_slip_story(transaction))
+            count += 1
+            if progress:
+                progress(count)
+        if not story:
+            story.append(Paragraph("No transactions.", self.styles['FieldValue']))
+        self._document(pdf_path).build(story)
+        print(f"PDF slip pack generated at: {pdf_path} ({count} slips)")
+        return pdf_path
+
+    def _master_name(self, kind, entity_id):
+        if self.resolver is not None:
+            return self.resolver.name(kind, entity_id)
+        return str(entity_id) if entity_id else '-'
+
+    def _build_slip_story(self, transaction: WeighingTransaction):
+        """Flowables for one slip: letterhead, details table, signature and footer."""
+        if not isinstance(transaction, WeighingTransaction):
+            raise TypeError("Expected a WeighingTransaction object.")
+
         story = []
         story.extend(self._get_header_elements())
 
@@ -124,10 +179,10 @@ class WeighbridgeSlipGenerator:
              Paragraph("Time:", self.styles['FieldLabel']), Paragraph(datetime.datetime.now().strftime('%H:%M:%S'), self.styles['FieldValue'])],
 
             # Removed Status and Operator fields from here
-            [Paragraph("Vehicle Type:", self.styles['FieldLabel']), Paragraph(str(transaction.vehicle_type_id) if transaction.vehicle_type_id else '-', self.styles['FieldValue']),
-             Paragraph("Customer Name:", self.styles['FieldLabel']), Paragraph(str(transaction.customer_id) if transaction.customer_id else '-', self.styles['FieldValue'])],
+            [Paragraph("Vehicle Type:", self.styles['FieldLabel']), Paragraph(self._master_name("vehicle_type", transaction.vehicle_type_id), self.styles['FieldValue']),
+             Paragraph("Customer Name:", self.styles['FieldLabel']), Paragraph(self._master_name("customer", transaction.customer_id), self.styles['FieldValue'])],
             
-            [Paragraph("Material Type:", self.styles['FieldLabel']), Paragraph(str(transaction.material_type_id) if transaction.material_type_id else '-', self.styles['FieldValue']),
+            [Paragraph("Material Type:", self.styles['FieldLabel']), Paragraph(self._master_name("material", transaction.material_type_id), self.styles['FieldValue']),
              Paragraph("Remarks:", self.styles['FieldLabel']), Paragraph(str(transaction.remarks) if transaction.remarks else '-', self.styles['FieldValue'])]
         ]
 
@@ -181,14 +236,7 @@ class WeighbridgeSlipGenerator:
         # Footer
         story.append(Paragraph("Thank you for your business!", self.styles['FooterText']))
         story.append(Paragraph(f"Generated on {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", self.styles['FooterText']))
-
-        try:
-            doc.build(story)
-            print(f"PDF slip generated at: {pdf_path}")
-            return pdf_path
-        except Exception as e:
-            print(f"Error generating PDF: {e}")
-            raise
+        return story
 
 # Example Usage (for testing purposes, not part of the main app flow)
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
 import customtkinter as ctk
 import pandas as pd
 from viewmodels.report_viewmodel import ReportViewModel
+from utils.report_export import format_timestamp_column
 from repositories.vehicle_repository import VehicleRepository
 from tkinter import filedialog, messagebox
 #from reportlab.platypus import SimpleDocTemplate, Table, TableStyle
@@ -36,6 +37,8 @@ def export_to_pdf(file_path, df):
     ]
 
     df = pd.DataFrame(df, columns=full_columns)
+    for col in ["FirstWeightTimestamp", "SecondWeightTimestamp", "CreatedAt", "LastUpdatedAt"]:
+        df[col] = format_timestamp_column(df[col])
 
     # Split columns into chunks of 6 or 7 for better horizontal fitting
     column_chunks = [full_columns[i:i + 6] for i in range(0, len(full_columns), 6)]
@@ -1,19 +1,32 @@
 import sqlite3
 import datetime
+import time
 import uuid # Import uuid for TransactionGuid
+from contextlib import contextmanager
 
 from Model.WeighingTransactionModel import WeighingTransaction
 from resource_utils import resource_path
+from utils.db_initializer import load_schema
 
 
 
 class WeighingTransactionRepository:
-    def __init__(self, db_path="weighbridge.db"):
-        
+    def __init__(self, db_path="weighbridge.db", group_commit_interval=0.0):
+        """
+        group_commit_interval: seconds to hold back commits so that a burst of
+        writes shares one fsync. 0 (the default) commits every write immediately.
+        Callers that enable it must call flush() when they go idle (DbExecutor
+        does this automatically).
+        """
         actual_path = resource_path(db_path)
+        self.db_path = actual_path
         self.conn = sqlite3.connect(actual_path)
         # Enable row_factory to access columns by name
         self.conn.row_factory = sqlite3.Row
+        self.group_commit_interval = group_commit_interval
+        self._last_commit = time.monotonic()
+        self._pending_writes = 0
+        self._batch_depth = 0
         self._create_table()
 
     def _create_table(self):
@@ -43,63 +56,53 @@ class WeighingTransactionRepository:
                 -- FOREIGN KEY (OperatorId) REFERENCES Users(Id) -- Re-add if Users table exists and has an Id column
             )
         """)
+        self._create_indexes()
         self.conn.commit()
         print("[DEBUG] WeighingTransactionRepository: WeighingTransactions table ensured/created with new schema.")
 
+    def _create_indexes(self):
+        """Creates the secondary indexes the report, snapshot and print queries rely on."""
+        self.conn.executescript(load_schema("create_weighing_transactions_indexes.sql"))
+
+    # Explicit column list in WeighingTransaction.DB_COLUMNS order. SELECT * can't be
+    # used with index-based mapping: older databases have Charges in a different position.
+    _SELECT_COLUMNS = ", ".join(WeighingTransaction.DB_COLUMNS)
+
     def _row_to_model(self, row):
         """Converts a database row to a WeighingTransaction model object."""
         if row is None:
             return None
-        
-        # Helper to parse datetime strings from DB
-        def parse_db_datetime(dt_str):
-            # Handle cases where datetime string might be empty or invalid
-            if dt_str:
-                try:
-                    return datetime.datetime.fromisoformat(dt_str)
-                except ValueError:
-                    return None # Or raise an error, depending on desired strictness
-            return None
+        return WeighingTransaction.from_row(row)
 
-        return WeighingTransaction(
-            id=row["Id"],
-            transaction_guid=row["TransactionGuid"],
-            vehicle_number=row["VehicleNumber"],
-            vehicle_type_id=row["VehicleTypeId"],
-            material_type_id=row["MaterialTypeId"],
-            customer_id=row["CustomerId"],
-            first_weight=row["FirstWeight"],
-            first_weight_timestamp=parse_db_datetime(row["FirstWeightTimestamp"]),
-            second_weight=row["SecondWeight"],
-            second_weight_timestamp=parse_db_datetime(row["SecondWeightTimestamp"]),
-            net_weight=row["NetWeight"],
-            status=row["Status"],
-            operator_id=row["OperatorId"],
-            remarks=row["Remarks"],
-            charges=row["Charges"], # Include charges
-            created_at=parse_db_datetime(row["CreatedAt"]),
-            last_updated_at=parse_db_datetime(row["LastUpdatedAt"])
-        )
+    def _select(self, where_and_order="", params=()):
+        """Runs a SELECT over the model columns with plain-tuple rows (cheaper than sqlite3.Row)."""
+        cursor = self.conn.cursor()
+        cursor.row_factory = None
+        cursor.execute(f"SELECT {self._SELECT_COLUMNS} FROM WeighingTransactions {where_and_order}", params)
+        return cursor
 
-    def add(self, transaction: WeighingTransaction): # Renamed from add_transaction
-        """Adds a new weighing transaction to the database."""
-        if not isinstance(transaction, WeighingTransaction):
-            raise TypeError("Expected a WeighingTransaction object.")
+    _INSERT_SQL = """
+        INSERT INTO WeighingTransactions (
+            TransactionGuid, VehicleNumber, VehicleTypeId, MaterialTypeId, CustomerId,
+            FirstWeight, FirstWeightTimestamp, SecondWeight, SecondWeightTimestamp,
+            NetWeight, Status, OperatorId, Remarks, Charges, CreatedAt, LastUpdatedAt
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
 
-        cursor = self.conn.cursor()
-        current_time = datetime.datetime.now().isoformat()
-        
+    _UPDATE_SQL = """
+        UPDATE WeighingTransactions SET
+            VehicleNumber = ?, VehicleTypeId = ?, MaterialTypeId = ?, CustomerId = ?,
+            FirstWeight = ?, FirstWeightTimestamp = ?, SecondWeight = ?, SecondWeightTimestamp = ?,
+            NetWeight = ?, Status = ?, OperatorId = ?, Remarks = ?, Charges = ?, LastUpdatedAt = ?
+        WHERE Id = ?
+    """
+
+    @staticmethod
+    def _insert_params(transaction, current_time):
         # Ensure TransactionGuid is set
         if not transaction.transaction_guid:
             transaction.transaction_guid = str(uuid.uuid4())
-
-        cursor.execute("""
-            INSERT INTO WeighingTransactions (
-                TransactionGuid, VehicleNumber, VehicleTypeId, MaterialTypeId, CustomerId,
-                FirstWeight, FirstWeightTimestamp, SecondWeight, SecondWeightTimestamp,
-                NetWeight, Status, OperatorId, Remarks, Charges, CreatedAt, LastUpdatedAt
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        return (
             transaction.transaction_guid,
             transaction.vehicle_number,
             transaction.vehicle_type_id,
@@ -116,27 +119,11 @@ class WeighingTransactionRepository:
             transaction.charges, # Include charges
             current_time,
             current_time
-        ))
-        self.conn.commit()
-        transaction.id = cursor.lastrowid
-        transaction.created_at = datetime.datetime.fromisoformat(current_time)
-        transaction.last_updated_at = datetime.datetime.fromisoformat(current_time)
-        print(f"[DEBUG] WeighingTransactionRepository: Added new transaction with ID: {transaction.id}, GUID: {transaction.transaction_guid}")
-        return transaction
-
-    def update(self, transaction: WeighingTransaction): # Renamed from update_transaction
-        """Updates an existing weighing transaction in the database."""
-        if not isinstance(transaction, WeighingTransaction) or transaction.id is None:
-            raise ValueError("Invalid WeighingTransaction object for update.")
+        )
 
-        current_time = datetime.datetime.now().isoformat()
-        self.conn.execute("""
-            UPDATE WeighingTransactions SET
-                VehicleNumber = ?, VehicleTypeId = ?, MaterialTypeId = ?, CustomerId = ?,
-                FirstWeight = ?, FirstWeightTimestamp = ?, SecondWeight = ?, SecondWeightTimestamp = ?,
-                NetWeight = ?, Status = ?, OperatorId = ?, Remarks = ?, Charges = ?, LastUpdatedAt = ?
-            WHERE Id = ?
-        """, (
+    @staticmethod
+    def _update_params(transaction, current_time):
+        return (
             transaction.vehicle_number,
             transaction.vehicle_type_id,
             transaction.material_type_id,
@@ -152,35 +139,141 @@ class WeighingTransactionRepository:
             transaction.charges, # Include charges
             current_time,
             transaction.id
-        ))
-        self.conn.commit()
+        )
+
+    # --- Commit handling ---
+    def _commit(self):
+        """
+        Commits the current write, unless it can be deferred:
+        inside unit_of_work() the commit happens when the block exits, and with a
+        group_commit_interval writes are grouped until the interval has elapsed.
+        """
+        if self._batch_depth:
+            return
+        if self.group_commit_interval > 0:
+            self._pending_writes += 1
+            if time.monotonic() - self._last_commit < self.group_commit_interval:
+                return
+        self.flush()
+
+    def flush(self):
+        """Commits any writes held back by group commit."""
+        if self.conn.in_transaction:
+            self.conn.commit()
+        self._pending_writes = 0
+        self._last_commit = time.monotonic()
+
+    @property
+    def has_pending_writes(self):
+        return self._pending_writes > 0
+
+    @contextmanager
+    def unit_of_work(self):
+        """
+        Runs every write inside the block as one SQLite transaction, paying a single
+        fsync. Commits when the block exits normally and rolls back if it raises.
+        """
+        if self._batch_depth == 0:
+            self.flush() # Don't let a rollback take earlier group-committed writes with it
+        self._batch_depth += 1
+        completed = False
+        try:
+            yield self
+            completed = True
+        finally:
+            # finally, not except Exception: KeyboardInterrupt/SystemExit must not leave the depth raised
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                if completed:
+                    self.flush()
+                else:
+                    self.conn.rollback()
+
+    def add(self, transaction: WeighingTransaction): # Renamed from add_transaction
+        """Adds a new weighing transaction to the database."""
+        if not isinstance(transaction, WeighingTransaction):
+            raise TypeError("Expected a WeighingTransaction object.")
+
+        cursor = self.conn.cursor()
+        current_time = datetime.datetime.now().isoformat()
+        cursor.execute(self._INSERT_SQL, self._insert_params(transaction, current_time))
+        self._commit()
+        transaction.id = cursor.lastrowid
+        transaction.created_at = datetime.datetime.fromisoformat(current_time)
+        transaction.last_updated_at = datetime.datetime.fromisoformat(current_time)
+        print(f"[DEBUG] WeighingTransactionRepository: Added new transaction with ID: {transaction.id}, GUID: {transaction.transaction_guid}")
+        return transaction
+
+    def add_many(self, transactions):
+        """Inserts many transactions inside a single transaction (one commit, one fsync)."""
+        transactions = list(transactions)
+        if not transactions:
+            return transactions
+        if not all(isinstance(t, WeighingTransaction) for t in transactions):
+            raise TypeError("Expected WeighingTransaction objects.")
+
+        current_time = datetime.datetime.now().isoformat()
+        cursor = self.conn.cursor()
+        ids = []
+        with self.unit_of_work():
+            # One insert per row so each id comes from its own lastrowid; ids need not be contiguous
+            for transaction in transactions:
+                cursor.execute(self._INSERT_SQL, self._insert_params(transaction, current_time))
+                ids.append(cursor.lastrowid)
+
+        stamp = datetime.datetime.fromisoformat(current_time)
+        for transaction, transaction_id in zip(transactions, ids):
+            transaction.id = transaction_id
+            transaction.created_at = stamp
+            transaction.last_updated_at = stamp
+        print(f"[DEBUG] WeighingTransactionRepository: Added {len(transactions)} transactions")
+        return transactions
+
+    def update(self, transaction: WeighingTransaction): # Renamed from update_transaction
+        """Updates an existing weighing transaction in the database."""
+        if not isinstance(transaction, WeighingTransaction) or transaction.id is None:
+            raise ValueError("Invalid WeighingTransaction object for update.")
+
+        current_time = datetime.datetime.now().isoformat()
+        self.conn.execute(self._UPDATE_SQL, self._update_params(transaction, current_time))
+        self._commit()
         transaction.last_updated_at = datetime.datetime.fromisoformat(current_time)
         print(f"[DEBUG] WeighingTransactionRepository: Updated transaction with ID: {transaction.id}")
 
+    def update_many(self, transactions):
+        """Updates many transactions with one executemany inside a single transaction."""
+        transactions = list(transactions)
+        if any(not isinstance(t, WeighingTransaction) or t.id is None for t in transactions):
+            raise ValueError("Invalid WeighingTransaction object for update.")
+        if not transactions:
+            return
+
+        current_time = datetime.datetime.now().isoformat()
+        with self.unit_of_work():
+            self.conn.executemany(self._UPDATE_SQL, [self._update_params(t, current_time) for t in transactions])
+
+        stamp = datetime.datetime.fromisoformat(current_time)
+        for transaction in transactions:
+            transaction.last_updated_at = stamp
+        print(f"[DEBUG] WeighingTransactionRepository: Updated {len(transactions)} transactions")
+
     def get_by_id(self, transaction_id): # Renamed from get_transaction_by_id
         """Retrieves a single transaction by its ID."""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM WeighingTransactions WHERE Id = ?", (transaction_id,))
-        row = cursor.fetchone()
+        row = self._select("WHERE Id = ?", (transaction_id,)).fetchone()
         return self._row_to_model(row)
 
     def get_all(self): # Renamed from get_all_weighing_transactions
         """Retrieves all weighing transactions."""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM WeighingTransactions ORDER BY CreatedAt DESC")
-        rows = cursor.fetchall()
-        return [self._row_to_model(row) for row in rows]
+        from_row = WeighingTransaction.from_row
+        return [from_row(row) for row in self._select("ORDER BY CreatedAt DESC")]
 
     def get_last_transaction_by_vehicle_number(self, vehicle_number):
         """Retrieves the very last transaction (any status) for a given vehicle number."""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT * FROM WeighingTransactions
+        row = self._select("""
             WHERE VehicleNumber = ?
             ORDER BY CreatedAt DESC
             LIMIT 1
-        """, (vehicle_number,))
-        row = cursor.fetchone()
+        """, (vehicle_number,)).fetchone()
         return self._row_to_model(row)
 
     # Removed the get_pending_transaction_by_vehicle method as it's no longer
@@ -189,25 +282,23 @@ class WeighingTransactionRepository:
 
     def get_all_pending_by_vehicle_number(self, vehicle_number): # Added this method
         """Retrieves all pending transactions for a given vehicle number."""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT * FROM WeighingTransactions
+        rows = self._select("""
             WHERE VehicleNumber = ? AND Status = 'Pending'
             ORDER BY CreatedAt DESC
         """, (vehicle_number,))
-        rows = cursor.fetchall()
         return [self._row_to_model(row) for row in rows]
 
+    def count_pending(self):
+        """Number of pending transactions, i.e. trucks currently inside the yard."""
+        return self.conn.execute("SELECT COUNT(*) FROM WeighingTransactions WHERE Status = 'Pending'").fetchone()[0]
+
     def get_latest_completed_transaction(self, vehicle_number):
         """Retrieves the latest completed transaction for a given vehicle number."""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT * FROM WeighingTransactions
+        row = self._select("""
             WHERE VehicleNumber = ? AND Status = 'Completed'
-            ORDER BY CreatedAt DESC
+            ORDER BY LastUpdatedAt DESC
             LIMIT 1
-        """, (vehicle_number,))
-        row = cursor.fetchone()
+        """, (vehicle_number,)).fetchone()
         return self._row_to_model(row)
 
     def get_max_transaction_id(self):
@@ -220,18 +311,16 @@ class WeighingTransactionRepository:
     def delete_transaction(self, transaction_id): # Renamed from delete
         """Deletes a transaction by ID."""
         self.conn.execute("DELETE FROM WeighingTransactions WHERE Id = ?", (transaction_id,))
-        self.conn.commit()
+        self._commit()
         print(f"[DEBUG] WeighingTransactionRepository: Deleted transaction with ID: {transaction_id}")
 
     def delete_by_guid(self, transaction_guid): # Added this method
         """Deletes a transaction by its GUID."""
         self.conn.execute("DELETE FROM WeighingTransactions WHERE TransactionGuid = ?", (transaction_guid,))
-        self.conn.commit()
+        self._commit()
         print(f"[DEBUG] WeighingTransactionRepository: Deleted transaction with GUID: {transaction_guid}")
     
     def get_by_guid(self, transaction_guid):
         """Fetch a transaction by its GUID."""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM WeighingTransactions WHERE TransactionGuid = ?", (transaction_guid,))
-        row = cursor.fetchone()
+        row = self._select("WHERE TransactionGuid = ?", (transaction_guid,)).fetchone()
         return self._row_to_model(row) if row else None
\ No newline at end of file
@@ -1,6 +1,7 @@
 import sqlite3
 from Model.customer_model import Customer
 from resource_utils import resource_path
+from repositories.master_data_resolver import master_data_changed
 
 
 class CustomerRepository:
@@ -39,6 +40,7 @@ class CustomerRepository:
                 VALUES (?, ?, ?, ?, ?, ?, ?)
             """, (name, address, city, pincode, contact_number, email, gst_id))
             conn.commit()
+            master_data_changed()
             return cur.lastrowid
 
     def update(self, customer_id, name, address=None, city=None, pincode=None,
@@ -50,11 +52,13 @@ class CustomerRepository:
                 WHERE Id = ?
             """, (name, address, city, pincode, contact_number, email, gst_id, customer_id))
             conn.commit()
+            master_data_changed()
 
     def delete(self, customer_id):
         with self._connect() as conn:
             conn.execute("DELETE FROM Customers WHERE Id = ?", (customer_id,))
             conn.commit()
+            master_data_changed()
 
     def get_all(self):
         with self._connect() as conn:
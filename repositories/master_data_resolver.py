@@ -0,0 +1,110 @@
+import sqlite3
+import threading
+from resource_utils import resource_path
+
+# Bumped by the master repositories on every add/update/delete; resolvers
+# compare it with the generation they loaded and reload lazily.
+_generation = 0
+_generation_lock = threading.Lock()
+
+
+def master_data_changed():
+    global _generation
+    with _generation_lock:
+        _generation += 1
+
+
+class MasterDataResolver:
+    """
+    In-memory id -> name maps for vehicle types, materials and customers.
+
+    All three tables are read in one go (a few hundred rows at most) and then
+    every lookup is a dict hit, so a slip or a batch of thousands of slips
+    costs no extra queries. Edits made through the master repositories bump a
+    process-wide generation and the next lookup reloads. An id that is not in
+    the maps (added by another process) triggers at most one reload per
+    generation, after which the raw id is returned.
+
+    Resolvers pickle with their maps, so a process pool receives a ready
+    snapshot instead of opening the database in every worker.
+
+    Use get_resolver() so the slips, receipts and reports share one cache. A
+    reload swaps the maps in a single assignment, so lookups from the UI and
+    the print spooler threads need no lock.
+    """
+    TABLES = {
+        "vehicle_type": "SELECT Id, Name FROM VehicleTypes",
+        "material": "SELECT id, name FROM MaterialTypes",
+        "customer": "SELECT Id, Name FROM Customers",
+    }
+
+    def __init__(self, db_path="weighbridge.db", preload=True):
+        self.db_path = resource_path(db_path)
+        self._maps = {kind: {} for kind in self.TABLES}
+        self._loaded_generation = None
+        self._miss_reloaded = False
+        self.loads = 0
+        if preload:
+            self.refresh()
+
+    def refresh(self):
+        generation = _generation
+        conn = sqlite3.connect(self.db_path)
+        try:
+            self._maps = {kind: dict(conn.execute(sql).fetchall()) for kind, sql in self.TABLES.items()}
+        finally:
+            conn.close()
+        self._loaded_generation = generation
+        self._miss_reloaded = False
+        self.loads += 1
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_loaded_generation"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # The maps are current as of pickling; the receiving process has its own counter
+        self._loaded_generation = _generation
+        self._miss_reloaded = True
+
+    def name(self, kind, entity_id, default="-"):
+        if entity_id is None or entity_id == "":
+            return default
+        if self._loaded_generation != _generation:
+            self.refresh()
+        names = self._maps[kind]
+        if entity_id not in names and not self._miss_reloaded:
+            self.refresh()
+            self._miss_reloaded = True
+            names = self._maps[kind]
+        return names.get(entity_id, str(entity_id))
+
+    def vehicle_type_name(self, vehicle_type_id, default="-"):
+        return self.name("vehicle_type", vehicle_type_id, default)
+
+    def material_name(self, material_type_id, default="-"):
+        return self.name("material", material_type_id, default)
+
+    def customer_name(self, customer_id, default="-"):
+        return self.name("customer", customer_id, default)
+
+    def customers(self):
+        """{Id: Name} for every customer."""
+        if self._loaded_generation != _generation:
+            self.refresh()
+        return dict(self._maps["customer"])
+
+
+_resolvers = {}
+_resolvers_lock = threading.Lock()
+
+
+def get_resolver(db_path="weighbridge.db") -> MasterDataResolver:
+    """The process-wide resolver for a database (created on first use, loaded on the first lookup)."""
+    key = resource_path(db_path)
+    with _resolvers_lock:
+        if key not in _resolvers:
+            _resolvers[key] = MasterDataResolver(db_path, preload=False)
+        return _resolvers[key]
@@ -1,6 +1,7 @@
 import sqlite3
 from Model.material_type_model import MaterialType
 from resource_utils import resource_path
+from repositories.master_data_resolver import master_data_changed
 
 
 class MaterialRepository:
@@ -34,6 +35,7 @@ class MaterialRepository:
                 (name, charges, unit)
             )
             conn.commit()
+            master_data_changed()
             return cur.lastrowid
 
     def update(self, material_id, name, charges=None, unit=None):
@@ -43,11 +45,13 @@ class MaterialRepository:
                 (name, charges, unit, material_id)
             )
             conn.commit()
+            master_data_changed()
 
     def delete(self, material_id):
         with self._connect() as conn:
             conn.execute("DELETE FROM MaterialTypes WHERE id = ?", (material_id,))
             conn.commit()
+            master_data_changed()
 
     def get_all(self):
         with self._connect() as conn:
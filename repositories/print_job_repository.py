@@ -0,0 +1,106 @@
+import sqlite3
+import datetime
+from resource_utils import resource_path
+from utils.db_initializer import load_schema
+
+
+class PrintJobRepository:
+    """
+    Persistent print queue. Jobs survive a crash or restart: anything left in
+    'Printing' is put back in the queue by requeue_interrupted().
+    """
+    def __init__(self, db_path="weighbridge.db"):
+        self.db_path = resource_path(db_path)
+        self._create_table()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _create_table(self):
+        with self._connect() as conn:
+            conn.executescript(load_schema("create_print_jobs.sql"))
+
+    @staticmethod
+    def _now():
+        return datetime.datetime.now().isoformat()
+
+    def enqueue(self, transaction_id, backend=None):
+        now = self._now()
+        with self._connect() as conn:
+            cur = conn.execute("""
+                INSERT INTO PrintJobs (TransactionId, Backend, Status, NextAttemptAt, CreatedAt, UpdatedAt)
+                VALUES (?, ?, 'Queued', ?, ?, ?)
+            """, (transaction_id, backend, now, now, now))
+            return cur.lastrowid
+
+    def get(self, job_id):
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM PrintJobs WHERE Id = ?", (job_id,)).fetchone()
+            return dict(row) if row else None
+
+    def claim_next(self):
+        """
+        Marks the oldest due job as 'Printing' (counting the attempt) and returns it, or None.
+        The claim only succeeds while the job is still Queued/Retry, so when two
+        spoolers pick the same job the loser sees no row updated and tries the next one.
+        """
+        with self._connect() as conn:
+            while True:
+                now = self._now()
+                row = conn.execute("""
+                    SELECT Id FROM PrintJobs
+                    WHERE Status IN ('Queued', 'Retry') AND NextAttemptAt <= ?
+                    ORDER BY NextAttemptAt, Id
+                    LIMIT 1
+                """, (now,)).fetchone()
+                if row is None:
+                    return None
+                claimed = conn.execute("""
+                    UPDATE PrintJobs SET Status = 'Printing', Attempts = Attempts + 1, UpdatedAt = ?
+                    WHERE Id = ? AND Status IN ('Queued', 'Retry')
+                """, (now, row["Id"])).rowcount
+                if claimed:
+                    return dict(conn.execute("SELECT * FROM PrintJobs WHERE Id = ?", (row["Id"],)).fetchone())
+
+    def mark_done(self, job_id):
+        self._set_status(job_id, "Done", None)
+
+    def mark_failed(self, job_id, error):
+        self._set_status(job_id, "Failed", error)
+
+    def schedule_retry(self, job_id, error, delay_seconds):
+        next_attempt = (datetime.datetime.now() + datetime.timedelta(seconds=delay_seconds)).isoformat()
+        with self._connect() as conn:
+            conn.execute("""
+                UPDATE PrintJobs SET Status = 'Retry', LastError = ?, NextAttemptAt = ?, UpdatedAt = ?
+                WHERE Id = ?
+            """, (error, next_attempt, self._now(), job_id))
+
+    def requeue(self, job_id):
+        """Puts a failed job back in the queue with a fresh attempt count."""
+        now = self._now()
+        with self._connect() as conn:
+            conn.execute("""
+                UPDATE PrintJobs SET Status = 'Queued', Attempts = 0, NextAttemptAt = ?, UpdatedAt = ?
+                WHERE Id = ?
+            """, (now, now, job_id))
+
+    def requeue_interrupted(self):
+        """Jobs that were printing when the application stopped go back to the queue."""
+        with self._connect() as conn:
+            return conn.execute("""
+                UPDATE PrintJobs SET Status = 'Queued', UpdatedAt = ? WHERE Status = 'Printing'
+            """, (self._now(),)).rowcount
+
+    def count_active(self):
+        with self._connect() as conn:
+            return conn.execute("""
+                SELECT COUNT(*) FROM PrintJobs WHERE Status IN ('Queued', 'Printing', 'Retry')
+            """).fetchone()[0]
+
+    def _set_status(self, job_id, status, error):
+        with self._connect() as conn:
+            conn.execute("UPDATE PrintJobs SET Status = ?, LastError = ?, UpdatedAt = ? WHERE Id = ?",
+                         (status, error, self._now(), job_id))
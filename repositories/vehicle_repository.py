@@ -1,6 +1,7 @@
 import sqlite3
 from Model.vehicle_type_model import VehicleType
 from resource_utils import resource_path
+from repositories.master_data_resolver import master_data_changed
 
 
 class VehicleRepository:
@@ -62,6 +63,7 @@ class VehicleRepository:
                 VALUES (?, ?, ?)
             """, (name, tare, capacity)) # Updated column names in INSERT statement
             conn.commit()
+            master_data_changed()
 
     def update(self, vehicle_id, name, tare, capacity):
         with self._connect() as conn:
@@ -72,9 +74,11 @@ class VehicleRepository:
                 WHERE Id = ?
             """, (name, tare, capacity, vehicle_id)) # Updated column names in UPDATE statement
             conn.commit()
+            master_data_changed()
 
     def delete(self, vehicle_id):
         with self._connect() as conn:
             cur = conn.cursor()
             cur.execute("DELETE FROM VehicleTypes WHERE Id = ?", (vehicle_id,))
-            conn.commit()
\ No newline at end of file
+            conn.commit()
+            master_data_changed()
\ No newline at end of file
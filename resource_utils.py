@@ -7,6 +7,34 @@ import shutil # Needed for copying files
 _DB_FILENAME = "weighbridge.db"
 _APP_NAME = "WeighderApp" # <<< CUSTOMIZE THIS TO YOUR APP'S NAME (e.g., "MyWeighbridge")
 
+def _get_app_data_dir(app_name: str) -> str:
+    """Determines the user-writable application data directory and creates it if needed."""
+    if sys.platform.startswith('win'):
+        # Windows: %APPDATA% (e.g., C:\Users\<User>\AppData\Roaming)
+        base_dir = os.getenv('APPDATA')
+        if not base_dir: # Fallback if APPDATA env var is not set
+            base_dir = os.path.join(os.path.expanduser("~"), "AppData", "Roaming")
+    elif sys.platform.startswith('darwin'):
+        # macOS: ~/Library/Application Support/
+        base_dir = os.path.join(os.path.expanduser("~"), "Library", "Application Support")
+    else:
+        # Linux/Unix: ~/.local/share/ for data files
+        base_dir = os.path.join(os.path.expanduser("~"), ".local", "share")
+
+    app_data_dir = os.path.join(base_dir, app_name)
+    os.makedirs(app_data_dir, exist_ok=True) # Ensure the application's directory exists
+    return app_data_dir
+
+def writable_path(relative_path):
+    """
+    Resolves the absolute path for files and folders the application writes
+    at runtime (receipt store, print drop folder). They live next to the
+    database in the user-writable application data directory, never under
+    the bundle folder, which is a temporary directory in a PyInstaller build.
+    Absolute paths are returned unchanged.
+    """
+    return os.path.join(_get_app_data_dir(_APP_NAME), relative_path)
+
 def resource_path(relative_path):
     """
     Resolves the absolute path for resources.
@@ -25,25 +53,11 @@ def resource_path(relative_path):
     Returns:
         The absolute path to the resource, which will be writable for the database.
     """
-    # --- Helper function to get writable AppData path (inlined for self-containment) ---
+    # --- Helper function to get writable AppData path ---
     def _get_writable_path_for_db_helper(db_filename_local: str, app_name_local: str) -> str:
         """Determines a user-writable directory for the database file."""
-        if sys.platform.startswith('win'):
-            # Windows: %APPDATA% (e.g., C:\Users\<User>\AppData\Roaming)
-            base_dir_local = os.getenv('APPDATA')
-            if not base_dir_local: # Fallback if APPDATA env var is not set
-                base_dir_local = os.path.join(os.path.expanduser("~"), "AppData", "Roaming")
-        elif sys.platform.startswith('darwin'):
-            # macOS: ~/Library/Application Support/
-            base_dir_local = os.path.join(os.path.expanduser("~"), "Library", "Application Support")
-        else:
-            # Linux/Unix: ~/.local/share/ for data files
-            base_dir_local = os.path.join(os.path.expanduser("~"), ".local", "share")
-            
-        app_data_dir_local = os.path.join(base_dir_local, app_name_local)
-        os.makedirs(app_data_dir_local, exist_ok=True) # Ensure the application's directory exists
-        return os.path.join(app_data_dir_local, db_filename_local)
-    # --- End of inlined helper logic ---
+        return os.path.join(_get_app_data_dir(app_name_local), db_filename_local)
+    # --- End of helper logic ---
 
     # First, determine the base path for bundled resources (read-only)
     try:
@@ -0,0 +1,21 @@
+import io
+import contextlib
+
+import pytest
+
+from tests.fixtures import seed_database
+
+
+@pytest.fixture
+def seeded_db(tmp_path):
+    """A scratch weighbridge database with the master tables and 200 completed transactions."""
+    db_path = str(tmp_path / "weighbridge_test.db")
+    seed_database(db_path, 200)
+    return db_path
+
+
+@pytest.fixture
+def quiet():
+    """Swallows the [DEBUG] prints the repositories emit on construction."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
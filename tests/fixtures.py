@@ -0,0 +1,64 @@
+"""
+Scratch databases shared by the tests and the benchmarks. The benchmarks
+import seed_database() from here, so run them from the project root.
+"""
+import io
+import random
+import sqlite3
+import datetime
+import contextlib
+
+from repositories.WeighingTransactionRepository import WeighingTransactionRepository
+
+# Only the columns the reports join on; the master repositories' own tables have more
+MASTER_SCHEMA = """
+    CREATE TABLE Customers (Id INTEGER PRIMARY KEY, Name TEXT NOT NULL);
+    CREATE TABLE MaterialTypes (Id INTEGER PRIMARY KEY, name TEXT NOT NULL, charges REAL);
+    CREATE TABLE Users (Id INTEGER PRIMARY KEY, Username TEXT NOT NULL);
+    CREATE TABLE VehicleTypes (Id INTEGER PRIMARY KEY, Name TEXT NOT NULL);
+"""
+
+
+def seed_database(db_path, rows):
+    """
+    Master tables (200 customers, 6 materials, 5 operators, 4 vehicle types)
+    and `rows` completed transactions three minutes apart from 2022-01-01,
+    with random (seeded, so repeatable) vehicles, customers and remarks.
+    """
+    conn = sqlite3.connect(db_path)
+    conn.executescript(MASTER_SCHEMA)
+    conn.executemany("INSERT INTO Customers (Id, Name) VALUES (?, ?)",
+                     [(i, f"Customer Quarry {i}") for i in range(1, 201)])
+    conn.executemany("INSERT INTO MaterialTypes (Id, name) VALUES (?, ?)",
+                     [(1, "M-Sand"), (2, "P-Sand"), (3, "20mm Jelly"), (4, "40mm Jelly"), (5, "Dust"), (6, "GSB")])
+    conn.executemany("INSERT INTO Users (Id, Username) VALUES (?, ?)", [(i, f"operator{i}") for i in range(1, 6)])
+    conn.executemany("INSERT INTO VehicleTypes (Id, Name) VALUES (?, ?)",
+                     [(1, "Lorry"), (2, "Tipper"), (3, "Tractor"), (4, "Trailer")])
+    conn.commit()
+    conn.close()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        WeighingTransactionRepository(db_path=db_path).conn.close()
+
+    rng = random.Random(7)
+    start = datetime.datetime(2022, 1, 1)
+    districts = ["TN37", "TN38", "TN45", "TN66", "KL10"]
+    conn = sqlite3.connect(db_path)
+    conn.executemany(
+        "INSERT INTO WeighingTransactions (TransactionGuid, VehicleNumber, VehicleTypeId, MaterialTypeId,"
+        " CustomerId, FirstWeight, FirstWeightTimestamp, NetWeight, Status, OperatorId, Remarks, Charges,"
+        " CreatedAt, LastUpdatedAt) VALUES (?, ?, ?, ?, ?, 12000, ?, 18000, 'Completed', ?, ?, 900, ?, ?)",
+        (
+            (f"guid-{i}", f"{rng.choice(districts)}AB{rng.randrange(10000):04d}", 1 + i % 4, 1 + i % 6,
+             1 + rng.randrange(200), ts, 1 + i % 5, f"Loaded at weighbridge {rng.randrange(100)}", ts, ts)
+            for i in range(rows)
+            for ts in [(start + datetime.timedelta(minutes=3 * i)).isoformat()]
+        ),
+    )
+    conn.commit()
+    conn.close()
+
+
+def execute(db_path, sql, params=()):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(sql, params).fetchall()
@@ -0,0 +1,49 @@
+import pytest
+
+from utils.amount_words import integer_words, weight_words
+
+
+@pytest.mark.parametrize("n, words", [
+    (0, "ZERO"),
+    (19, "NINETEEN"),
+    (101, "ONE HUNDRED AND ONE"),
+    (999, "NINE HUNDRED AND NINETY-NINE"),
+    (1000, "ONE THOUSAND"),
+    (1001, "ONE THOUSAND AND ONE"),
+    (1100, "ONE THOUSAND, ONE HUNDRED"),
+    (18000, "EIGHTEEN THOUSAND"),
+    (20020, "TWENTY THOUSAND AND TWENTY"),
+    (99999, "NINETY-NINE THOUSAND, NINE HUNDRED AND NINETY-NINE"),
+    (100000, "ONE LAKH"),
+    (100001, "ONE LAKH AND ONE"),
+    (250000, "TWO LAKH, FIFTY THOUSAND"),
+    (9999999, "NINETY-NINE LAKH, NINETY-NINE THOUSAND, NINE HUNDRED AND NINETY-NINE"),
+    (10000000, "ONE CRORE"),
+    (10000001, "ONE CRORE AND ONE"),
+    (12345678, "ONE CRORE, TWENTY-THREE LAKH, FORTY-FIVE THOUSAND, SIX HUNDRED AND SEVENTY-EIGHT"),
+    (-1001, "MINUS ONE THOUSAND AND ONE"),
+])
+def test_integer_words_at_group_thresholds(n, words):
+    assert integer_words(n) == words
+
+
+def test_integer_words_matches_num2words_indian_numbering():
+    num2words = pytest.importorskip("num2words").num2words
+    for n in list(range(0, 2100)) + list(range(99900, 100200)) + [10 ** 7 - 1, 10 ** 9 + 100001, 1234567890]:
+        assert integer_words(n) == num2words(n, lang="en_IN").upper(), n
+
+
+@pytest.mark.parametrize("value, words", [
+    (18000.0, "EIGHTEEN THOUSAND"),
+    (18000.25, "EIGHTEEN THOUSAND POINT TWO FIVE"),
+    (0.1234, "ZERO POINT ONE TWO THREE"),
+    (None, "ZERO"),
+])
+def test_weight_words(value, words):
+    assert weight_words(value) == words
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf"), "abc"])
+def test_weight_words_rejects_non_finite_values(value):
+    with pytest.raises(ValueError):
+        weight_words(value)
@@ -0,0 +1,26 @@
+import os
+import sys
+
+from utils.app_config import validate
+
+
+def test_written_folders_resolve_to_app_data_and_assets_to_the_bundle(tmp_path, monkeypatch):
+    bundle = tmp_path / "_MEI1234"
+    monkeypatch.setattr(sys, "_MEIPASS", str(bundle), raising=False)
+    monkeypatch.setattr(sys, "platform", "linux")
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    app_data = os.path.join(str(tmp_path / "home"), ".local", "share", "WeighderApp")
+
+    values = validate({"print_backend": "file"})
+
+    assert values["receipt_store_folder"] == os.path.join(app_data, "receipts/store")
+    assert values["print_drop_folder"] == os.path.join(app_data, "print_drop")
+    assert values["receipt_template"] == os.path.join(str(bundle), "receipt_template.json")
+    assert values["sumatra_path"] == os.path.join(str(bundle), "SumatraPDFcopy/SumatraPDF.exe")
+
+
+def test_absolute_folders_are_kept(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    values = validate({"receipt_store_folder": str(tmp_path / "store")})
+
+    assert values["receipt_store_folder"] == str(tmp_path / "store")
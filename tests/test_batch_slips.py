@@ -0,0 +1,46 @@
+import os
+import re
+
+import pytest
+
+pytest.importorskip("reportlab")
+
+from utils.batch_slips import BatchSlipGenerator
+from tests.fixtures import execute
+
+
+def _pages(path):
+    with open(path, "rb") as f:
+        return len(re.findall(rb"/Type /Page\b", f.read()))
+
+
+@pytest.fixture
+def three_customers(seeded_db):
+    """Spreads the seeded rows over customers 1-3; 1 and 2 share a name."""
+    execute(seeded_db, "UPDATE WeighingTransactions SET CustomerId = 1 + Id % 3")
+    execute(seeded_db, "UPDATE Customers SET Name = 'Sri Murugan Blue Metals' WHERE Id IN (1, 2)")
+    return seeded_db
+
+
+def test_single_pack_has_one_page_per_slip(three_customers, tmp_path, quiet):
+    generator = BatchSlipGenerator(three_customers, output_dir=str(tmp_path / "out"))
+
+    summary = generator.generate("2022-01-01", "2022-01-01")
+
+    assert summary["slips"] == 200
+    assert len(summary["files"]) == 1
+    assert _pages(summary["files"][0]) == 200
+
+
+def test_per_customer_packs_are_separate_files_per_customer_id(three_customers, tmp_path, quiet):
+    generator = BatchSlipGenerator(three_customers, output_dir=str(tmp_path / "out"), workers=2)
+    per_customer = dict(execute(three_customers, "SELECT CustomerId, COUNT(*) FROM WeighingTransactions"
+                                                 " GROUP BY CustomerId"))
+
+    summary = generator.generate("2022-01-01", "2022-01-01", per_customer=True)
+
+    assert summary["slips"] == 200
+    assert len(summary["files"]) == 3
+    for customer_id, slips in per_customer.items():
+        [path] = [p for p in summary["files"] if os.path.basename(p).startswith(f"slips_{customer_id}_")]
+        assert _pages(path) == slips
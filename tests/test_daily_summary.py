@@ -0,0 +1,34 @@
+from Model.report_model import ReportRepository
+from tests.fixtures import execute
+
+_SUMMARY = ("SELECT SummaryDate, MaterialTypeId, CustomerId, VehicleTypeId, TransactionCount,"
+            " ROUND(TotalNetWeight, 3), ROUND(TotalCharges, 3) FROM DailySummary ORDER BY 1, 2, 3, 4")
+
+
+def test_triggers_keep_daily_summary_equal_to_a_rebuild(seeded_db, quiet):
+    repo = ReportRepository(db_path=seeded_db)
+
+    execute(seeded_db, "INSERT INTO WeighingTransactions (TransactionGuid, VehicleNumber, CustomerId, MaterialTypeId,"
+                       " VehicleTypeId, FirstWeightTimestamp, NetWeight, Charges, Status)"
+                       " VALUES ('guid-a', 'TN37AB0001', 3, 2, 1, '2022-01-01T08:00:00', 4200.5, 120, 'Completed')")
+    execute(seeded_db, "INSERT INTO WeighingTransactions (TransactionGuid, VehicleNumber, Status)"
+                       " VALUES ('guid-b', 'TN37AB0002', 'Pending')") # No keys yet: lands in the '' / 0 group
+    execute(seeded_db, "UPDATE WeighingTransactions SET CustomerId = 7, NetWeight = 9000 WHERE Id = 3")
+    execute(seeded_db, "UPDATE WeighingTransactions SET FirstWeightTimestamp = '2022-02-01T10:00:00' WHERE Id = 4")
+    execute(seeded_db, "UPDATE WeighingTransactions SET Charges = NULL WHERE Id = 5")
+    execute(seeded_db, "DELETE FROM WeighingTransactions WHERE Id IN (1, 2, 150)")
+    maintained = execute(seeded_db, _SUMMARY)
+
+    repo.rebuild_daily_summary()
+    assert maintained == execute(seeded_db, _SUMMARY)
+
+
+def test_deleting_the_last_transaction_of_a_group_removes_the_group(seeded_db, quiet):
+    ReportRepository(db_path=seeded_db)
+    execute(seeded_db, "INSERT INTO WeighingTransactions (TransactionGuid, VehicleNumber, CustomerId, MaterialTypeId,"
+                       " VehicleTypeId, FirstWeightTimestamp, NetWeight, Charges, Status)"
+                       " VALUES ('guid-c', 'TN37AB0003', 999, 1, 1, '2031-05-05T08:00:00', 100, 10, 'Completed')")
+    assert execute(seeded_db, "SELECT COUNT(*) FROM DailySummary WHERE CustomerId = 999")[0][0] == 1
+
+    execute(seeded_db, "DELETE FROM WeighingTransactions WHERE TransactionGuid = 'guid-c'")
+    assert execute(seeded_db, "SELECT COUNT(*) FROM DailySummary WHERE CustomerId = 999")[0][0] == 0
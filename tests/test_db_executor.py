@@ -0,0 +1,126 @@
+import threading
+
+import pytest
+
+from Model.WeighingTransactionModel import WeighingTransaction
+from repositories.WeighingTransactionRepository import WeighingTransactionRepository
+from utils.db_executor import DbExecutor
+from utils.ui_dispatch import UiDispatcher
+from tests.fixtures import execute
+
+
+def _transaction(vehicle_number):
+    return WeighingTransaction(vehicle_number=vehicle_number, first_weight=12000.0, status="Pending")
+
+
+@pytest.fixture
+def executor(tmp_path, quiet):
+    """DbExecutor over a repository that holds commits for a minute, so only idle flushes commit."""
+    db_path = str(tmp_path / "executor.db")
+    events = []
+
+    def factory():
+        repo = WeighingTransactionRepository(db_path, group_commit_interval=60)
+        repo.conn.set_trace_callback(lambda sql: events.append("COMMIT") if sql == "COMMIT" else None)
+        flush = repo.flush
+
+        def traced_flush():
+            events.append("flush")
+            flush()
+        repo.flush = traced_flush
+        return repo
+
+    executor = DbExecutor(factory, idle_flush_interval=0.1)
+    executor.db_path, executor.events = db_path, events
+    yield executor
+    executor.shutdown()
+
+
+def test_group_committed_writes_land_in_one_transaction(executor):
+    futures = [executor.submit(lambda repo, n=n: repo.add(_transaction(f"TN37AB{n:04d}"))) for n in range(5)]
+
+    [future.result(timeout=5) for future in futures]
+
+    assert executor.events.count("COMMIT") == 1
+    assert execute(executor.db_path, "SELECT COUNT(*) FROM WeighingTransactions") == [(5,)]
+
+
+def test_futures_resolve_only_after_the_flush(executor):
+    gate = threading.Event()
+    executor.submit(lambda repo: gate.wait(5)) # Queue the writes behind this, so they run as one burst
+    futures = [executor.submit(lambda repo, n=n: repo.add(_transaction(f"TN37AB{n:04d}"))) for n in range(3)]
+    for future in futures:
+        future.add_done_callback(lambda _: executor.events.append("done"))
+    gate.set()
+
+    [future.result(timeout=5) for future in futures]
+
+    assert executor.events[executor.events.index("flush"):] == ["flush", "COMMIT", "done", "done", "done"]
+
+
+def test_flush_failure_is_reported_to_the_held_commands(executor):
+    def fail_flush(repo):
+        def broken():
+            raise RuntimeError("disk I/O error")
+        repo.flush = broken
+
+    executor.submit(fail_flush).result(timeout=5)
+    future = executor.submit(lambda repo: repo.add(_transaction("TN37AB0001")))
+
+    with pytest.raises(RuntimeError, match="disk I/O error"):
+        future.result(timeout=5)
+
+
+def test_an_error_rolls_back_only_its_own_unit(executor):
+    def failing_unit(repo):
+        with repo.unit_of_work():
+            repo.add(_transaction("TN37AB0002"))
+            raise ValueError("operator cancelled")
+
+    first = executor.submit(lambda repo: repo.add(_transaction("TN37AB0001"))) # Uncommitted when the unit starts
+    failed = executor.submit(failing_unit)
+    last = executor.submit(lambda repo: repo.add(_transaction("TN37AB0003")))
+
+    first.result(timeout=5)
+    last.result(timeout=5)
+    with pytest.raises(ValueError):
+        failed.result(timeout=5)
+    assert execute(executor.db_path, "SELECT VehicleNumber FROM WeighingTransactions ORDER BY Id") == [
+        ("TN37AB0001",), ("TN37AB0003",)]
+
+
+def test_a_resource_with_flush_but_no_pending_flag_is_reported_after_the_flush():
+    events = []
+
+    class _Resource:
+        def write(self):
+            events.append("write")
+
+        def flush(self):
+            events.append("flush")
+
+    executor = DbExecutor(_Resource, idle_flush_interval=0.05)
+    try:
+        future = executor.submit(lambda resource: resource.write())
+        future.add_done_callback(lambda _: events.append("done"))
+        future.result(timeout=5)
+    finally:
+        executor.shutdown()
+
+    assert events[:3] == ["write", "flush", "done"]
+
+
+def test_callbacks_run_on_the_thread_that_drains_the_dispatcher():
+    dispatcher = UiDispatcher()
+    executor = DbExecutor(lambda: None, dispatcher=dispatcher)
+    ran_on = []
+    try:
+        executor.submit(lambda resource: 42, on_success=lambda result: ran_on.append((result, threading.current_thread())))
+        executor.submit(lambda resource: 1 / 0, on_error=lambda e: ran_on.append((type(e), threading.current_thread())))
+        executor.submit(lambda resource: None).result(timeout=5)
+    finally:
+        executor.shutdown()
+
+    assert ran_on == [] # Nothing runs on the worker thread
+    dispatcher.run_pending()
+    assert ran_on == [(42, threading.current_thread()), (ZeroDivisionError, threading.current_thread())]
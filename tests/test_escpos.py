@@ -0,0 +1,69 @@
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("reportlab") # ReceiptTemplate
+
+from utils.escpos import EscPosRenderer
+from utils.print_backends import EscPosBackend
+from utils.receipt_template import ReceiptTemplate
+
+TEMPLATE = ReceiptTemplate({
+    "static": [
+        {"type": "text", "x": "center", "y": 100, "font": "Helvetica-Bold", "size": 14, "text": "AGM BLUE METALS"},
+        {"type": "line", "y": 80},
+    ],
+    "fields": [
+        {"x": "left", "y": 90, "text": "SL NO: {Id}"},
+        {"x": "right", "y": 90, "text": "VEH: {VehicleNumber}"},
+        {"x": "left", "y": 70, "text": "NET WT: {NetWeightWords} TONS"},
+    ],
+})
+TRANSACTION = {"Id": 7, "VehicleNumber": "TN37AB1234", "NetWeight": 18.5}
+
+EXPECTED = (
+    b"\x1b@"                                                    # ESC @: initialise
+    b"\x1ba\x00"                                                # ESC a 0: left
+    b"\x1ba\x01\x1bE\x01\x1d!\x11AGM BLUE METALS\x1d!\x00\x1bE\x00\n"  # centred, bold, double size
+    b"\x1ba\x00SL NO: 7         VEH: TN37AB1234\n"             # left/right pair padded to 32 columns
+    b"\x1ba\x00" + b"-" * 32 + b"\n"                            # rule
+    b"\x1ba\x00NET WT: EIGHTEEN POINT FIVE TONS\n"              # amount in words
+    b"\x1ba\x00\x1bd\x04\x1dVB\x00"                             # ESC d 4: feed, GS V 66 0: partial cut
+)
+
+
+def test_renderer_emits_the_exact_byte_stream():
+    assert EscPosRenderer(TEMPLATE, columns=32).render(TRANSACTION) == EXPECTED
+
+
+def test_backend_writes_the_rendered_receipt_to_a_file_sink(tmp_path):
+    receipt = EscPosRenderer(TEMPLATE, columns=32).render_to(str(tmp_path / "receipt.bin"), TRANSACTION)
+    sink = str(tmp_path / "printer")
+    backend = EscPosBackend(sink)
+
+    backend.print_file(receipt)
+    backend.print_file(receipt)
+
+    with open(sink, "rb") as f:
+        assert f.read() == EXPECTED * 2 # Appended, as a device would receive them
+
+
+@pytest.mark.skipif(not hasattr(os, "openpty") or sys.platform == "win32", reason="needs a pty")
+def test_backend_writes_the_same_bytes_to_a_pty(tmp_path):
+    import tty
+    import select
+
+    receipt = EscPosRenderer(TEMPLATE, columns=32).render_to(str(tmp_path / "receipt.bin"), TRANSACTION)
+    master, slave = os.openpty()
+    try:
+        tty.setraw(slave) # Like a printer port: no newline translation
+        EscPosBackend(os.ttyname(slave)).print_file(receipt)
+        received = b""
+        while len(received) < len(EXPECTED) and select.select([master], [], [], 5)[0]:
+            received += os.read(master, 4096)
+    finally:
+        os.close(slave)
+        os.close(master)
+
+    assert received == EXPECTED
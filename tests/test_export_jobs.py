@@ -0,0 +1,47 @@
+import os
+
+import pytest
+
+from utils.export_jobs import ExportCancelled, ExportJob, ExportJobRunner
+
+
+def _run(job):
+    runner = ExportJobRunner()
+    runner._run_job(job) # Same path the worker thread takes, without the thread
+    runner.dispatcher.run_pending()
+    return job
+
+
+def _writer(content, fail_with=None):
+    def run(job):
+        with open(job.temp_path, "w") as f:
+            f.write(content)
+        if fail_with:
+            raise fail_with
+        return 1
+    return run
+
+
+@pytest.mark.parametrize("error", [RuntimeError("disk full"), ExportCancelled()])
+def test_failed_or_cancelled_export_keeps_the_existing_file(tmp_path, error):
+    target = tmp_path / "report.csv"
+    target.write_text("previous export")
+
+    job = _run(ExportJob(_writer("partial", fail_with=error), output_path=str(target)))
+
+    assert job.status in ("failed", "cancelled")
+    assert target.read_text() == "previous export"
+    assert os.listdir(tmp_path) == ["report.csv"]
+
+
+def test_finished_export_replaces_the_target(tmp_path):
+    target = tmp_path / "report.csv"
+    target.write_text("previous export")
+    done = []
+
+    job = _run(ExportJob(_writer("new export"), output_path=str(target),
+                         on_done=lambda job, rows: done.append(rows)))
+
+    assert job.status == "done" and done == [1]
+    assert target.read_text() == "new export"
+    assert os.listdir(tmp_path) == ["report.csv"]
@@ -0,0 +1,54 @@
+import pytest
+
+from repositories import master_data_resolver
+from repositories.master_data_resolver import MasterDataResolver, get_resolver
+from repositories.customer_repository import CustomerRepository
+from repositories.material_repository import MaterialRepository
+from repositories.vehicle_repository import VehicleRepository
+
+
+@pytest.fixture
+def masters(tmp_path):
+    db_path = str(tmp_path / "masters.db")
+    customers, materials, vehicles = CustomerRepository(db_path), MaterialRepository(db_path), VehicleRepository(db_path)
+    ids = {
+        "customer": customers.add("Sri Murugan Blue Metals"),
+        "material": materials.add("M-Sand", charges=900),
+    }
+    vehicles.add("Tipper", 8000, 25000)
+    ids["vehicle_type"] = vehicles.get_all()[0].id
+    return db_path, {"customer": customers, "material": materials, "vehicle_type": vehicles}, ids
+
+
+def _rename(repos, kind, entity_id, name):
+    if kind == "customer":
+        repos[kind].update(entity_id, name)
+    elif kind == "material":
+        repos[kind].update(entity_id, name, charges=900)
+    else:
+        repos[kind].update(entity_id, name, 8000, 25000)
+
+
+@pytest.mark.parametrize("kind", ["customer", "material", "vehicle_type"])
+def test_rename_bumps_the_generation_and_the_next_lookup_reloads(masters, kind):
+    db_path, repos, ids = masters
+    resolver = MasterDataResolver(db_path)
+    resolver.name(kind, ids[kind])
+    generation, loads = master_data_resolver._generation, resolver.loads
+
+    _rename(repos, kind, ids[kind], "Renamed")
+
+    assert master_data_resolver._generation == generation + 1
+    assert resolver.name(kind, ids[kind]) == "Renamed"
+    assert resolver.loads == loads + 1
+    assert resolver.name(kind, ids[kind]) == "Renamed"
+    assert resolver.loads == loads + 1 # Unchanged generation: served from memory
+
+
+def test_get_resolver_shares_one_instance_per_database(masters):
+    db_path, _, ids = masters
+
+    resolver = get_resolver(db_path)
+
+    assert get_resolver(db_path) is resolver
+    assert resolver.customer_name(ids["customer"]) == "Sri Murugan Blue Metals"
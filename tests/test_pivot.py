@@ -0,0 +1,71 @@
+import pytest
+
+from Model.aggregation_model import TOTAL, column_cell, pivot
+from viewmodels.pivot_viewmodel import PivotReportViewModel
+from tests.fixtures import execute
+
+
+def test_additive_measure_totals_are_the_sum_of_the_cells():
+    rows = [
+        {"customer": "A", "material": "Sand", "total_net_weight": 100.0},
+        {"customer": "A", "material": "Dust", "total_net_weight": 50.0},
+        {"customer": "B", "material": "Sand", "total_net_weight": None},
+    ]
+    labels, table = pivot(rows, ["customer"], "material", "total_net_weight")
+
+    assert labels == ["Dust", "Sand"]
+    assert [row[TOTAL] for row in table] == [150.0, 0]
+    assert table[1][column_cell("Dust")] == 0
+
+
+def test_a_column_named_total_or_like_a_dimension_keeps_its_own_cell():
+    rows = [
+        {"material": "Sand", "customer": "Total", "count": 2},
+        {"material": "Sand", "customer": "material", "count": 3},
+    ]
+    labels, table = pivot(rows, ["material"], "customer", "count")
+
+    assert labels == ["Total", "material"]
+    assert table[0]["material"] == "Sand"
+    assert table[0][column_cell("Total")] == 2
+    assert table[0][TOTAL] == 5
+
+
+def test_average_total_comes_from_the_totals_rows_not_the_cells():
+    rows = [
+        {"customer": "A", "material": "Sand", "avg_net_weight": 100.0},
+        {"customer": "A", "material": "Dust", "avg_net_weight": 10.0},
+    ]
+    totals = [{"customer": "A", "avg_net_weight": 82.0}]
+
+    _, table = pivot(rows, ["customer"], "material", "avg_net_weight", totals=totals, fill=None)
+    assert table[0][TOTAL] == 82.0
+    _, table = pivot(rows, ["customer"], "material", "avg_net_weight", fill=None)
+    assert table[0][TOTAL] is None
+
+
+@pytest.mark.parametrize("measure", ["count", "total_net_weight", "avg_net_weight", "max_turnaround_minutes"])
+def test_view_model_totals_match_an_ungrouped_aggregate(seeded_db, measure):
+    # Give half the transactions a second weighing so the turnaround measures have values
+    execute(seeded_db, "UPDATE WeighingTransactions SET SecondWeightTimestamp ="
+                       " datetime(FirstWeightTimestamp, '+' || (Id % 40) || ' minutes') WHERE Id % 2 = 0")
+    vm = PivotReportViewModel(seeded_db)
+    vm.run(["material"], "vehicle_type", measure)
+
+    expected = {row["material"]: row[measure] for row in vm.repo.aggregate(["material"], [measure])}
+    assert vm.columns[-1] == "Total" and vm.keys[-1] == TOTAL
+    assert {row["material"]: row[TOTAL] for row in vm.table} == pytest.approx(expected)
+
+
+def test_rollup_and_transaction_totals_agree(seeded_db, quiet):
+    from Model.report_model import ReportRepository
+
+    vm = PivotReportViewModel(seeded_db)
+    vm.run(["customer"], "material", "total_charges")
+    direct = {row["customer"]: row[TOTAL] for row in vm.table}
+
+    ReportRepository(db_path=seeded_db) # Creates DailySummary; the next run reads the rollup
+    vm = PivotReportViewModel(seeded_db)
+    assert vm.repo.build_query(["customer", "material"], ["total_charges"])[2] == "DailySummary"
+    vm.run(["customer"], "material", "total_charges")
+    assert {row["customer"]: row[TOTAL] for row in vm.table} == pytest.approx(direct)
@@ -0,0 +1,45 @@
+import threading
+
+from repositories.print_job_repository import PrintJobRepository
+from tests.fixtures import execute
+
+
+def test_claim_next_hands_out_each_job_once(tmp_path):
+    db_path = str(tmp_path / "spool.db")
+    repo = PrintJobRepository(db_path)
+    job_ids = [repo.enqueue(transaction_id) for transaction_id in range(1, 61)]
+
+    claimed = []
+    lock = threading.Lock()
+    start = threading.Barrier(6)
+
+    def spooler():
+        own_repo = PrintJobRepository(db_path) # Each spooler has its own connection, as separate processes would
+        start.wait()
+        while True:
+            job = own_repo.claim_next()
+            if job is None:
+                return
+            with lock:
+                claimed.append(job["Id"])
+
+    threads = [threading.Thread(target=spooler) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(claimed) == job_ids
+    assert execute(db_path, "SELECT DISTINCT Status, Attempts FROM PrintJobs") == [("Printing", 1)]
+
+
+def test_claim_next_skips_jobs_not_yet_due_or_finished(tmp_path):
+    repo = PrintJobRepository(str(tmp_path / "spool.db"))
+    done = repo.enqueue(1)
+    repo.mark_done(done)
+    later = repo.enqueue(2)
+    repo.schedule_retry(later, "paper out", delay_seconds=3600)
+    due = repo.enqueue(3)
+
+    assert repo.claim_next()["Id"] == due
+    assert repo.claim_next() is None
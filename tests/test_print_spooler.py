@@ -0,0 +1,135 @@
+import os
+import sqlite3
+import time
+import datetime
+
+import pytest
+
+from utils.print_backends import FileDropBackend, PrintError
+from utils.print_spooler import PrintSpooler
+
+
+class _FlakyBackend(FileDropBackend):
+    """Drops files like FileDropBackend after failing the first `failures` calls."""
+    def __init__(self, folder, failures):
+        super().__init__(folder)
+        self.failures = failures
+        self.calls = []
+
+    def print_file(self, pdf_path):
+        self.calls.append(datetime.datetime.now())
+        if len(self.calls) <= self.failures:
+            raise PrintError("printer offline")
+        super().print_file(pdf_path)
+
+
+@pytest.fixture
+def render(tmp_path):
+    def _render(transaction_id):
+        path = str(tmp_path / f"receipt_{transaction_id}.pdf")
+        with open(path, "wb") as f:
+            f.write(b"%PDF-1.4 receipt")
+        return path
+    return _render
+
+
+def _spooler(tmp_path, render, backend, **kwargs):
+    kwargs.setdefault("poll_interval", 0.01)
+    return PrintSpooler(str(tmp_path / "spool.db"), render=render, backend=backend, **kwargs)
+
+
+def _wait_for(spooler, job_id, statuses=("Done", "Failed"), timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        spooler.dispatcher.run_pending() # No Tk loop: deliver status callbacks here
+        job = spooler.repo.get(job_id)
+        if job["Status"] in statuses:
+            return job
+        time.sleep(0.005)
+    raise AssertionError(f"job {job_id} still {spooler.repo.get(job_id)['Status']}")
+
+
+def test_job_is_printed_and_reported_done(tmp_path, render):
+    drop = tmp_path / "drop"
+    spooler = _spooler(tmp_path, render, FileDropBackend(str(drop)))
+    seen = []
+    try:
+        job_id = spooler.submit(42, on_status=lambda job: seen.append(job["Status"]))
+        job = _wait_for(spooler, job_id)
+    finally:
+        spooler.shutdown(wait=True)
+    spooler.dispatcher.run_pending() # The worker may post "Done" just after writing it
+
+    assert job["Status"] == "Done"
+    assert job["Attempts"] == 1
+    assert os.listdir(drop) == ["receipt_42.pdf"]
+    assert seen[0] == "Queued" and seen[-1] == "Done"
+
+
+def test_failed_print_is_retried_after_the_backoff(tmp_path, render):
+    backend = _FlakyBackend(str(tmp_path / "drop"), failures=2)
+    spooler = _spooler(tmp_path, render, backend, base_delay=0.2)
+    try:
+        job = _wait_for(spooler, spooler.submit(7))
+    finally:
+        spooler.shutdown(wait=True)
+
+    assert job["Status"] == "Done"
+    assert job["Attempts"] == 3
+    first_wait = (backend.calls[1] - backend.calls[0]).total_seconds()
+    second_wait = (backend.calls[2] - backend.calls[1]).total_seconds()
+    assert first_wait >= 0.2 # base_delay
+    assert second_wait >= 0.4 # then doubled
+
+
+def test_job_fails_after_max_attempts(tmp_path, render):
+    backend = _FlakyBackend(str(tmp_path / "drop"), failures=99)
+    spooler = _spooler(tmp_path, render, backend, max_attempts=3, base_delay=0.01)
+    try:
+        job = _wait_for(spooler, spooler.submit(7))
+    finally:
+        spooler.shutdown(wait=True)
+
+    assert job["Status"] == "Failed"
+    assert job["Attempts"] == 3
+    assert job["LastError"] == "printer offline"
+    assert len(backend.calls) == 3
+
+
+def test_jobs_left_printing_by_a_crash_are_printed_on_start(tmp_path, render):
+    drop = tmp_path / "drop"
+    crashed = _spooler(tmp_path, render, FileDropBackend(str(drop)))
+    job_id = crashed.repo.enqueue(5, "file")
+    assert crashed.repo.claim_next()["Id"] == job_id # Claimed, then the application died mid-print
+
+    spooler = _spooler(tmp_path, render, FileDropBackend(str(drop))).start()
+    try:
+        job = _wait_for(spooler, job_id)
+    finally:
+        spooler.shutdown(wait=True)
+
+    assert job["Status"] == "Done"
+    assert os.listdir(drop) == ["receipt_5.pdf"]
+
+
+def test_worker_survives_a_database_error(tmp_path, render):
+    spooler = _spooler(tmp_path, render, FileDropBackend(str(tmp_path / "drop")), base_delay=0.01)
+    mark_done = spooler.repo.mark_done
+    failures = []
+
+    def locked_once(job_id):
+        if not failures:
+            failures.append(job_id)
+            raise sqlite3.OperationalError("database is locked")
+        mark_done(job_id)
+
+    spooler.repo.mark_done = locked_once
+    try:
+        first = _wait_for(spooler, spooler.submit(1))
+        second = _wait_for(spooler, spooler.submit(2))
+    finally:
+        spooler.shutdown(wait=True)
+
+    assert failures == [first["Id"]]
+    assert first["Status"] == "Done" and first["Attempts"] == 2 # Put back in the queue, then printed again
+    assert second["Status"] == "Done"
@@ -0,0 +1,30 @@
+import sqlite3
+
+from viewmodels.printerviewmodel import PrinterViewModel
+from tests.fixtures import execute
+
+
+class _TracingViewModel(PrinterViewModel):
+    """Records the SQL it runs so the test can ask SQLite for the query plan."""
+    def __init__(self, db_path):
+        super().__init__(db_path)
+        self.statements = []
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.set_trace_callback(self.statements.append)
+        return conn
+
+
+def test_last_completed_transaction_for_a_vehicle_is_an_index_seek(seeded_db):
+    vehicle, newest_id = execute(seeded_db, "SELECT VehicleNumber, MAX(Id) FROM WeighingTransactions"
+                                            " GROUP BY VehicleNumber HAVING COUNT(*) > 1 LIMIT 1")[0]
+    vm = _TracingViewModel(seeded_db)
+
+    transaction = vm.get_last_completed_transaction(vehicle)
+
+    assert transaction["Id"] == newest_id # Seeded rows are updated in Id order
+    assert transaction["CustomerName"].startswith("Customer Quarry") # From the shared resolver
+    plan = " | ".join(row[3] for row in execute(seeded_db, "EXPLAIN QUERY PLAN " + vm.statements[-1]))
+    assert "IX_WeighingTransactions_VehicleNumber_Status_LastUpdatedAt (VehicleNumber=? AND Status=?)" in plan
+    assert "TEMP B-TREE" not in plan
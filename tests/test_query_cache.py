@@ -0,0 +1,52 @@
+import sqlite3
+
+from utils.query_cache import QueryResultCache
+
+
+def _count(db_path):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute("SELECT COUNT(*) FROM WeighingTransactions").fetchone()[0]
+
+
+def test_commit_from_another_connection_invalidates(seeded_db):
+    cache = QueryResultCache(seeded_db)
+    loads = []
+
+    def load():
+        loads.append(1)
+        return _count(seeded_db)
+
+    assert cache.get_or_load(("count",), load) == 200
+    assert cache.get_or_load(("count",), load) == 200
+    assert len(loads) == 1
+
+    with sqlite3.connect(seeded_db) as conn:
+        conn.execute("DELETE FROM WeighingTransactions WHERE Id = 1")
+
+    assert cache.get_or_load(("count",), load) == 199
+    assert len(loads) == 2
+    assert cache.stats()["invalidations"] == 1
+    cache.close()
+
+
+def test_value_loaded_before_a_commit_is_not_stored(seeded_db):
+    cache = QueryResultCache(seeded_db)
+    token = cache.current_token()
+    stale = _count(seeded_db)
+
+    with sqlite3.connect(seeded_db) as conn:
+        conn.execute("DELETE FROM WeighingTransactions WHERE Id = 1")
+    cache.put(("count",), stale, token=token)
+
+    assert cache.lookup(("count",)) == (False, None)
+    cache.close()
+
+
+def test_least_recently_used_entry_is_evicted(seeded_db):
+    cache = QueryResultCache(seeded_db, max_entries=2)
+    for key in ("a", "b", "a", "c"):
+        cache.get_or_load(key, lambda: key.upper())
+
+    assert cache.get_or_load("b", lambda: "reloaded") == "reloaded"
+    assert cache.get_or_load("c", lambda: "reloaded") == "C"
+    cache.close()
@@ -0,0 +1,50 @@
+import os
+import time
+
+from utils.receipt_store import ReceiptStore
+
+
+def _render(size):
+    def write(path):
+        with open(path, "wb") as f:
+            f.write(b"x" * size)
+    return write
+
+
+def _age(path, seconds):
+    stamp = time.time() - seconds
+    os.utime(path, (stamp, stamp))
+
+
+def test_least_recently_used_receipts_go_first_when_over_budget(tmp_path, quiet):
+    store = ReceiptStore(str(tmp_path), max_bytes=2500, max_age_days=0, evict_every=1000)
+    paths = [store.get_or_render(i, ReceiptStore.digest(i), _render(1000)) for i in range(1, 4)]
+    for age, path in zip((300, 200, 100), paths):
+        _age(path, age)
+    store.get_or_render(1, ReceiptStore.digest(1), _render(1000)) # Reprint: receipt 1 becomes the newest
+
+    assert store.evict() == 1
+    assert [os.path.exists(p) for p in paths] == [True, False, True]
+    assert store.stats()["hits"] == 1
+
+
+def test_expired_receipts_are_removed_and_other_files_are_left_alone(tmp_path, quiet):
+    foreign = tmp_path / "notes.pdf"
+    foreign.write_bytes(b"not a receipt")
+    store = ReceiptStore(str(tmp_path), max_bytes=0, max_age_days=30)
+    old = store.get_or_render(7, ReceiptStore.digest("v1"), _render(10))
+    fresh = store.get_or_render(8, ReceiptStore.digest("v1"), _render(10))
+    _age(old, 31 * 86400)
+    _age(str(foreign), 31 * 86400)
+
+    assert store.evict() == 1
+    assert not os.path.exists(old) and os.path.exists(fresh) and foreign.exists()
+
+
+def test_a_new_version_replaces_the_stored_receipt(tmp_path, quiet):
+    store = ReceiptStore(str(tmp_path))
+    first = store.get_or_render(5, ReceiptStore.digest("2024-01-01T10:00"), _render(10))
+    second = store.get_or_render(5, ReceiptStore.digest("2024-01-01T11:00"), _render(10))
+
+    assert first != second
+    assert sorted(os.listdir(tmp_path)) == [os.path.basename(second)]
@@ -0,0 +1,43 @@
+import re
+
+import pytest
+
+pytest.importorskip("reportlab")
+
+from utils.receipt_template import ReceiptTemplate, receipt_fields
+
+_SPEC = {
+    "page_size": "A4",
+    "copies_y": [0, "half"],
+    "static": [
+        {"text": "WEIGHBRIDGE RECEIPT", "x": "center", "y": 380, "font": "Helvetica-Bold", "size": 14},
+        {"type": "line", "y": 360},
+    ],
+    "fields": [
+        {"text": "Vehicle: {VehicleNumber}", "x": "left", "y": 340},
+        {"text": "Net: {NetWeight} kg ({NetWeightWords})", "x": "left", "y": 320},
+    ],
+}
+
+
+def test_static_layer_is_one_form_shared_by_every_copy(tmp_path):
+    from reportlab.pdfgen import canvas
+
+    template = ReceiptTemplate(_SPEC)
+    path = str(tmp_path / "receipts.pdf")
+    c = canvas.Canvas(path, pagesize=template.page_size, pageCompression=0)
+    for transaction in ({"VehicleNumber": "TN37AB0001", "NetWeight": 18000},
+                        {"VehicleNumber": "TN37AB0002", "NetWeight": 1001}):
+        template.draw_page(c, transaction)
+    c.save()
+    pdf = open(path, "rb").read()
+
+    assert pdf.count(b"/Subtype /Form") == 1
+    assert len(re.findall(rb"/FormXob\.\w+ Do", pdf)) == 4 # 2 pages x 2 copies
+    assert pdf.count(b"WEIGHBRIDGE RECEIPT") == 1
+    assert b"TN37AB0002" in pdf
+
+
+def test_missing_fields_print_as_a_dash():
+    fields = receipt_fields({"VehicleNumber": None, "Charges": None, "NetWeight": None})
+    assert "{VehicleNumber} {CustomerName} {Charges}".format_map(fields) == "- - 0.00"
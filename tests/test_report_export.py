@@ -0,0 +1,69 @@
+import re
+
+import pandas as pd
+
+from Model.report_model import ReportRepository
+from tests.fixtures import execute
+from utils.report_export import StreamingReportExporter, format_timestamp_column, _short_timestamp
+
+COLUMNS = ["TransactionID", "VehicleNumber", "CustomerID", "MaterialID", "FirstWeight",
+           "SecondWeight", "NetWeight", "FirstWeightTimestamp"]
+
+
+def _source(rows, chunk_size=30):
+    calls = []
+
+    def row_chunks():
+        calls.append(1)
+        for start in range(0, len(rows), chunk_size):
+            yield rows[start:start + chunk_size]
+    return row_chunks, calls
+
+
+def test_pdf_reads_the_rows_once_and_draws_every_column_group(tmp_path):
+    rows = [(i, f"KA01-{i}", 1, 2, 1000 + i, 500, 500 + i, "2024-05-01T13:45:12")
+            for i in range(100)]
+    row_chunks, calls = _source(rows)
+    progress = []
+    exporter = StreamingReportExporter(COLUMNS, row_chunks, total=len(rows),
+                                       progress=lambda done, total: progress.append((done, total)))
+    target = tmp_path / "report.pdf"
+
+    assert exporter.export(str(target), ".pdf") == 100
+
+    assert calls == [1]
+    # 40 rows per landscape page: 3 pages for each of the two column groups
+    assert len(re.findall(rb"/Type /Page\b", target.read_bytes())) == 6
+    assert progress[-1] == (200, 200)
+
+
+def test_pdf_with_a_single_column_group(tmp_path):
+    rows = [(i, f"KA01-{i}") for i in range(10)]
+    row_chunks, calls = _source(rows)
+    exporter = StreamingReportExporter(COLUMNS[:2], row_chunks)
+    target = tmp_path / "report.pdf"
+
+    assert exporter.export(str(target), ".pdf") == 10
+    assert calls == [1]
+    assert len(re.findall(rb"/Type /Page\b", target.read_bytes())) == 1
+
+
+TIMESTAMPS = ["2024-05-01T13:45:12.123456", "2024-05-01 08:05:00", "legacy import", None]
+
+
+def test_vectorised_timestamps_match_the_per_cell_formatter():
+    formatted = format_timestamp_column(pd.Series(TIMESTAMPS, dtype=object)).tolist()
+
+    assert formatted == ["2024-05-01 13:45", "2024-05-01 08:05", "legacy import", None]
+    assert formatted[:3] == [_short_timestamp(v) for v in TIMESTAMPS[:3]]
+
+
+def test_sql_short_timestamps_keep_non_iso_values(seeded_db, quiet):
+    execute(seeded_db, "UPDATE WeighingTransactions SET CreatedAt = 'legacy import' WHERE Id = 1")
+    repo = ReportRepository(db_path=seeded_db)
+    created_at = repo.REPORT_COLUMNS.index("CreatedAt")
+
+    rows = [row for chunk in repo.iter_combined_filtered_transactions(short_timestamps=True) for row in chunk]
+
+    assert [row[created_at] for row in rows if row[0] == 1] == ["legacy import"]
+    assert all(re.fullmatch(r"\d{4}-\d\d-\d\d \d\d:\d\d", row[created_at]) for row in rows if row[0] != 1)
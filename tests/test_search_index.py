@@ -0,0 +1,33 @@
+import pytest
+
+from Model.report_model import ReportRepository
+from tests.fixtures import execute
+
+
+@pytest.fixture
+def search_repo(seeded_db, quiet):
+    repo = ReportRepository(db_path=seeded_db)
+    if not repo._search_ready:
+        pytest.skip("SQLite without FTS5 trigram support")
+    return repo
+
+
+def _indexed(db_path, column, transaction_id):
+    return execute(db_path, f"SELECT {column} FROM TransactionSearch WHERE rowid = ?", (transaction_id,))[0][0]
+
+
+@pytest.mark.parametrize("table, key_column, name_column, indexed_column", [
+    ("Customers", "CustomerId", "Name", "CustomerName"),
+    ("MaterialTypes", "MaterialTypeId", "name", "MaterialName"),
+    ("Users", "OperatorId", "Username", "OperatorName"),
+])
+def test_master_renames_and_deletes_reach_the_index(seeded_db, search_repo, table, key_column, name_column,
+                                                    indexed_column):
+    master_id = execute(seeded_db, f"SELECT {key_column} FROM WeighingTransactions WHERE Id = 1")[0][0]
+
+    execute(seeded_db, f"UPDATE {table} SET {name_column} = 'Renamed Entry' WHERE Id = ?", (master_id,))
+    assert _indexed(seeded_db, indexed_column, 1) == "Renamed Entry"
+
+    execute(seeded_db, f"DELETE FROM {table} WHERE Id = ?", (master_id,))
+    assert _indexed(seeded_db, indexed_column, 1) is None
+    assert search_repo.search_transactions(indexed_column, "Renamed Entry") == []
@@ -0,0 +1,75 @@
+import sqlite3
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from Model.transaction_snapshot import TransactionSnapshot
+from tests.fixtures import execute
+from utils.db_executor import DbExecutor
+
+
+def _table_totals(db_path):
+    count, net = execute(db_path, "SELECT COUNT(*), SUM(NetWeight) FROM WeighingTransactions")[0]
+    return count, float(net)
+
+
+def _snapshot_totals(snapshot):
+    totals = snapshot.totals()
+    return totals["TotalTransactions"], totals["TotalNetWeight"]
+
+
+def test_refresh_applies_updates_since_the_watermark(seeded_db):
+    snapshot = TransactionSnapshot(seeded_db)
+    assert snapshot.refresh() == 200
+
+    execute(seeded_db, "UPDATE WeighingTransactions SET NetWeight = 1000, LastUpdatedAt = '2030-01-01T00:00:00'"
+                       " WHERE Id = 5")
+    snapshot.refresh()
+    assert _snapshot_totals(snapshot) == _table_totals(seeded_db)
+
+
+def test_refresh_sees_a_delete_that_leaves_the_count_unchanged(seeded_db):
+    snapshot = TransactionSnapshot(seeded_db)
+    snapshot.refresh()
+
+    # The newest row goes and a back-dated row below the watermark arrives: same row count
+    execute(seeded_db, "DELETE FROM WeighingTransactions WHERE Id = 200")
+    execute(seeded_db, "INSERT INTO WeighingTransactions (Id, TransactionGuid, VehicleNumber, NetWeight, Status,"
+                       " CreatedAt, LastUpdatedAt) VALUES (0, 'guid-backfill', 'TN01XX0001', 500, 'Completed',"
+                       " '2000-01-01T00:00:00', '2000-01-01T00:00:00')")
+    snapshot.refresh()
+    assert _snapshot_totals(snapshot) == _table_totals(seeded_db)
+
+
+def test_a_delete_is_dropped_in_place_without_a_rebuild(seeded_db):
+    snapshot = TransactionSnapshot(seeded_db)
+    snapshot.refresh()
+    snapshot._reset = lambda: pytest.fail("refresh() rebuilt the snapshot")
+
+    execute(seeded_db, "DELETE FROM WeighingTransactions WHERE Id IN (3, 200)")
+    assert snapshot.refresh() == 0
+    assert _snapshot_totals(snapshot) == _table_totals(seeded_db)
+    assert 3 not in snapshot.ids[:snapshot.size]
+
+    # Id 200 is free again; a new row that reuses it must still be picked up
+    execute(seeded_db, "INSERT INTO WeighingTransactions (TransactionGuid, VehicleNumber, NetWeight, Status,"
+                       " CreatedAt, LastUpdatedAt) VALUES ('guid-new', 'TN01XX0002', 700, 'Completed',"
+                       " '2000-01-01T00:00:00', '2000-01-01T00:00:00')")
+    snapshot.refresh()
+    assert _snapshot_totals(snapshot) == _table_totals(seeded_db)
+
+
+def test_refresh_on_a_background_executor_connection(seeded_db):
+    snapshot = TransactionSnapshot(seeded_db)
+    executor = DbExecutor(lambda: sqlite3.connect(seeded_db), name="test-summary")
+    results = []
+    try:
+        future = executor.submit(snapshot.refresh, on_success=results.append)
+        assert future.result(timeout=5) == 200
+        executor.dispatcher.run_pending()
+    finally:
+        executor.shutdown()
+
+    assert results == [200]
+    assert _snapshot_totals(snapshot) == _table_totals(seeded_db)
@@ -0,0 +1,27 @@
+import pytest
+
+from Model.turnaround_model import TurnaroundRepository, percentile
+from tests.fixtures import execute
+
+
+def test_percentile_interpolates_like_numpy():
+    values = [10.0, 20.0, 30.0, 40.0]
+    assert percentile(values, 50) == 25.0
+    assert percentile(values, 90) == pytest.approx(37.0)
+    assert percentile([5.0], 95) == 5.0
+    assert percentile([], 50) is None
+
+
+def test_dwell_percentiles_and_in_yard(seeded_db):
+    # Material 1 rows take 10 minutes, material 2 rows 30; Id 3 is still in the yard
+    execute(seeded_db, "UPDATE WeighingTransactions SET SecondWeightTimestamp ="
+                       " datetime(FirstWeightTimestamp, CASE MaterialTypeId WHEN 1 THEN '+10 minutes'"
+                       " ELSE '+30 minutes' END) WHERE MaterialTypeId IN (1, 2)")
+    execute(seeded_db, "UPDATE WeighingTransactions SET Status = 'Pending', SecondWeightTimestamp = NULL WHERE Id = 3")
+    repo = TurnaroundRepository(seeded_db)
+
+    by_material = {row["group"]: row for row in repo.fetch_dwell_percentiles("material")}
+    assert set(by_material) == {"M-Sand", "P-Sand"}
+    assert by_material["M-Sand"]["p50"] == pytest.approx(10.0)
+    assert by_material["P-Sand"]["p95"] == pytest.approx(30.0)
+    assert [row["Id"] for row in repo.fetch_in_yard()] == [3]
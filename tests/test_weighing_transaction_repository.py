@@ -0,0 +1,17 @@
+from repositories.WeighingTransactionRepository import WeighingTransactionRepository
+from tests.fixtures import execute
+
+
+def test_latest_completed_transaction_for_a_vehicle_is_an_index_seek(seeded_db, quiet):
+    vehicle, newest_id = execute(seeded_db, "SELECT VehicleNumber, MAX(Id) FROM WeighingTransactions"
+                                            " GROUP BY VehicleNumber HAVING COUNT(*) > 1 LIMIT 1")[0]
+    repo = WeighingTransactionRepository(seeded_db)
+    statements = []
+    repo.conn.set_trace_callback(statements.append)
+
+    transaction = repo.get_latest_completed_transaction(vehicle)
+
+    assert transaction.id == newest_id # Seeded rows are updated in Id order
+    plan = " | ".join(row[3] for row in execute(seeded_db, "EXPLAIN QUERY PLAN " + statements[-1]))
+    assert "IX_WeighingTransactions_VehicleNumber_Status_LastUpdatedAt (VehicleNumber=? AND Status=?)" in plan
+    assert "TEMP B-TREE" not in plan
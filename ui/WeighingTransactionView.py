@@ -22,6 +22,8 @@ class WeighingTransactionView(ctk.CTkFrame):
     Displays UI elements for transaction input, control, and data display.
     Binds to WeighingTransactionViewModel for data and logic.
     """
+    YARD_REFRESH_MS = 30000 # Live yard count poll interval
+
     def __init__(self, master, view_model):
         super().__init__(master, fg_color="transparent")
         self.view_model = view_model
@@ -211,6 +213,13 @@ class WeighingTransactionView(ctk.CTkFrame):
         self.status_label = ctk.CTkLabel(self, text="Ready", font=ctk.CTkFont(size=14, weight="bold"))
         self.status_label.grid(row=3, column=0, padx=15, pady=5, sticky="ew") # Moved to row 3 to be below buttons
 
+        # --- Live yard count (pending transactions) ---
+        self.yard_count_label = ctk.CTkLabel(self, textvariable=self.view_model.yard_count,
+                                             font=ctk.CTkFont(size=14, weight="bold"), text_color="#3F51B5")
+        self.yard_count_label.grid(row=4, column=0, padx=15, pady=(0, 5), sticky="ew")
+        self._yard_after_id = None
+        self._schedule_yard_refresh()
+
         # Initial population of comboboxes using ViewModel's properties
         # Assuming ViewModel's list properties are populated at this point
         self._set_vehicle_type_combobox_options(self.view_model.vehicle_type_names)
@@ -220,6 +229,17 @@ class WeighingTransactionView(ctk.CTkFrame):
         # Initialize _side_panel attribute to None
         self._side_panel = None
 
+    def _schedule_yard_refresh(self):
+        """Polls the yard count so trucks weighed from other stations show up too."""
+        self.view_model.refresh_yard_count()
+        self._yard_after_id = self.after(self.YARD_REFRESH_MS, self._schedule_yard_refresh)
+
+    def destroy(self):
+        if self._yard_after_id is not None:
+            self.after_cancel(self._yard_after_id)
+            self._yard_after_id = None
+        super().destroy()
+
     def _show_context_menu(self, event):
         """Displays the right-click context menu."""
         try:
@@ -20,7 +20,12 @@ from repositories.WeighingTransactionRepository import WeighingTransactionReposi
 from repositories.user_repository import UserRepository
 from Model.report_model import ReportRepository
 from ui.reportview import ReportViewerFrame
+from ui.pivot_report_view import PivotReportFrame
+from ui.turnaround_report_view import TurnaroundReportFrame
 from utils.resource_utils import resource_path
+from utils.db_executor import DbExecutor
+from utils.print_spooler import PrintSpooler
+from viewmodels.pri import get_receipt_printer
 
 # Standard logging configuration
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -52,6 +57,24 @@ class MainDashboardFrame(ctk.CTkFrame):
         self.report_repo = ReportRepository(db_path=self.db_path)
         print("[DASHBOARD-LOG] Repositories initialized.")
 
+        # --- Background DB writer (keeps commits off the Tk main loop) ---
+        self.db_executor = DbExecutor(
+            factory=lambda: WeighingTransactionRepository(db_path=self.db_path),
+            name="weighing-db-writer"
+        ).attach(self)
+
+        # --- Background print spooler (a slow printer must not stall weighing) ---
+        self.print_spooler = None
+        try:
+            self.receipt_printer = get_receipt_printer()
+            self.print_spooler = PrintSpooler(
+                self.db_path,
+                setup=self.receipt_printer.job_setup, # Renderer and backend from one config per job
+                name="print-spooler"
+            ).attach(self).start()
+        except Exception as e:
+            logging.error(f"Print spooler unavailable, printing will run in the foreground: {e}")
+
         # --- Initialize ViewModels ---
         print("[DASHBOARD-LOG] Initializing ViewModels...")
         self.serial_reader_model = SerialReaderModel()
@@ -61,7 +84,9 @@ class MainDashboardFrame(ctk.CTkFrame):
             material_repository=self.material_repo,
             customer_repository=self.customer_repo,
             weighing_repository=self.weighing_transaction_repo,
-            serial_view_model=self.serial_reader_view_model
+            serial_view_model=self.serial_reader_view_model,
+            db_executor=self.db_executor,
+            print_spooler=self.print_spooler
         )
         self.weighing_transaction_view_model.operator.set(self.username)
         print("[DASHBOARD-LOG] ViewModels initialized.")
@@ -88,6 +113,10 @@ class MainDashboardFrame(ctk.CTkFrame):
         print("[DASHBOARD-LOG] 🧹 Cleanup on exit called. Disconnecting serial port...")
         if self.serial_reader_view_model:
             self.serial_reader_view_model.disconnect_port()
+        if self.db_executor:
+            self.db_executor.shutdown()
+        if self.print_spooler:
+            self.print_spooler.shutdown()
 
     def _build_header(self):
         print("[DASHBOARD-LOG] Building header...")
@@ -180,6 +209,10 @@ class MainDashboardFrame(ctk.CTkFrame):
                 return CustomerMasterFrame(self.content_container, self.user_permissions, self.customer_repo)
             elif frame_name == "report":
                 return ReportViewerFrame(self.content_container, self.user_permissions)
+            elif frame_name == "pivot_report":
+                return PivotReportFrame(self.content_container, self.user_permissions, self.db_path)
+            elif frame_name == "turnaround_report":
+                return TurnaroundReportFrame(self.content_container, self.user_permissions, self.db_path)
             else:
                 # Fallback for unknown frame names
                 fallback_frame = ctk.CTkFrame(self.content_container, fg_color="lightgray")
@@ -216,4 +249,10 @@ class MainDashboardFrame(ctk.CTkFrame):
             ctk.CTkButton(grid, text="📊 Report Viewer", width=220, height=100, font=("Segoe UI", 18, "bold"), corner_radius=12, 
                           fg_color="#3B82F6", hover_color="#2563EB", 
                           command=lambda: self.show_frame("report")).grid(row=0, column=0, padx=12, pady=12)
+            ctk.CTkButton(grid, text="📈 Pivot Report", width=220, height=100, font=("Segoe UI", 18, "bold"), corner_radius=12, 
+                          fg_color="#3B82F6", hover_color="#2563EB", 
+                          command=lambda: self.show_frame("pivot_report")).grid(row=0, column=1, padx=12, pady=12)
+            ctk.CTkButton(grid, text="⏱️ Turnaround", width=220, height=100, font=("Segoe UI", 18, "bold"), corner_radius=12, 
+                          fg_color="#3B82F6", hover_color="#2563EB", 
+                          command=lambda: self.show_frame("turnaround_report")).grid(row=0, column=2, padx=12, pady=12)
         return settings_frame
\ No newline at end of file
@@ -0,0 +1,104 @@
+import os
+import tkinter.ttk as ttk
+from tkinter import filedialog, messagebox, Scrollbar
+
+import customtkinter as ctk
+
+from viewmodels.pivot_viewmodel import PivotReportViewModel
+
+
+class PivotReportFrame(ctk.CTkFrame):
+    """Tonnage / revenue by any two or three dimensions, e.g. customer x material x week."""
+    def __init__(self, parent, user_permissions, db_path="weighbridge.db"):
+        super().__init__(parent, fg_color="white")
+        self.user_permissions = user_permissions
+        self.vm = PivotReportViewModel(db_path)
+        self._build_ui()
+
+    def _build_ui(self):
+        ctk.CTkLabel(self, text="📈 Pivot Report", font=ctk.CTkFont(size=22, weight="bold")).pack(anchor="w", padx=20, pady=(20, 10))
+
+        controls = ctk.CTkFrame(self, fg_color="transparent")
+        controls.pack(pady=5, padx=10, fill="x")
+
+        dimensions = self.vm.dimension_choices
+        optional = [PivotReportViewModel.NONE] + dimensions
+
+        ctk.CTkLabel(controls, text="Rows:").pack(side="left", padx=5)
+        self.row_dim_var = ctk.StringVar(value="customer")
+        ctk.CTkOptionMenu(controls, variable=self.row_dim_var, values=dimensions, width=130).pack(side="left", padx=2)
+        self.row_dim2_var = ctk.StringVar(value="material")
+        ctk.CTkOptionMenu(controls, variable=self.row_dim2_var, values=optional, width=130).pack(side="left", padx=2)
+
+        ctk.CTkLabel(controls, text="Columns:").pack(side="left", padx=(15, 5))
+        self.col_dim_var = ctk.StringVar(value="week")
+        ctk.CTkOptionMenu(controls, variable=self.col_dim_var, values=optional, width=130).pack(side="left", padx=2)
+
+        ctk.CTkLabel(controls, text="Measure:").pack(side="left", padx=(15, 5))
+        self.measure_var = ctk.StringVar(value="total_net_weight")
+        ctk.CTkOptionMenu(controls, variable=self.measure_var, values=self.vm.measure_choices, width=190).pack(side="left", padx=2)
+
+        dates = ctk.CTkFrame(self, fg_color="transparent")
+        dates.pack(pady=5, padx=10, fill="x")
+        ctk.CTkLabel(dates, text="From (YYYY-MM-DD):").pack(side="left", padx=5)
+        self.date_from_var = ctk.StringVar()
+        ctk.CTkEntry(dates, textvariable=self.date_from_var, width=110).pack(side="left", padx=2)
+        ctk.CTkLabel(dates, text="To:").pack(side="left", padx=5)
+        self.date_to_var = ctk.StringVar()
+        ctk.CTkEntry(dates, textvariable=self.date_to_var, width=110).pack(side="left", padx=2)
+
+        ctk.CTkButton(dates, text="Run", command=self.run_report).pack(side="left", padx=(20, 5))
+        if "CanExportReports" in self.user_permissions:
+            ctk.CTkButton(dates, text="Export", command=self.export_data).pack(side="left", padx=5)
+
+        table_frame = ctk.CTkFrame(self)
+        table_frame.pack(expand=True, fill="both", padx=10, pady=10)
+        y_scroll = Scrollbar(table_frame, orient="vertical")
+        y_scroll.pack(side="right", fill="y")
+        x_scroll = Scrollbar(table_frame, orient="horizontal")
+        x_scroll.pack(side="bottom", fill="x")
+        self.tree = ttk.Treeview(table_frame, show="headings",
+                                 yscrollcommand=y_scroll.set, xscrollcommand=x_scroll.set)
+        self.tree.pack(expand=True, fill="both")
+        y_scroll.config(command=self.tree.yview)
+        x_scroll.config(command=self.tree.xview)
+
+    def run_report(self):
+        try:
+            self.vm.run([self.row_dim_var.get(), self.row_dim2_var.get()],
+                        self.col_dim_var.get(), self.measure_var.get(),
+                        date_from=self.date_from_var.get().strip() or None,
+                        date_to=self.date_to_var.get().strip() or None)
+        except ValueError as e:
+            messagebox.showerror("Pivot Report", str(e))
+            return
+        self._show_table()
+
+    def _show_table(self):
+        self.tree.delete(*self.tree.get_children())
+        # Column ids are positions; headers can repeat (a column value named like a row dimension)
+        column_ids = [f"c{i}" for i in range(len(self.vm.columns))]
+        self.tree["columns"] = column_ids
+        for column_id, header in zip(column_ids, self.vm.columns):
+            self.tree.heading(column_id, text=header)
+            self.tree.column(column_id, width=120, anchor="center")
+        for row in self.vm.table:
+            values = []
+            for key in self.vm.keys:
+                value = row.get(key)
+                values.append(f"{value:,.2f}" if isinstance(value, float) else ("" if value is None else value))
+            self.tree.insert('', 'end', values=values)
+
+    def export_data(self):
+        if not self.vm.table:
+            messagebox.showwarning("No Data", "Run the report before exporting.")
+            return
+        file = filedialog.asksaveasfilename(title="Export Pivot Report", defaultextension=".xlsx",
+                                            filetypes=[("Excel file", "*.xlsx"), ("CSV file", "*.csv"), ("PDF file", "*.pdf")])
+        if not file:
+            return
+        try:
+            self.vm.export(file, os.path.splitext(file)[1].lower())
+            messagebox.showinfo("Export Complete", f"Exported to:\n{file}")
+        except Exception as e:
+            messagebox.showerror("Export Error", str(e))
@@ -1,68 +1,40 @@
 import customtkinter as ctk
-import pandas as pd
 from viewmodels.report_viewmodel import ReportViewModel
+from utils.export_jobs import ExportJobRunner
+from utils.latest_query import LatestQueryRunner
+from utils.db_executor import DbExecutor
 from tkinter import filedialog, messagebox
-from reportlab.lib.pagesizes import landscape, A4
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, PageBreak
-from reportlab.lib import colors
 import os
+import sqlite3
+import datetime
 import tkinter as tk
-
-def export_to_pdf(file_path, df_data): 
-    full_columns = [
-        "Id", "TransactionGuid", "VehicleNumber", "VehicleTypeName",
-        "MaterialName", "CustomerName", "FirstWeight", "FirstWeightTimestamp",
-        "SecondWeight", "SecondWeightTimestamp", "NetWeight", "Charges",
-        "Status", "OperatorName", "Remarks", "CreatedAt", "LastUpdatedAt"
-    ]
-    
-    df = pd.DataFrame(df_data, columns=full_columns)
-
-    for col in ["FirstWeightTimestamp", "SecondWeightTimestamp", "CreatedAt", "LastUpdatedAt"]:
-        if col in df.columns:
-            df[col] = df[col].apply(lambda x: pd.to_datetime(x).strftime('%Y-%m-%d %H:%M') if pd.notna(x) else None)
-    
-    column_chunks = [full_columns[i:i + 6] for i in range(0, len(full_columns), 6)]
-
-    doc = SimpleDocTemplate(file_path, pagesize=landscape(A4), rightMargin=10, leftMargin=10, topMargin=10, bottomMargin=10)
-    story = []
-
-    for chunk in column_chunks:
-        data = [chunk] + df[chunk].values.tolist()
-        col_widths = [150 if col in ["Remarks", "CreatedAt", "LastUpdatedAt", "TransactionGuid"]
-                      else 110 if col in ["FirstWeightTimestamp", "SecondWeightTimestamp"]
-                      else 90 for col in chunk]
-        table = Table(data, colWidths=col_widths, repeatRows=1)
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0,0), (-1,0), colors.HexColor("#dcecf9")),
-            ('GRID', (0,0), (-1,-1), 0.5, colors.grey),
-            ('ALIGN', (0,0), (-1,-1), 'CENTER'),
-            ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0,0), (-1,-1), 8),
-            ('VALIGN', (0,0), (-1,-1), 'MIDDLE')
-        ]))
-        story.append(table)
-        story.append(PageBreak())
-
-    if story and isinstance(story[-1], PageBreak):
-        story.pop()
-
-    doc.build(story)
+import tkinter.ttk as ttk
 
 class ReportViewerFrame(ctk.CTkFrame):
+    LIVE_SEARCH_DELAY_MS = 250
+
     def __init__(self, parent, user_permissions):
         super().__init__(parent, fg_color="white")
         self.user_permissions = user_permissions
-        self.vm = ReportViewModel()
+        # Exports run on a worker thread so the window stays usable while a large report is written
+        self.export_runner = ExportJobRunner(name="report-export").attach(self)
+        self.vm = ReportViewModel(export_runner=self.export_runner)
+        # Search-as-you-type queries run here; a newer keystroke aborts the one in flight
+        self.live_search = LatestQueryRunner(self.vm.repo.db_path, name="report-live-search").attach(self)
+        # Snapshot summaries refresh and aggregate here, off the Tk thread
+        self.summary_executor = DbExecutor(lambda: sqlite3.connect(self.vm.repo.db_path),
+                                           name="report-summary").attach(self)
+        self._search_after_id = None
         
         self.vm.load_available_dates() 
         print(f"DEBUG: ReportViewerFrame - Available dates for combo: {self.vm.available_dates}")
         
-        self.vm.load_combined_filtered_transactions(
+        self.vm.load_first_page(
             column=None, 
             keyword=None, 
             date=self.vm.available_dates[0] if self.vm.available_dates else None
         )
+        self._loading_page = False
 
         self.context_menu = tk.Menu(self, tearoff=0)
         self.context_menu.add_command(label="🔄 Refresh Database", command=self.refresh_on_right_click)
@@ -80,6 +52,7 @@ class ReportViewerFrame(ctk.CTkFrame):
 
         self._build_ui()
         self.refresh_table(self.vm.filtered_transactions)
+        self._update_row_count()
 
     def _build_ui(self):
         search_frame = ctk.CTkFrame(self, fg_color="transparent")
@@ -92,12 +65,14 @@ class ReportViewerFrame(ctk.CTkFrame):
 
         self.filter_var = ctk.StringVar(value="VehicleNumber")
         filter_combo = ctk.CTkOptionMenu(search_frame, variable=self.filter_var,
-                                         values=["VehicleNumber", "CustomerName", "MaterialName", "Status", "VehicleTypeName", "OperatorName"])
+                                         values=["VehicleNumber", "CustomerName", "MaterialName", "Status", "VehicleTypeName", "OperatorName", "Remarks", "AllFields"])
         filter_combo.pack(side="left", padx=5)
 
         search_entry.bind("<Return>", lambda e: self.perform_combined_filter())
+        search_entry.bind("<KeyRelease>", self._schedule_live_search)
         ctk.CTkButton(search_frame, text="Search", command=self.perform_combined_filter).pack(side="left", padx=5)
         ctk.CTkButton(search_frame, text="Clear", command=self.clear_search).pack(side="left", padx=5)
+        ctk.CTkButton(search_frame, text="Summary", command=self.show_summary).pack(side="left", padx=5)
 
         ctk.CTkLabel(search_frame, text="Filter by Date:").pack(side="left", padx=(20, 5))
         self.date_var = ctk.StringVar(value="All Dates")
@@ -114,6 +89,10 @@ class ReportViewerFrame(ctk.CTkFrame):
 
         if "CanExportReports" in self.user_permissions:
             ctk.CTkButton(search_frame, text="Export", command=self.export_data).pack(side="left", padx=(20, 5))
+            self.export_status_label = ctk.CTkLabel(search_frame, text="")
+            self.export_status_label.pack(side="left", padx=5)
+            self.cancel_export_button = ctk.CTkButton(search_frame, text="Cancel Export", width=110,
+                                                      fg_color="#d9534f", command=self.cancel_export)
 
         table_frame = ctk.CTkFrame(self)
         table_frame.pack(expand=True, fill="both", padx=10, pady=10)
@@ -127,10 +106,17 @@ class ReportViewerFrame(ctk.CTkFrame):
         x_scroll = Scrollbar(table_frame, orient="horizontal")
         x_scroll.pack(side="bottom", fill="x")
 
+        self.y_scroll = y_scroll
         self.tree = ttk.Treeview(table_frame, columns=self.columns, show="headings",
-                                 yscrollcommand=y_scroll.set, xscrollcommand=x_scroll.set)
+                                 yscrollcommand=self._on_tree_yscroll, xscrollcommand=x_scroll.set)
         self.tree.pack(expand=True, fill="both")
         y_scroll.config(command=self.tree.yview)
+        self.tree.tag_configure("status_pending", background="#ffe5e5")
+        self.tree.tag_configure("status_completed", background="#e6ffe6")
+        self.tree.tag_configure("neutral", background="#f2f2f2")
+
+        self.row_count_label = ctk.CTkLabel(self, text="", anchor="w")
+        self.row_count_label.pack(fill="x", padx=12, pady=(0, 6))
         x_scroll.config(command=self.tree.xview)
 
         for col in self.columns:
@@ -149,17 +135,76 @@ class ReportViewerFrame(ctk.CTkFrame):
 
     def refresh_table(self, data):
         self.tree.delete(*self.tree.get_children())
+        self.append_rows(data)
+
+    def append_rows(self, data):
         for row in data:
             values = [row.get(col, '') for col in self.columns]
             
-            status = row.get("Status", "").lower()
+            status = (row.get("Status") or "").lower()
             tag = "status_pending" if status == "pending" else "status_completed" if status == "completed" else "neutral"
             self.tree.insert('', 'end', values=values, tags=(tag,))
-        self.tree.tag_configure("status_pending", background="#ffe5e5")
-        self.tree.tag_configure("status_completed", background="#e6ffe6")
-        self.tree.tag_configure("neutral", background="#f2f2f2")
+
+    def _on_tree_yscroll(self, first, last):
+        """Treeview scroll hook: fetches the next page once the view nears the bottom of what's loaded."""
+        self.y_scroll.set(first, last)
+        if float(last) >= 0.9 and self.vm.has_more_pages and not self._loading_page:
+            self._loading_page = True
+            # Defer so the fetch doesn't run inside the Treeview's own redraw
+            self.after_idle(self._load_next_page)
+
+    def _load_next_page(self):
+        try:
+            self.append_rows(self.vm.load_next_page())
+            self._update_row_count()
+        finally:
+            self._loading_page = False
+
+    def _update_row_count(self):
+        loaded = len(self.vm.filtered_transactions)
+        total = self.vm.filtered_total
+        text = f"{total} transactions" if loaded >= total else f"Showing {loaded} of {total} transactions (scroll for more)"
+        self.row_count_label.configure(text=text)
+
+    def _schedule_live_search(self, event=None):
+        """Debounces keystrokes: the search runs once typing pauses for LIVE_SEARCH_DELAY_MS."""
+        if event is not None and event.keysym in ("Return", "KP_Enter"):
+            return  # Handled by the <Return> binding
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(self.LIVE_SEARCH_DELAY_MS, self._run_live_search)
+
+    def _run_live_search(self):
+        self._search_after_id = None
+        keyword = self.search_var.get().strip()
+        column = self.filter_var.get()
+        date = self.date_var.get()
+        if not keyword:
+            column = None
+            keyword = None
+
+        if keyword and self.vm.refine_in_memory(column, keyword, date):
+            self.live_search.cancel()
+            self._show_filtered_rows()
+            return
+        self.row_count_label.configure(text="Searching...")
+        self.vm.start_live_search(self.live_search, column, keyword, date,
+                                  on_done=self._show_filtered_rows,
+                                  on_error=self._on_live_search_error)
+
+    def _show_filtered_rows(self):
+        self.refresh_table(self.vm.filtered_transactions)
+        self.tree.yview_moveto(0)
+        self._update_row_count()
+
+    def _on_live_search_error(self, error):
+        self.row_count_label.configure(text=f"Search failed: {error}")
 
     def perform_combined_filter(self):
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        self.live_search.cancel()
         keyword = self.search_var.get()
         column = self.filter_var.get()
         date = self.date_var.get()
@@ -169,11 +214,15 @@ class ReportViewerFrame(ctk.CTkFrame):
             keyword = None
 
         try:
-            self.vm.load_combined_filtered_transactions(column, keyword, date)
+            self.vm.load_first_page(column, keyword, date)
             self.refresh_table(self.vm.filtered_transactions)
+            self.tree.yview_moveto(0)
         except ValueError as e:
             messagebox.showerror("Search Error", str(e))
+            self.vm.filtered_transactions = []
+            self.vm.filtered_total = 0
             self.refresh_table([])
+        self._update_row_count()
 
     def clear_search(self):
         self.search_var.set("")
@@ -181,6 +230,56 @@ class ReportViewerFrame(ctk.CTkFrame):
         self.date_var.set("All Dates")
         self.perform_combined_filter()
 
+    def show_summary(self):
+        """Totals for the selected date, grouped by day, customer, material, vehicle type or status."""
+        window = ctk.CTkToplevel(self)
+        window.title("Transaction Summary")
+        window.geometry("620x420")
+
+        controls = ctk.CTkFrame(window, fg_color="transparent")
+        controls.pack(fill="x", padx=10, pady=10)
+        ctk.CTkLabel(controls, text="Group by:").pack(side="left", padx=5)
+        group_var = ctk.StringVar(value="day")
+        status_label = ctk.CTkLabel(controls, text="")
+
+        columns = ("Key", "TotalTransactions", "TotalNetWeight", "TotalCharges")
+        tree = ttk.Treeview(window, columns=columns, show="headings")
+        for col in columns:
+            tree.heading(col, text=col)
+            tree.column(col, width=140, anchor="center")
+        tree.pack(expand=True, fill="both", padx=10, pady=(0, 10))
+
+        def show(groups):
+            if not window.winfo_exists():
+                return
+            status_label.configure(text="")
+            tree.delete(*tree.get_children())
+            for group in groups:
+                tree.insert('', 'end', values=("" if group["Key"] is None else group["Key"],
+                                               group["TotalTransactions"],
+                                               f"{group['TotalNetWeight']:,.2f}",
+                                               f"{group['TotalCharges']:,.2f}"))
+
+        def failed(error):
+            if window.winfo_exists():
+                status_label.configure(text="")
+                messagebox.showerror("Summary Error", str(error), parent=window)
+
+        def load(*_):
+            date = self.date_var.get()
+            date_from = date_to = None
+            if date and date != "All Dates":
+                date_from = date
+                date_to = (datetime.date.fromisoformat(date) + datetime.timedelta(days=1)).isoformat()
+            status_label.configure(text="Loading...")
+            self.vm.start_snapshot_summary(self.summary_executor, group_var.get(), date_from=date_from,
+                                           date_to=date_to, on_done=show, on_error=failed)
+
+        ctk.CTkOptionMenu(controls, variable=group_var, command=load,
+                          values=["day", "customer", "material", "vehicle_type", "status"]).pack(side="left", padx=5)
+        status_label.pack(side="left", padx=10)
+        load()
+
     def export_data(self):
         export_options = [("Excel file", "*.xlsx"), ("CSV file", "*.csv"), ("PDF file", "*.pdf")]
         file = filedialog.asksaveasfilename(title="Export Transactions",
@@ -189,33 +288,67 @@ class ReportViewerFrame(ctk.CTkFrame):
         if not file:
             return
         
-        rows_to_export = self.vm.filtered_transactions or []
-        if not rows_to_export:
+        if not self.vm.filtered_transactions:
             messagebox.showwarning("No Data", "There is no data to export.")
             return
-        
-        df = pd.DataFrame(rows_to_export, columns=self.columns)
 
         ext = os.path.splitext(file)[1].lower()
-        try:
-            if ext == ".csv":
-                df.to_csv(file, index=False)
-            elif ext == ".xlsx":
-                df.to_excel(file, index=False)
-            elif ext == ".pdf":
-                messagebox.showwarning(
-                    "Layout Warning",
-                    "The PDF format may not display all columns cleanly due to wide layouts.\n\n"
-                    "Large datasets or long fields like 'Remarks' and 'Timestamps' could be truncated or split across pages.\n"
-                    "For best results, consider exporting to Excel or CSV instead.\n\n"
-                    "PDF will attempt intelligent column splitting, but readability may vary."
-                )
-                export_to_pdf(file, df.to_dict('records'))
-            else:
-                raise ValueError("Unsupported format")
-            messagebox.showinfo("Export Complete", f"Exported to:\n{file}")
-        except Exception as e:
-            messagebox.showerror("Export Error", str(e))
+        if ext not in (".csv", ".xlsx", ".pdf"):
+            messagebox.showerror("Export Error", "Unsupported format")
+            return
+        if ext == ".pdf":
+            messagebox.showwarning(
+                "Layout Warning",
+                "The PDF format may not display all columns cleanly due to wide layouts.\n\n"
+                "Large datasets or long fields like 'Remarks' and 'Timestamps' could be truncated or split across pages.\n"
+                "For best results, consider exporting to Excel or CSV instead.\n\n"
+                "PDF will attempt intelligent column splitting, but readability may vary."
+            )
+
+        # Rows are streamed from SQLite on the export worker; callbacks come back on the Tk thread
+        self.vm.start_export(file, ext,
+                             on_progress=self._on_export_progress,
+                             on_done=self._on_export_done,
+                             on_error=self._on_export_error,
+                             on_cancelled=self._on_export_cancelled)
+        self._set_export_status(f"Export queued: {os.path.basename(file)}", busy=True)
+
+    def cancel_export(self):
+        self.export_runner.cancel_all()
+        self._set_export_status("Cancelling export...", busy=True)
+
+    def _set_export_status(self, text, busy=False):
+        if not hasattr(self, "export_status_label"):
+            return
+        queued = self.export_runner.pending_count
+        if queued and text:
+            text = f"{text} ({queued} queued)"
+        self.export_status_label.configure(text=text)
+        busy = busy or queued > 0
+        if busy and not self.cancel_export_button.winfo_ismapped():
+            self.cancel_export_button.pack(side="left", padx=5, after=self.export_status_label)
+        elif not busy and self.cancel_export_button.winfo_ismapped():
+            self.cancel_export_button.pack_forget()
+
+    def _on_export_progress(self, job, percent):
+        self._set_export_status(f"Exporting {os.path.basename(job.output_path)}: {percent}%", busy=True)
+
+    def _on_export_done(self, job, rows_written):
+        self._set_export_status("")
+        messagebox.showinfo("Export Complete", f"Exported {rows_written} rows to:\n{job.output_path}")
+
+    def _on_export_error(self, job, error):
+        self._set_export_status("")
+        messagebox.showerror("Export Error", str(error))
+
+    def _on_export_cancelled(self, job):
+        self._set_export_status("Export cancelled")
+
+    def destroy(self):
+        self.export_runner.shutdown(wait=False)
+        self.live_search.shutdown()
+        self.summary_executor.shutdown(wait=False)
+        super().destroy()
     
     def show_context_menu(self, event):
         try:
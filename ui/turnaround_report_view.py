@@ -0,0 +1,72 @@
+import tkinter.ttk as ttk
+from tkinter import messagebox
+
+import customtkinter as ctk
+
+from viewmodels.turnaround_viewmodel import TurnaroundViewModel
+
+
+class TurnaroundReportFrame(ctk.CTkFrame):
+    """Minutes between first and second weighing, as percentiles, plus the trucks still inside the yard."""
+    IN_YARD_COLUMNS = ("VehicleNumber", "CustomerName", "MaterialName", "FirstWeightTimestamp", "MinutesInYard")
+
+    def __init__(self, parent, user_permissions, db_path="weighbridge.db"):
+        super().__init__(parent, fg_color="white")
+        self.user_permissions = user_permissions
+        self.vm = TurnaroundViewModel(db_path)
+        self._build_ui()
+        self.run_report()
+
+    def _build_ui(self):
+        ctk.CTkLabel(self, text="⏱️ Truck Turnaround", font=ctk.CTkFont(size=22, weight="bold")).pack(anchor="w", padx=20, pady=(20, 10))
+
+        controls = ctk.CTkFrame(self, fg_color="transparent")
+        controls.pack(pady=5, padx=10, fill="x")
+        ctk.CTkLabel(controls, text="Group by:").pack(side="left", padx=5)
+        self.group_var = ctk.StringVar(value="hour")
+        ctk.CTkOptionMenu(controls, variable=self.group_var, values=self.vm.group_choices, width=130).pack(side="left", padx=2)
+        ctk.CTkLabel(controls, text="From (YYYY-MM-DD):").pack(side="left", padx=(15, 5))
+        self.date_from_var = ctk.StringVar()
+        ctk.CTkEntry(controls, textvariable=self.date_from_var, width=110).pack(side="left", padx=2)
+        ctk.CTkLabel(controls, text="To:").pack(side="left", padx=5)
+        self.date_to_var = ctk.StringVar()
+        ctk.CTkEntry(controls, textvariable=self.date_to_var, width=110).pack(side="left", padx=2)
+        ctk.CTkButton(controls, text="Run", command=self.run_report).pack(side="left", padx=(20, 5))
+
+        ctk.CTkLabel(self, text="Dwell time (minutes)", anchor="w").pack(fill="x", padx=12)
+        self.percentile_tree = self._make_tree(self.vm.percentile_columns, height=10)
+
+        self.in_yard_label = ctk.CTkLabel(self, text="", anchor="w")
+        self.in_yard_label.pack(fill="x", padx=12, pady=(10, 0))
+        self.in_yard_tree = self._make_tree(self.IN_YARD_COLUMNS, height=8)
+
+    def _make_tree(self, columns, height):
+        tree = ttk.Treeview(self, columns=columns, show="headings", height=height)
+        for col in columns:
+            tree.heading(col, text=col)
+            tree.column(col, width=120, anchor="center")
+        tree.pack(expand=True, fill="both", padx=10, pady=5)
+        return tree
+
+    @staticmethod
+    def _fill(tree, columns, rows):
+        tree.delete(*tree.get_children())
+        for row in rows:
+            values = []
+            for col in columns:
+                value = row.get(col)
+                values.append(f"{value:,.1f}" if isinstance(value, float) else ("" if value is None else value))
+            tree.insert('', 'end', values=values)
+
+    def run_report(self):
+        try:
+            self.vm.load_percentiles(self.group_var.get(),
+                                     date_from=self.date_from_var.get().strip() or None,
+                                     date_to=self.date_to_var.get().strip() or None)
+            self.vm.load_in_yard()
+        except ValueError as e:
+            messagebox.showerror("Turnaround", str(e))
+            return
+        self._fill(self.percentile_tree, self.vm.percentile_columns, self.vm.percentiles)
+        self._fill(self.in_yard_tree, self.IN_YARD_COLUMNS, self.vm.in_yard)
+        self.in_yard_label.configure(text=f"🚚 In yard now: {len(self.vm.in_yard)}")
@@ -0,0 +1,79 @@
+"""
+Numbers in words for receipts, in Indian numbering (thousand, lakh, crore).
+
+Wording follows num2words(lang="en_IN"): groups are separated by commas and a
+trailing part below one hundred is joined with AND.
+
+    >>> weight_words(1234567)
+    'TWELVE LAKH, THIRTY-FOUR THOUSAND, FIVE HUNDRED AND SIXTY-SEVEN'
+    >>> weight_words(1001)
+    'ONE THOUSAND AND ONE'
+    >>> weight_words(18.25)
+    'EIGHTEEN POINT TWO FIVE'
+"""
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+
+_ONES = ("ZERO", "ONE", "TWO", "THREE", "FOUR", "FIVE", "SIX", "SEVEN", "EIGHT", "NINE", "TEN",
+         "ELEVEN", "TWELVE", "THIRTEEN", "FOURTEEN", "FIFTEEN", "SIXTEEN", "SEVENTEEN", "EIGHTEEN", "NINETEEN")
+_TENS = ("", "", "TWENTY", "THIRTY", "FORTY", "FIFTY", "SIXTY", "SEVENTY", "EIGHTY", "NINETY")
+# (divisor, name) from the largest group down; anything above 99 crore repeats the crore group
+_GROUPS = ((10_000_000, "CRORE"), (100_000, "LAKH"), (1_000, "THOUSAND"))
+
+
+def _below_hundred(n):
+    if n < 20:
+        return _ONES[n]
+    tens, ones = divmod(n, 10)
+    return _TENS[tens] + (f"-{_ONES[ones]}" if ones else "")
+
+
+def _below_thousand(n):
+    hundreds, rest = divmod(n, 100)
+    if not hundreds:
+        return _below_hundred(rest)
+    words = f"{_ONES[hundreds]} HUNDRED"
+    return f"{words} AND {_below_hundred(rest)}" if rest else words
+
+
+@lru_cache(maxsize=4096)
+def integer_words(n: int) -> str:
+    """Words for a whole number, e.g. 250000 -> 'TWO LAKH, FIFTY THOUSAND'."""
+    if n < 0:
+        return "MINUS " + integer_words(-n)
+    if n < 1000:
+        return _below_thousand(n)
+    parts = []
+    for divisor, name in _GROUPS:
+        if n >= divisor:
+            count, n = divmod(n, divisor)
+            parts.append(f"{integer_words(count)} {name}")
+    words = ", ".join(parts)
+    if n >= 100:
+        words += ", " + _below_thousand(n)
+    elif n:
+        words += " AND " + _below_hundred(n)
+    return words
+
+
+@lru_cache(maxsize=4096)
+def weight_words(value, decimals=3) -> str:
+    """
+    Words for a weight, keeping up to `decimals` fractional digits read out
+    digit by digit ('POINT TWO FIVE'); trailing zeros are dropped, so 18000.0
+    reads 'EIGHTEEN THOUSAND'. Values repeat heavily within a shift, hence the cache.
+    """
+    try:
+        amount = Decimal(str(value if value is not None else 0))
+    except InvalidOperation:
+        raise ValueError(f"Not a number: {value!r}")
+    if not amount.is_finite(): # NaN / infinity would make round() raise InvalidOperation
+        raise ValueError(f"Not a finite number: {value!r}")
+    amount = round(amount, decimals)
+    sign, amount = ("MINUS " if amount < 0 else ""), abs(amount)
+    whole = int(amount)
+    fraction = format(amount - whole, "f").rstrip("0").partition(".")[2]
+    words = integer_words(whole)
+    if fraction:
+        words += " POINT " + " ".join(_ONES[int(digit)] for digit in fraction)
+    return sign + words
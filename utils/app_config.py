@@ -0,0 +1,163 @@
+import os
+import json
+import time
+import logging
+import threading
+from types import MappingProxyType
+from collections.abc import Mapping
+
+from resource_utils import resource_path, writable_path
+
+CONFIG_FILE = "config.json"
+
+_DEFAULTS = {
+    "database_path": "weighbridge.db",
+    "sumatra_path": "SumatraPDFcopy/SumatraPDF.exe",
+    "receipt_template": "receipt_template.json",
+    "print_backend": "sumatra",
+    "print_drop_folder": "print_drop",
+    "receipt_store_folder": "receipts/store",
+    "receipt_store_max_mb": 200,
+    "receipt_store_max_age_days": 30,
+    "escpos_columns": 48,
+    "escpos_encoding": "cp437",
+}
+# Keys holding file/folder paths relative to the application folder (bundled, read-only in a build)
+_PATH_KEYS = ("database_path", "sumatra_path", "receipt_template")
+# Folders the app writes to, relative to the application data directory the database lives in
+_WRITABLE_PATH_KEYS = ("print_drop_folder", "receipt_store_folder")
+_NUMBER_KEYS = ("receipt_store_max_mb", "receipt_store_max_age_days", "escpos_columns")
+_PRINT_BACKENDS = ("sumatra", "lp", "file", "escpos")
+
+
+class ConfigError(ValueError):
+    """config.json is missing, unreadable or has invalid values."""
+
+
+class AppConfig(Mapping):
+    """
+    Read-only view of config.json with defaults applied and paths resolved
+    through resource_path() and writable_path(). Behaves like the dict the old
+    load_config() returned (config["sumatra_path"], config.get(...)), but
+    cannot be modified, so one instance can be shared by every thread.
+    """
+    def __init__(self, values, mtime=None):
+        self._values = MappingProxyType(dict(values))
+        self.mtime = mtime
+
+    def __getitem__(self, key):
+        return self._values[key]
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __repr__(self):
+        return f"AppConfig({dict(self._values)!r})"
+
+    @classmethod
+    def from_file(cls, path):
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            raise ConfigError(f"❌ Missing {os.path.basename(path)} file.")
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            raise ConfigError(f"Error reading {os.path.basename(path)}: {e}")
+        return cls(validate(raw), mtime)
+
+
+def validate(raw):
+    """Applies defaults, checks types and allowed values, and resolves paths. Returns a new dict."""
+    if not isinstance(raw, dict):
+        raise ConfigError("config.json must contain a JSON object")
+    values = dict(_DEFAULTS)
+    values.update(raw)
+    for keys, resolve in ((_PATH_KEYS, resource_path), (_WRITABLE_PATH_KEYS, writable_path)):
+        for key in keys:
+            if key in values:
+                if not isinstance(values[key], str) or not values[key].strip():
+                    raise ConfigError(f"config.json: '{key}' must be a non-empty path")
+                values[key] = resolve(values[key])
+    for key in _NUMBER_KEYS:
+        if isinstance(values[key], bool) or not isinstance(values[key], (int, float)) or values[key] < 0:
+            raise ConfigError(f"config.json: '{key}' must be a number >= 0")
+    if values["print_backend"] not in _PRINT_BACKENDS:
+        raise ConfigError(f"config.json: 'print_backend' must be one of {list(_PRINT_BACKENDS)}, "
+                          f"got {values['print_backend']!r}")
+    if values["print_backend"] == "escpos" and not values.get("escpos_device"):
+        raise ConfigError("config.json: 'escpos_device' is required for the escpos backend "
+                          "(e.g. COM3 with 'escpos_baudrate', /dev/usb/lp0, or a file)")
+    return values
+
+
+class ConfigService:
+    """
+    Loads config.json once and hands out the same immutable AppConfig until the
+    file changes. The file's mtime is checked at most every `check_interval`
+    seconds; a changed file is re-read and validated, and an invalid edit keeps
+    the last good config (logged) instead of breaking printing mid-shift.
+    Callers can compare AppConfig objects by identity to see whether anything
+    changed.
+    """
+    def __init__(self, path=None, check_interval=2.0):
+        self.path = path or resource_path(CONFIG_FILE)
+        self.check_interval = check_interval
+        self._config = None
+        self._rejected_mtime = None
+        self._last_check = 0.0
+        self._lock = threading.Lock()
+
+    def get(self) -> AppConfig:
+        with self._lock:
+            now = time.monotonic()
+            if self._config is None:
+                self._config = AppConfig.from_file(self.path)
+                self._last_check = now
+            elif now - self._last_check >= self.check_interval:
+                self._last_check = now
+                self._reload_if_changed()
+            return self._config
+
+    def reload(self) -> AppConfig:
+        """Forces a re-read (e.g. after saving settings from the UI)."""
+        with self._lock:
+            self._config = AppConfig.from_file(self.path)
+            self._last_check = time.monotonic()
+            return self._config
+
+    def _reload_if_changed(self):
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            return
+        if mtime in (self._config.mtime, self._rejected_mtime):
+            return
+        try:
+            self._config = AppConfig.from_file(self.path)
+            logging.info(f"ConfigService: reloaded {self.path}")
+        except ConfigError as e:
+            self._rejected_mtime = mtime # Don't re-read the same bad edit every check
+            logging.error(f"ConfigService: keeping previous config, {e}")
+
+
+_service = None
+_service_lock = threading.Lock()
+
+
+def config_service() -> ConfigService:
+    """The application-wide ConfigService."""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = ConfigService()
+        return _service
+
+
+def get_config() -> AppConfig:
+    """Current application config; cheap enough to call on every print."""
+    return config_service().get()
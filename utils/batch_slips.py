@@ -0,0 +1,196 @@
+"""
+Day-end slip packs: renders weighbridge slips for a date range / customer
+either into one multi-page PDF or into one PDF per customer.
+
+Run from the project root:
+    python -m utils.batch_slips --from 2024-05-01 --to 2024-05-31 [--customer 12] [--per-customer] [--workers 4]
+"""
+import os
+import re
+import time
+import sqlite3
+import argparse
+import itertools
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from Model.WeighingTransactionModel import WeighingTransaction
+from Model.report_model import day_bounds
+from repositories.master_data_resolver import get_resolver
+from resource_utils import resource_path
+
+DEFAULT_COMPANY = {
+    "name": "AGM BLUE METALS",
+    "address": "144/1-C, Karanampettai, COIMBATORE, TAMILNADU, 641401.",
+    "phone": "-",
+    "email": "-",
+}
+
+_SELECT_COLUMNS = ", ".join(f"WT.{col}" for col in WeighingTransaction.DB_COLUMNS)
+
+# One slip generator per worker process; reportlab styles are built once, not per customer
+_worker_generator = None
+
+
+def _slip_generator(company, output_dir, resolver):
+    from print_log import WeighbridgeSlipGenerator
+
+    return WeighbridgeSlipGenerator(company_name=company["name"], company_address=company["address"],
+                                    company_phone=company["phone"], company_email=company["email"],
+                                    output_dir=output_dir, resolver=resolver)
+
+
+def _init_worker(company, output_dir, resolver):
+    """Runs once per pool process; the resolver arrives as a preloaded snapshot."""
+    global _worker_generator
+    _worker_generator = _slip_generator(company, output_dir, resolver)
+
+
+def _render_pack(output_filename, rows):
+    """Process-pool entry point: rows are DB tuples in WeighingTransaction.DB_COLUMNS order."""
+    path = _worker_generator.generate_batch_pdf((WeighingTransaction.from_row(row) for row in rows), output_filename)
+    return path, len(rows)
+
+
+def _safe_filename(text):
+    return re.sub(r"[^A-Za-z0-9_-]+", "_", str(text)).strip("_") or "unknown"
+
+
+class BatchSlipGenerator:
+    """
+    Streams matching transactions from the database in chunks and renders them.
+
+    A single pack is laid out in this process (one reportlab document can't be
+    split across processes without a PDF merge library). Per-customer packs are
+    independent documents, so they are rendered in parallel on a process pool;
+    each worker receives only its customer's rows.
+
+    progress(done, total, elapsed_seconds) is called as slips are rendered.
+    """
+    def __init__(self, db_path="weighbridge.db", company=None, output_dir="receipts", workers=None, chunk_size=500,
+                 resolver=None):
+        self.db_path = resource_path(db_path)
+        self.resolver = resolver or get_resolver(db_path)
+        self.company = dict(DEFAULT_COMPANY, **(company or {}))
+        self.output_dir = output_dir
+        self.workers = workers
+        self.chunk_size = chunk_size
+        os.makedirs(self.output_dir, exist_ok=True)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @staticmethod
+    def _filter(date_from=None, date_to=None, customer_id=None):
+        conditions, params = ["WT.Status = 'Completed'"], []
+        start, end = day_bounds(date_from, date_to)
+        if start:
+            conditions.append("WT.FirstWeightTimestamp >= ?")
+            params.append(start)
+        if end:
+            conditions.append("WT.FirstWeightTimestamp < ?")
+            params.append(end)
+        if customer_id is not None:
+            conditions.append("WT.CustomerId = ?")
+            params.append(customer_id)
+        return " AND ".join(conditions), params
+
+    def count(self, date_from=None, date_to=None, customer_id=None):
+        where, params = self._filter(date_from, date_to, customer_id)
+        with self._connect() as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM WeighingTransactions WT WHERE {where}", params).fetchone()[0]
+
+    def iter_rows(self, date_from=None, date_to=None, customer_id=None, by_customer=False):
+        """Yields plain row tuples in DB_COLUMNS order, fetched chunk_size at a time."""
+        where, params = self._filter(date_from, date_to, customer_id)
+        order = "WT.CustomerId, WT.FirstWeightTimestamp, WT.Id" if by_customer else "WT.FirstWeightTimestamp, WT.Id"
+        conn = sqlite3.connect(self.db_path)
+        try:
+            cursor = conn.execute(f"SELECT {_SELECT_COLUMNS} FROM WeighingTransactions WT WHERE {where} ORDER BY {order}",
+                                  params)
+            while True:
+                rows = cursor.fetchmany(self.chunk_size)
+                if not rows:
+                    return
+                yield from rows
+        finally:
+            conn.close()
+
+    def generate(self, date_from=None, date_to=None, customer_id=None, per_customer=False, progress=None):
+        """
+        Renders the pack(s). Returns a summary dict:
+            {"files": [...], "slips": n, "seconds": s, "slips_per_second": r}
+        """
+        total = self.count(date_from, date_to, customer_id)
+        started = time.perf_counter()
+        label = f"{date_from or 'start'}_to_{date_to or 'today'}"
+        if per_customer:
+            files, done = self._generate_per_customer(date_from, date_to, customer_id, label, total, started, progress)
+        else:
+            generator = _slip_generator(self.company, self.output_dir, self.resolver)
+            rows = self.iter_rows(date_from, date_to, customer_id)
+            report = (lambda n: progress(n, total, time.perf_counter() - started)) if progress else None
+            path = generator.generate_batch_pdf((WeighingTransaction.from_row(row) for row in rows),
+                                                f"slips_{_safe_filename(label)}.pdf", progress=report)
+            files, done = [path], total
+        seconds = time.perf_counter() - started
+        summary = {"files": files, "slips": done, "seconds": seconds,
+                   "slips_per_second": done / seconds if seconds else 0.0}
+        print(f"[DEBUG] BatchSlipGenerator: {done} slips in {len(files)} file(s), "
+              f"{seconds:.1f}s ({summary['slips_per_second']:.1f} slips/s)")
+        return summary
+
+    def _generate_per_customer(self, date_from, date_to, customer_id, label, total, started, progress):
+        names = self.resolver.customers()
+        rows = self.iter_rows(date_from, date_to, customer_id, by_customer=True)
+        customer_index = WeighingTransaction.DB_COLUMNS.index("CustomerId")
+        files, done = [], 0
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                 initargs=(self.company, self.output_dir, self.resolver)) as pool:
+            futures = []
+            for cid, group in itertools.groupby(rows, key=lambda row: row[customer_index]):
+                # The id keeps customers that share a name (or sanitise to the same one) apart
+                name = names.get(cid, "customer")
+                filename = f"slips_{cid}_{_safe_filename(name)}_{_safe_filename(label)}.pdf"
+                futures.append(pool.submit(_render_pack, filename, list(group)))
+            for future in as_completed(futures):
+                path, count = future.result()
+                files.append(path)
+                done += count
+                if progress:
+                    progress(done, total, time.perf_counter() - started)
+        return sorted(files), done
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db", default="weighbridge.db")
+    parser.add_argument("--from", dest="date_from")
+    parser.add_argument("--to", dest="date_to")
+    parser.add_argument("--customer", type=int, help="Customer Id")
+    parser.add_argument("--per-customer", action="store_true", help="One PDF per customer instead of one pack")
+    parser.add_argument("--workers", type=int, default=None, help="Processes for --per-customer (default: CPU count)")
+    parser.add_argument("--output-dir", default="receipts")
+    args = parser.parse_args()
+
+    from utils.app_config import get_config, ConfigError
+    try:
+        company = get_config().get("company")
+    except ConfigError:
+        company = None
+
+    def report(done, total, elapsed):
+        rate = done / elapsed if elapsed else 0.0
+        print(f"\r{done}/{total} slips, {rate:.1f} slips/s", end="", flush=True)
+
+    generator = BatchSlipGenerator(args.db, company=company, output_dir=args.output_dir, workers=args.workers)
+    summary = generator.generate(args.date_from, args.date_to, args.customer, args.per_customer, progress=report)
+    print()
+    for path in summary["files"]:
+        print(f"📄 {path}")
+    print(f"✅ {summary['slips']} slips in {summary['seconds']:.1f}s ({summary['slips_per_second']:.1f} slips/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+import queue
+import logging
+import threading
+from concurrent.futures import Future
+
+from utils.ui_dispatch import UiDispatcher
+
+_STOP = object()
+
+
+class DbExecutor:
+    """
+    Single background thread that owns a database resource and runs commands
+    against it one at a time, in submission order.
+
+    sqlite3 connections cannot be shared across threads, so the resource
+    (typically a repository) is built by `factory` on the worker thread itself.
+    Commands are plain callables taking that resource as their first argument:
+
+        executor.submit(lambda repo: repo.update(txn),
+                        on_success=..., on_error=...)
+
+    Each submit() returns a concurrent.futures.Future. on_success / on_error
+    are invoked on the Tk thread through the UiDispatcher, so they may update
+    widgets and tk variables freely.
+
+    Whenever the queue goes idle the worker calls the resource's flush() (if it
+    has one), so repositories using group commit never sit on unsaved writes.
+    A command that leaves writes pending (has_pending_writes) is not reported
+    as successful until they are committed: its future and on_success are held
+    back until the flush, and get the flush error instead if the commit fails.
+    """
+    def __init__(self, factory, dispatcher: UiDispatcher = None, name="db-executor", idle_flush_interval=0.2):
+        self._factory = factory
+        self.idle_flush_interval = idle_flush_interval
+        self.dispatcher = dispatcher or UiDispatcher()
+        self._commands = queue.Queue()
+        self._resource = None
+        self._awaiting_commit = [] # (future, result, on_success, on_error) of uncommitted writes
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._started = False
+        self._lock = threading.Lock()
+
+    def start(self):
+        with self._lock:
+            if not self._started:
+                self._started = True
+                self._thread.start()
+        return self
+
+    def attach(self, widget):
+        """Marshals completion callbacks onto `widget`'s Tk main loop."""
+        self.dispatcher.attach(widget)
+        return self
+
+    def submit(self, fn, *args, on_success=None, on_error=None, **kwargs) -> Future:
+        """Queues `fn(resource, *args, **kwargs)` for the worker thread."""
+        self.start()
+        future = Future()
+        self._commands.put((future, fn, args, kwargs, on_success, on_error))
+        return future
+
+    def shutdown(self, wait=True, timeout=5.0):
+        """Stops the worker once all queued commands have run."""
+        if not self._started:
+            return
+        self._commands.put(_STOP)
+        if wait:
+            self._thread.join(timeout=timeout)
+            if self._thread.is_alive():
+                logging.warning("DbExecutor: worker did not stop within %.1fs", timeout)
+        self.dispatcher.detach()
+
+    def _run(self):
+        try:
+            self._resource = self._factory()
+        except Exception as e:
+            logging.exception("DbExecutor: failed to initialise database resource")
+            self._fail_all(e)
+            return
+
+        while True:
+            try:
+                item = self._commands.get(timeout=self.idle_flush_interval)
+            except queue.Empty:
+                self._flush_resource()
+                continue
+            if item is _STOP:
+                break
+            future, fn, args, kwargs, on_success, on_error = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(self._resource, *args, **kwargs)
+            except Exception as e:
+                logging.error(f"DbExecutor: command failed: {e}")
+                self.dispatcher.post(on_error, e)
+                future.set_exception(e)
+            else:
+                if self._has_pending_writes():
+                    self._awaiting_commit.append((future, result, on_success, on_error))
+                else:
+                    self._release_committed()
+                    self.dispatcher.post(on_success, result)
+                    future.set_result(result)
+
+        self._flush_resource()
+        conn = getattr(self._resource, "conn", None)
+        if conn is not None:
+            conn.close()
+
+    def _has_pending_writes(self):
+        """A resource with flush() may hold writes back unless its has_pending_writes says otherwise."""
+        return getattr(self._resource, "flush", None) is not None and getattr(self._resource, "has_pending_writes", True)
+
+    def _flush_resource(self):
+        if not self._has_pending_writes():
+            self._release_committed()
+            return
+        try:
+            self._resource.flush()
+        except Exception as e:
+            logging.error(f"DbExecutor: flush failed: {e}")
+            self._release_committed(error=e)
+        else:
+            self._release_committed()
+
+    def _release_committed(self, error=None):
+        """Reports commands held back by group commit, once their writes are committed (or lost)."""
+        held, self._awaiting_commit = self._awaiting_commit, []
+        for future, result, on_success, on_error in held:
+            if error is None:
+                self.dispatcher.post(on_success, result)
+                future.set_result(result)
+            else:
+                self.dispatcher.post(on_error, error)
+                future.set_exception(error)
+
+    def _fail_all(self, error):
+        """Fails every queued command when the resource could not be created."""
+        while True:
+            item = self._commands.get()
+            if item is _STOP:
+                return
+            future, _, _, _, _, on_error = item
+            if future.set_running_or_notify_cancel():
+                self.dispatcher.post(on_error, error)
+                future.set_exception(error)
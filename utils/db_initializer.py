@@ -1,3 +1,4 @@
+import os
 import sqlite3
 from resource_utils import resource_path
 
@@ -6,6 +7,11 @@ DB_NAME = "weighbridge.db"
 SCHEMA_FOLDER = "database/schema"
 SEED_FOLDER = "database/seed"
 
+def load_schema(filename):
+    """Text of one schema script, e.g. load_schema("create_print_jobs.sql")."""
+    with open(resource_path(os.path.join(SCHEMA_FOLDER, filename)), "r", encoding="utf-8") as f:
+        return f.read()
+
 def run_sql_scripts_from(folder):
     conn = sqlite3.connect(DB_NAME)
     cursor = conn.cursor()
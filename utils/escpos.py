@@ -0,0 +1,85 @@
+from utils.receipt_template import receipt_fields
+
+ESC = b"\x1b"
+GS = b"\x1d"
+
+INIT = ESC + b"@"
+ALIGN = {"left": ESC + b"a\x00", "center": ESC + b"a\x01", "right": ESC + b"a\x02"}
+BOLD_ON = ESC + b"E\x01"
+BOLD_OFF = ESC + b"E\x00"
+DOUBLE_SIZE = GS + b"!\x11"
+NORMAL_SIZE = GS + b"!\x00"
+FEED_AND_CUT = ESC + b"d\x04" + GS + b"V\x42\x00" # Feed 4 lines, partial cut
+
+
+class EscPosRenderer:
+    """
+    Lays out a ReceiptTemplate for a thermal printer as a raw ESC/POS byte stream.
+
+    The template's PDF coordinates become text rows: elements are grouped by y
+    (top of the page first), a "left" and a "right" element on the same row are
+    padded to the paper width (or split over two rows if they don't fit),
+    "center" uses the printer's own alignment and "line" elements print as a
+    rule of dashes. Bold fonts map to emphasised text and sizes of 14pt and up
+    to double width/height. The static rows are encoded once here; render()
+    only formats the field rows. One copy is printed, followed by a cut.
+    """
+    def __init__(self, template, columns=48, encoding="cp437"):
+        self.template = template
+        self.columns = columns
+        self.encoding = encoding
+        rows = {}
+        for element in template.static:
+            rows.setdefault(element["y"], []).append((element, True))
+        for element in template.fields:
+            rows.setdefault(element["y"], []).append((element, False))
+        self._rows = []
+        for y in sorted(rows, reverse=True):
+            elements = sorted(rows[y], key=lambda item: {"left": 0, "center": 1, "right": 2}.get(item[0].get("x", "left"), 0))
+            if all(is_static for _, is_static in elements):
+                self._rows.append(self._encode_row([(element, element.get("text", "")) for element, _ in elements]))
+            else:
+                self._rows.append(elements)
+        self._header = INIT + ALIGN["left"]
+
+    def _encode(self, text):
+        return text.encode(self.encoding, errors="replace")
+
+    def _encode_row(self, row):
+        """row: [(element, text)] for one y position, ordered left, center, right."""
+        if len(row) == 1 and row[0][0].get("type") == "line":
+            return ALIGN["left"] + self._encode("-" * self.columns) + b"\n"
+
+        out = b""
+        texts = [(element, text) for element, text in row if element.get("type", "text") == "text"]
+        if len(texts) == 2 and texts[0][0].get("x", "left") == "left" and texts[1][0].get("x") == "right":
+            left, right = texts[0][1], texts[1][1]
+            if len(left) + 1 + len(right) <= self.columns:
+                return ALIGN["left"] + self._encode(left + " " * (self.columns - len(left) - len(right)) + right) + b"\n"
+        for element, text in texts:
+            align = element.get("x", "left")
+            style_on, style_off = b"", b""
+            if "Bold" in element.get("font", ""):
+                style_on, style_off = BOLD_ON, BOLD_OFF
+            if element.get("size", 10) >= 14:
+                style_on, style_off = style_on + DOUBLE_SIZE, NORMAL_SIZE + style_off
+            out += ALIGN.get(align, ALIGN["left"]) + style_on + self._encode(text) + style_off + b"\n"
+        return out
+
+    def render(self, transaction: dict) -> bytes:
+        fields = receipt_fields(transaction)
+        parts = [self._header]
+        for row in self._rows:
+            if isinstance(row, bytes):
+                parts.append(row)
+            else:
+                parts.append(self._encode_row([(element, element.get("text", "") if is_static
+                                                 else element["text"].format_map(fields))
+                                               for element, is_static in row]))
+        parts.append(ALIGN["left"] + FEED_AND_CUT)
+        return b"".join(parts)
+
+    def render_to(self, file_path, transaction: dict):
+        with open(file_path, "wb") as f:
+            f.write(self.render(transaction))
+        return file_path
@@ -0,0 +1,162 @@
+import os
+import uuid
+import queue
+import logging
+import itertools
+import threading
+
+from utils.ui_dispatch import UiDispatcher
+
+_STOP = object()
+
+
+class ExportCancelled(Exception):
+    """Raised inside a job when its cancel flag is set."""
+
+
+class ExportJob:
+    """
+    A queued export. `run(job)` does the work and should call job.report() / job.check_cancelled().
+
+    run() writes to job.temp_path, a temporary name next to output_path; the
+    runner renames it over output_path only once the export has succeeded, so
+    a failed or cancelled export leaves an existing file there untouched.
+    """
+    _ids = itertools.count(1)
+
+    def __init__(self, run, description="", output_path=None,
+                 on_progress=None, on_done=None, on_error=None, on_cancelled=None):
+        self.id = next(self._ids)
+        self.run = run
+        self.description = description
+        self.output_path = output_path
+        self.temp_path = (os.path.join(os.path.dirname(output_path) or ".", f".{uuid.uuid4().hex}.tmp")
+                          if output_path else None)
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_cancelled = on_cancelled
+        self.status = "queued" # queued -> running -> done / failed / cancelled
+        self.percent = 0
+        self._cancel = threading.Event()
+        self._dispatcher = None
+
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def check_cancelled(self):
+        if self._cancel.is_set():
+            raise ExportCancelled()
+
+    def publish_output(self):
+        """Moves the finished temporary file into place at output_path."""
+        if self.temp_path and os.path.exists(self.temp_path):
+            os.replace(self.temp_path, self.output_path)
+
+    def discard_output(self):
+        """Removes the temporary file of an export that did not finish."""
+        if self.temp_path and os.path.exists(self.temp_path):
+            try:
+                os.remove(self.temp_path)
+            except OSError as e:
+                logging.warning(f"ExportJob: could not remove partial file {self.temp_path}: {e}")
+
+    def report(self, done, total):
+        """Progress hook for the exporter; posts to the UI only when the whole percentage changes."""
+        self.check_cancelled()
+        if not total:
+            return
+        percent = min(100, int(done * 100 / total))
+        if percent != self.percent:
+            self.percent = percent
+            if self._dispatcher is not None:
+                self._dispatcher.post(self.on_progress, self, percent)
+            elif self.on_progress:
+                self.on_progress(self, percent)
+
+
+class ExportJobRunner:
+    """
+    Runs report exports one at a time on a background thread so the Tk window
+    (and weighing) stays responsive. Jobs queue up in submission order; each can
+    be cancelled while queued or running. Progress and completion callbacks run
+    on the Tk thread through the UiDispatcher, like DbExecutor's.
+    """
+    def __init__(self, dispatcher: UiDispatcher = None, name="report-export"):
+        self.dispatcher = dispatcher or UiDispatcher()
+        self._jobs = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._started = False
+        self._lock = threading.Lock()
+        self.current_job = None
+
+    def attach(self, widget):
+        self.dispatcher.attach(widget)
+        return self
+
+    def submit(self, job: ExportJob):
+        with self._lock:
+            if not self._started:
+                self._started = True
+                self._thread.start()
+        job._dispatcher = self.dispatcher
+        self._jobs.put(job)
+        return job
+
+    @property
+    def pending_count(self):
+        return self._jobs.qsize()
+
+    def cancel_all(self):
+        """Cancels the running job and everything still queued."""
+        if self.current_job is not None:
+            self.current_job.cancel()
+        with self._jobs.mutex:
+            for job in self._jobs.queue:
+                if isinstance(job, ExportJob):
+                    job.cancel()
+
+    def shutdown(self, wait=False, timeout=5.0):
+        self.cancel_all()
+        if self._started:
+            self._jobs.put(_STOP)
+            if wait:
+                self._thread.join(timeout=timeout)
+        self.dispatcher.detach()
+
+    def _run(self):
+        while True:
+            job = self._jobs.get()
+            if job is _STOP:
+                return
+            self.current_job = job
+            try:
+                self._run_job(job)
+            finally:
+                self.current_job = None
+
+    def _run_job(self, job):
+        if job.cancelled:
+            job.status = "cancelled"
+            self.dispatcher.post(job.on_cancelled, job)
+            return
+        job.status = "running"
+        try:
+            result = job.run(job)
+            job.publish_output()
+        except ExportCancelled:
+            job.status = "cancelled"
+            job.discard_output()
+            self.dispatcher.post(job.on_cancelled, job)
+        except Exception as e:
+            logging.error(f"ExportJobRunner: job {job.id} ({job.description}) failed: {e}")
+            job.status = "failed"
+            job.discard_output()
+            self.dispatcher.post(job.on_error, job, e)
+        else:
+            job.status = "done"
+            self.dispatcher.post(job.on_done, job, result)
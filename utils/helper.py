@@ -1,8 +1,8 @@
 import customtkinter as ctk
-import json
 import sqlite3
 from utils.resource_utils import  resource_path  # Your centralized path resolver
 from resource_utils import resource_path
+from utils.app_config import AppConfig, ConfigError
 import os
 
 
@@ -46,10 +46,9 @@ class DiagnosticWindow(ctk.CTkToplevel):
         self.append("Config file present", os.path.exists(config_path))
         if os.path.exists(config_path):
             try:
-                with open(config_path) as f:
-                    json.load(f)
+                AppConfig.from_file(config_path) # Same parsing and validation the printer uses
                 self.append("Config file loaded successfully")
-            except Exception as e:
+            except ConfigError as e:
                 self.append(f"Error parsing config: {e}", success=False)
 
         # PDF Viewer folder
@@ -0,0 +1,96 @@
+import queue
+import sqlite3
+import logging
+import threading
+
+from utils.ui_dispatch import UiDispatcher
+
+_STOP = object()
+
+
+class LatestQueryRunner:
+    """
+    Background reader for search-as-you-type: only the most recently submitted
+    query matters.
+
+    Queries run one at a time on a dedicated thread with its own SQLite
+    connection. Every submit() bumps a generation counter; a progress handler on
+    the connection aborts the running statement as soon as it belongs to an
+    older generation, and queued queries that were superseded before they
+    started are skipped. Results of the latest query are delivered on the Tk
+    thread through the UiDispatcher.
+    """
+    def __init__(self, db_path, dispatcher: UiDispatcher = None, name="live-search", check_every=1000):
+        self.db_path = db_path
+        self.dispatcher = dispatcher or UiDispatcher()
+        self.check_every = check_every # SQLite VM instructions between superseded checks
+        self._generation = 0
+        self._requests = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._started = False
+        self._lock = threading.Lock()
+
+    def attach(self, widget):
+        self.dispatcher.attach(widget)
+        return self
+
+    def submit(self, fn, on_result=None, on_error=None):
+        """Runs fn(conn) for the newest request only; returns its generation number."""
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            if not self._started:
+                self._started = True
+                self._thread.start()
+        self._requests.put((generation, fn, on_result, on_error))
+        return generation
+
+    def cancel(self):
+        """Supersedes whatever is queued or running without starting anything new."""
+        with self._lock:
+            self._generation += 1
+
+    def is_current(self, generation):
+        return generation == self._generation
+
+    def shutdown(self):
+        self.cancel()
+        if self._started:
+            self._requests.put(_STOP)
+        self.dispatcher.detach()
+
+    def _run(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        running = [0]
+        # Non-zero return aborts the statement with OperationalError("interrupted")
+        conn.set_progress_handler(lambda: running[0] != self._generation, self.check_every)
+        try:
+            while True:
+                item = self._requests.get()
+                if item is _STOP:
+                    return
+                generation, fn, on_result, on_error = item
+                if not self.is_current(generation):
+                    continue
+                running[0] = generation
+                try:
+                    result = fn(conn)
+                except sqlite3.OperationalError as e:
+                    if not self.is_current(generation):
+                        continue # Aborted because a newer query arrived
+                    logging.error(f"LatestQueryRunner: query failed: {e}")
+                    self.dispatcher.post(on_error, e)
+                except Exception as e:
+                    logging.error(f"LatestQueryRunner: query failed: {e}")
+                    self.dispatcher.post(on_error, e)
+                else:
+                    if self.is_current(generation):
+                        self.dispatcher.post(self._deliver, generation, on_result, result)
+        finally:
+            conn.close()
+
+    def _deliver(self, generation, on_result, result):
+        # Re-checked on the Tk thread: a newer keystroke may have arrived while this was queued
+        if on_result is not None and self.is_current(generation):
+            on_result(result)
@@ -0,0 +1,128 @@
+import os
+import shutil
+import subprocess
+
+
+class PrintError(Exception):
+    """The backend could not print; the spooler retries these with backoff."""
+
+
+class SumatraPdfBackend:
+    """Silent printing to the default Windows printer through SumatraPDF."""
+    name = "sumatra"
+
+    def __init__(self, sumatra_path, timeout=60):
+        self.sumatra_path = sumatra_path
+        self.timeout = timeout
+
+    def print_file(self, pdf_path):
+        if not os.path.exists(self.sumatra_path):
+            raise PrintError(f"SumatraPDF executable not found: {self.sumatra_path}")
+        try:
+            exit_code = subprocess.call([self.sumatra_path, "-print-to-default", "-silent", pdf_path],
+                                        timeout=self.timeout)
+        except subprocess.TimeoutExpired:
+            raise PrintError(f"SumatraPDF did not finish within {self.timeout}s")
+        if exit_code != 0:
+            raise PrintError(f"SumatraPDF exited with code {exit_code}")
+
+
+class LpBackend:
+    """CUPS `lp` (Linux/macOS). `printer` None means the system default destination."""
+    name = "lp"
+
+    def __init__(self, printer=None, command="lp", timeout=60):
+        self.printer = printer
+        self.command = command
+        self.timeout = timeout
+
+    def print_file(self, pdf_path):
+        command = [self.command] + (["-d", self.printer] if self.printer else []) + [pdf_path]
+        try:
+            result = subprocess.run(command, capture_output=True, text=True, timeout=self.timeout)
+        except FileNotFoundError:
+            raise PrintError(f"'{self.command}' not found")
+        except subprocess.TimeoutExpired:
+            raise PrintError(f"'{self.command}' did not finish within {self.timeout}s")
+        if result.returncode != 0:
+            raise PrintError(f"'{self.command}' exited with code {result.returncode}: {result.stderr.strip()}")
+
+
+class FileDropBackend:
+    """Copies each PDF into a folder (a printer hot folder, or a stand-in for tests)."""
+    name = "file"
+
+    def __init__(self, folder):
+        self.folder = folder
+
+    def print_file(self, pdf_path):
+        try:
+            os.makedirs(self.folder, exist_ok=True)
+            shutil.copy2(pdf_path, os.path.join(self.folder, os.path.basename(pdf_path)))
+        except OSError as e:
+            raise PrintError(f"Could not drop {pdf_path} into {self.folder}: {e}")
+
+
+class EscPosBackend:
+    """
+    Writes ESC/POS receipts (see utils.escpos) straight to a thermal printer.
+
+    `device` is a serial port (COM3, /dev/ttyUSB0) when `baudrate` is set, and
+    otherwise a device or file opened for writing: a USB printer-class node
+    (/dev/usb/lp0), a pty, or a plain file for testing. Receipts rendered for
+    this backend are raw byte streams, not PDFs.
+    """
+    name = "escpos"
+    format = "escpos"
+
+    def __init__(self, device, baudrate=None, timeout=10):
+        self.device = device
+        self.baudrate = baudrate
+        self.timeout = timeout
+
+    def print_file(self, receipt_path):
+        try:
+            with open(receipt_path, "rb") as f:
+                data = f.read()
+        except OSError as e:
+            raise PrintError(f"Could not read {receipt_path}: {e}")
+        self.write(data)
+
+    def write(self, data):
+        if self.baudrate:
+            try:
+                import serial
+            except ImportError:
+                raise PrintError("pyserial is required for a serial ESC/POS printer")
+            try:
+                with serial.Serial(self.device, self.baudrate, timeout=self.timeout, write_timeout=self.timeout) as port:
+                    port.write(data)
+                    port.flush()
+            except (serial.SerialException, OSError) as e:
+                raise PrintError(f"Could not write to {self.device}: {e}")
+            return
+        try:
+            with open(self.device, "ab", buffering=0) as device:
+                device.write(data)
+        except OSError as e:
+            raise PrintError(f"Could not write to {self.device}: {e}")
+
+
+def create_backend(config):
+    """
+    Builds the backend named by config["print_backend"] ("sumatra" by default):
+        "sumatra" - uses config["sumatra_path"]
+        "lp"      - optional config["lp_printer"]
+        "file"    - copies to config["print_drop_folder"] (default "print_drop")
+        "escpos"  - config["escpos_device"], optional config["escpos_baudrate"] for a serial port
+    """
+    backend = config.get("print_backend", "sumatra")
+    if backend == "sumatra":
+        return SumatraPdfBackend(config["sumatra_path"])
+    if backend == "lp":
+        return LpBackend(config.get("lp_printer"))
+    if backend == "file":
+        return FileDropBackend(config.get("print_drop_folder", "print_drop"))
+    if backend == "escpos":
+        return EscPosBackend(config["escpos_device"], config.get("escpos_baudrate"))
+    raise ValueError(f"Unknown print backend: {backend}. Allowed are ['sumatra', 'lp', 'file', 'escpos']")
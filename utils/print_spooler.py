@@ -0,0 +1,170 @@
+import os
+import logging
+import threading
+
+from repositories.print_job_repository import PrintJobRepository
+from utils.print_backends import PrintError
+from utils.ui_dispatch import UiDispatcher
+
+
+class PrintSpooler:
+    """
+    Prints receipts on a background thread so a slow or offline printer never
+    stalls weighing.
+
+    submit() only inserts a row into the PrintJobs table and returns. The worker
+    picks due jobs in order, calls `render(transaction_id)` to produce a PDF,
+    hands it to `backend.print_file(path)` and records the outcome. Failures are
+    retried with exponential backoff (base_delay, 2x, 4x ... capped at
+    max_delay) up to max_attempts, then the job is marked 'Failed'. A missing
+    transaction (LookupError from render) fails immediately.
+
+    When render and backend follow a changing configuration (ReceiptPrinter),
+    pass `setup` instead: a callable returning the (render, backend) pair for
+    one job, so a job is never rendered for one printer and sent to another.
+
+    Status changes are delivered on the Tk thread through the UiDispatcher, to
+    the per-job `on_status` callback and to every listener, as
+    callback(job_dict) with the PrintJobs row (Status, Attempts, LastError ...).
+    """
+    def __init__(self, db_path, render=None, backend=None, dispatcher: UiDispatcher = None, name="print-spooler",
+                 max_attempts=5, base_delay=2.0, max_delay=60.0, poll_interval=1.0, delete_after_print=False,
+                 setup=None):
+        self.repo = PrintJobRepository(db_path)
+        self.render = render
+        self.backend = backend
+        self.setup = setup or (lambda: (self.render, self.backend))
+        self.dispatcher = dispatcher or UiDispatcher()
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.poll_interval = poll_interval
+        self.delete_after_print = delete_after_print # Only for render() hooks that hand out temporary files
+        self._callbacks = {}
+        self._listeners = []
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._started = False
+        self._lock = threading.Lock()
+
+    def start(self):
+        with self._lock:
+            if not self._started:
+                self._started = True
+                self._thread.start()
+        return self
+
+    def attach(self, widget):
+        self.dispatcher.attach(widget)
+        return self
+
+    def add_listener(self, callback):
+        """callback(job) for every job's status changes, e.g. a status bar."""
+        self._listeners.append(callback)
+
+    def submit(self, transaction_id, on_status=None):
+        """Queues a receipt for `transaction_id`; returns the print job id."""
+        _, backend = self.setup()
+        job_id = self.repo.enqueue(transaction_id, getattr(backend, "name", None))
+        if on_status is not None:
+            self._callbacks[job_id] = on_status
+        self._notify(self.repo.get(job_id))
+        self.start()
+        self._wake.set()
+        return job_id
+
+    def retry(self, job_id):
+        """Puts a failed job back in the queue."""
+        self.repo.requeue(job_id)
+        self._notify(self.repo.get(job_id))
+        self.start()
+        self._wake.set()
+
+    def pending_count(self):
+        return self.repo.count_active()
+
+    def shutdown(self, wait=False, timeout=5.0):
+        """Stops after the current job; queued jobs stay in the table for the next start."""
+        self._stop.set()
+        self._wake.set()
+        if wait and self._started:
+            self._thread.join(timeout=timeout)
+        self.dispatcher.detach()
+
+    def backoff(self, attempts):
+        """Seconds to wait before attempt number attempts + 1."""
+        return min(self.max_delay, self.base_delay * 2 ** (attempts - 1))
+
+    def _run(self):
+        try:
+            recovered = self.repo.requeue_interrupted()
+            if recovered:
+                logging.info(f"PrintSpooler: requeued {recovered} interrupted job(s)")
+        except Exception:
+            logging.exception("PrintSpooler: could not requeue interrupted jobs")
+        while not self._stop.is_set():
+            job = None
+            try:
+                job = self.repo.claim_next()
+                if job is not None:
+                    self._process(job)
+                    continue
+            except Exception as e:
+                # e.g. "database is locked" while recording an outcome: keep the worker alive
+                logging.exception("PrintSpooler: queue error")
+                if job is not None:
+                    self._release(job, e)
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+
+    def _release(self, job, error):
+        """Puts a job whose outcome could not be recorded back in the queue (else it waits for the next start)."""
+        try:
+            self.repo.schedule_retry(job["Id"], str(error), self.backoff(job["Attempts"]))
+        except Exception:
+            logging.exception(f"PrintSpooler: job {job['Id']} stays 'Printing' until the next start")
+
+    def _process(self, job):
+        self._notify(job)
+        pdf_path = None
+        try:
+            render, backend = self.setup() # One pair per job: a config change can't split it
+            pdf_path = render(job["TransactionId"])
+            backend.print_file(pdf_path)
+        except LookupError as e:
+            self._finish(job, "Failed", str(e))
+        except Exception as e:
+            if not isinstance(e, PrintError):
+                logging.exception(f"PrintSpooler: job {job['Id']} raised")
+            if job["Attempts"] >= self.max_attempts:
+                self._finish(job, "Failed", str(e))
+            else:
+                delay = self.backoff(job["Attempts"])
+                logging.warning(f"PrintSpooler: job {job['Id']} attempt {job['Attempts']} failed ({e}); retrying in {delay:.0f}s")
+                self.repo.schedule_retry(job["Id"], str(e), delay)
+                self._notify(self.repo.get(job["Id"]))
+        else:
+            self._finish(job, "Done", None)
+        finally:
+            if self.delete_after_print and pdf_path and os.path.exists(pdf_path):
+                try:
+                    os.remove(pdf_path)
+                except OSError as cleanup_error:
+                    logging.warning(f"PrintSpooler: could not delete {pdf_path}: {cleanup_error}")
+
+    def _finish(self, job, status, error):
+        if status == "Done":
+            self.repo.mark_done(job["Id"])
+            logging.info(f"🖨️ Printed transaction ID {job['TransactionId']} (job {job['Id']})")
+        else:
+            self.repo.mark_failed(job["Id"], error)
+            logging.error(f"PrintSpooler: job {job['Id']} failed after {job['Attempts']} attempt(s): {error}")
+        self._notify(self.repo.get(job["Id"]))
+        self._callbacks.pop(job["Id"], None)
+
+    def _notify(self, job):
+        if job is None:
+            return
+        for callback in [self._callbacks.get(job["Id"])] + self._listeners:
+            self.dispatcher.post(callback, job)
@@ -0,0 +1,92 @@
+import sqlite3
+from collections import OrderedDict
+
+
+class QueryResultCache:
+    """
+    LRU cache for report query results, keyed by the caller (e.g. the filter tuple).
+
+    Entries are only valid for the database state they were read from. Before
+    every lookup the cache reads `PRAGMA data_version` on its own long-lived
+    connection; SQLite bumps that number whenever any *other* connection commits,
+    so a weighing saved from the main screen empties the cache, while repeated
+    identical queries in between are answered from memory.
+    """
+    def __init__(self, db_path, max_entries=64):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._conn = None
+        self._token = None
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def _change_token(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path)
+        return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def _validate(self):
+        token = self._change_token()
+        if token != self._token:
+            if self._entries:
+                self.invalidations += 1
+            self._entries.clear()
+            self._token = token
+
+    def get_or_load(self, key, loader):
+        """Returns the cached value for `key`, or calls loader() and caches its result."""
+        found, value = self.lookup(key)
+        if found:
+            return value
+        value = loader()
+        self.put(key, value)
+        return value
+
+    def lookup(self, key):
+        """(True, value) on a hit, (False, None) on a miss."""
+        self._validate()
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, self._entries[key]
+        self.misses += 1
+        return False, None
+
+    def current_token(self):
+        """Change token to hand to put() for values loaded elsewhere."""
+        self._validate()
+        return self._token
+
+    def put(self, key, value, token=None):
+        """
+        Stores a value loaded elsewhere (e.g. on a worker thread). If `token` is
+        given and the database has changed since it was taken, the value may be
+        stale and is dropped.
+        """
+        self._validate()
+        if token is not None and token != self._token:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "invalidations": self.invalidations,
+            "entries": len(self._entries),
+        }
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -0,0 +1,20 @@
+"""
+Backfills the DailySummary rollup from WeighingTransactions.
+
+Run from the project root after restoring a backup or editing rows by hand:
+    python -m utils.rebuild_daily_summary [db_path]
+"""
+import sys
+
+from Model.report_model import ReportRepository
+
+
+def main():
+    db_path = sys.argv[1] if len(sys.argv) > 1 else "weighbridge.db"
+    repo = ReportRepository(db_path=db_path)
+    count = repo.rebuild_daily_summary()
+    print(f"✅ DailySummary rebuilt: {count} rows.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+import os
+import re
+import time
+import uuid
+import hashlib
+import logging
+import threading
+
+
+class ReceiptStore:
+    """
+    Rendered receipt PDFs kept on disk, one per transaction version.
+
+    A receipt is stored as `<transaction id>_<digest>.pdf` (or `.bin` for raw
+    ESC/POS receipts), where the digest
+    covers everything that changes the printed output (LastUpdatedAt, joined
+    names, template). A reprint of an unchanged transaction returns the
+    existing file without rendering; an edited transaction gets a new digest
+    and its older PDFs are removed. Files are written under a temporary name
+    and renamed into place, so a reader never sees a half-written PDF.
+
+    Disk use is bounded: files older than max_age_days are removed, then the
+    least recently used ones until the folder is under max_bytes. Eviction runs
+    on creation and after every `evict_every` renders. Only files matching the
+    store's naming pattern are ever deleted.
+    """
+    _NAME = re.compile(r"^(\d+)_([0-9a-f]{16})\.(pdf|bin)$")
+
+    def __init__(self, folder="receipts/store", max_bytes=200 * 1024 * 1024, max_age_days=30, evict_every=50):
+        self.folder = folder
+        self.max_bytes = max_bytes
+        self.max_age_days = max_age_days
+        self.evict_every = evict_every
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        self._renders_since_evict = 0
+        self._lock = threading.Lock()
+        os.makedirs(self.folder, exist_ok=True)
+        self.evict()
+
+    @staticmethod
+    def digest(*parts):
+        """Version digest for the values that make up a receipt."""
+        return hashlib.sha1("\x1f".join("" if p is None else str(p) for p in parts).encode("utf-8")).hexdigest()[:16]
+
+    def path_for(self, transaction_id, digest, suffix=".pdf"):
+        return os.path.join(self.folder, f"{int(transaction_id)}_{digest}{suffix}")
+
+    def get_or_render(self, transaction_id, digest, render, suffix=".pdf"):
+        """
+        Path of the stored receipt for this transaction version; calls
+        render(path) to write it first if it isn't stored yet.
+        """
+        path = self.path_for(transaction_id, digest, suffix)
+        if os.path.exists(path):
+            try:
+                os.utime(path) # Recently printed receipts are evicted last
+            except OSError:
+                pass
+            self.hits += 1
+            return path
+
+        temp_path = os.path.join(self.folder, f".{uuid.uuid4().hex}.tmp")
+        try:
+            render(temp_path)
+            os.replace(temp_path, path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        self.misses += 1
+        self._drop_old_versions(transaction_id, path)
+
+        with self._lock:
+            self._renders_since_evict += 1
+            due = self._renders_since_evict >= self.evict_every
+        if due:
+            self.evict()
+        return path
+
+    def _drop_old_versions(self, transaction_id, current_path):
+        prefix = f"{int(transaction_id)}_"
+        current = os.path.basename(current_path)
+        for name in os.listdir(self.folder):
+            if name.startswith(prefix) and name != current and self._NAME.match(name):
+                self._remove(os.path.join(self.folder, name))
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+            self.evicted += 1
+            return True
+        except OSError as e:
+            logging.warning(f"ReceiptStore: could not remove {path}: {e}")
+            return False
+
+    def evict(self):
+        """Applies the age and size limits; returns the number of files removed."""
+        with self._lock:
+            self._renders_since_evict = 0
+        entries = []
+        for entry in os.scandir(self.folder):
+            if entry.is_file() and self._NAME.match(entry.name):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        entries.sort() # Least recently used first
+
+        removed = 0
+        cutoff = time.time() - self.max_age_days * 86400 if self.max_age_days else None
+        total = sum(size for _, size, _ in entries)
+        for mtime, size, path in entries:
+            expired = cutoff is not None and mtime < cutoff
+            if not expired and (not self.max_bytes or total <= self.max_bytes):
+                break
+            if self._remove(path):
+                removed += 1
+                total -= size
+        if removed:
+            print(f"[DEBUG] ReceiptStore: Evicted {removed} receipt(s), {total / 1024:.0f} KB kept")
+        return removed
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evicted": self.evicted,
+        }
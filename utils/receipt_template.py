@@ -0,0 +1,107 @@
+import json
+import hashlib
+
+from utils.amount_words import weight_words
+
+_DEFAULT_FONT = "Helvetica"
+_DEFAULT_SIZE = 10
+
+
+class _Fields(dict):
+    """format_map() source: unknown or empty fields print as '-' instead of raising."""
+    def __missing__(self, key):
+        return "-"
+
+
+def receipt_fields(transaction: dict) -> dict:
+    """Display values for one transaction, keyed by the names templates use."""
+    fields = _Fields({k: ("-" if v is None else v) for k, v in transaction.items()})
+    charges = transaction.get("Charges")
+    fields["Charges"] = f"{charges:.2f}" if charges is not None else "0.00"
+    fields["NetWeightWords"] = weight_words(transaction.get("NetWeight") or 0)
+    return fields
+
+
+class ReceiptTemplate:
+    """
+    Receipt layout loaded from JSON (see receipt_template.json).
+
+    "static" elements (header, address, rules, signature line) are the same on
+    every receipt. They are drawn once per document into a PDF form XObject
+    (canvas.beginForm/endForm) and each copy on a page references it with
+    doForm, so only the "fields" (str.format templates over the transaction
+    dict) are drawn per receipt. "copies_y" lists the y offset of each copy; "half" means half
+    the page height.
+    """
+    def __init__(self, spec: dict):
+        from reportlab.lib import pagesizes
+
+        self.page_size = getattr(pagesizes, spec.get("page_size", "A4"))
+        self.margin = spec.get("margin", 60)
+        self.static = list(spec.get("static", []))
+        self.fields = list(spec.get("fields", []))
+        self.copies_y = [self.page_size[1] / 2 if y == "half" else float(y) for y in spec.get("copies_y", [0])]
+        # Identifies the layout, so stored PDFs rendered from an older template aren't reused
+        self.fingerprint = hashlib.sha1(json.dumps(spec, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def _draw_text(self, c, element, text, font_state=None):
+        # font_state: [font, size] already set on this copy, to skip redundant setFont operators
+        font = (element.get("font", _DEFAULT_FONT), element.get("size", _DEFAULT_SIZE))
+        if font_state is None or font_state[0] != font:
+            c.setFont(*font)
+            if font_state is not None:
+                font_state[0] = font
+        x = element.get("x", "left")
+        if x == "center":
+            c.drawCentredString(self.page_size[0] / 2, element["y"], text)
+        elif x == "right":
+            c.drawRightString(self.page_size[0] - self.margin, element["y"], text)
+        else:
+            c.drawString(self.margin if x == "left" else x, element["y"], text)
+
+    def _draw_static(self, c):
+        font_state = [None]
+        for element in self.static:
+            if element.get("type") == "line":
+                c.line(self.margin, element["y"], self.page_size[0] - self.margin, element["y"])
+            else:
+                self._draw_text(c, element, element["text"], font_state)
+
+    def _static_form(self, c):
+        """Name of the form holding the static elements on canvas `c`; drawn the first time it is needed."""
+        name = f"ReceiptStatic{self.fingerprint}"
+        if not c.hasForm(name):
+            c.beginForm(name)
+            self._draw_static(c)
+            c.endForm()
+        return name
+
+    def draw_page(self, c, transaction: dict):
+        """Draws every copy of the receipt for `transaction` on the current page of canvas `c`."""
+        form = self._static_form(c)
+        values = receipt_fields(transaction)
+        texts = [field["text"].format_map(values) for field in self.fields]
+        for y_offset in self.copies_y:
+            c.saveState()
+            c.translate(0, y_offset)
+            c.doForm(form)
+            font_state = [None]
+            for field, text in zip(self.fields, texts):
+                self._draw_text(c, field, text, font_state)
+            c.restoreState()
+        c.showPage()
+
+    def render(self, file_path, transactions):
+        """Writes one page per transaction to `file_path`."""
+        from reportlab.pdfgen import canvas
+
+        c = canvas.Canvas(file_path, pagesize=self.page_size)
+        for transaction in transactions:
+            self.draw_page(c, transaction)
+        c.save()
+        return file_path
@@ -0,0 +1,197 @@
+import csv
+import datetime
+import pickle
+import tempfile
+
+# Rows per reportlab Table drawn on one PDF page (landscape A4, 8pt font, fixed row height)
+_PDF_ROW_HEIGHT = 14
+_PDF_MARGIN = 10
+_PDF_COLUMNS_PER_PAGE = 6
+_PDF_TIMESTAMP_COLUMNS = ("FirstWeightTimestamp", "SecondWeightTimestamp", "CreatedAt", "LastUpdatedAt")
+
+
+def _short_timestamp(value):
+    """'2024-05-01T13:45:12.123456' -> '2024-05-01 13:45'. Non-ISO values are returned unchanged."""
+    if not value:
+        return ""
+    try:
+        return datetime.datetime.fromisoformat(str(value)).strftime('%Y-%m-%d %H:%M')
+    except ValueError:
+        return value
+
+
+def format_timestamp_column(series, fmt='%Y-%m-%d %H:%M'):
+    """
+    Vectorised _short_timestamp for a pandas column: one pd.to_datetime pass instead
+    of parsing each cell. NULLs stay None; non-ISO values are returned unchanged.
+    """
+    import pandas as pd
+
+    try:
+        parsed = pd.to_datetime(series, format="ISO8601", errors="coerce")
+    except (TypeError, ValueError):
+        # pandas < 2.0 has no format="ISO8601"; inference is still vectorised
+        parsed = pd.to_datetime(series, errors="coerce")
+    formatted = parsed.dt.strftime(fmt).astype(object)
+    return formatted.where(parsed.notna(), series).where(series.notna(), None)
+
+
+def _pdf_column_width(col):
+    if col in ["Remarks", "CreatedAt", "LastUpdatedAt", "TransactionGuid"]:
+        return 150
+    if col in ["FirstWeightTimestamp", "SecondWeightTimestamp"]:
+        return 110
+    return 90
+
+
+class StreamingReportExporter:
+    """
+    Writes report rows to CSV / XLSX / PDF straight from a chunked row source,
+    without building a DataFrame, so memory stays flat however many rows are
+    exported.
+
+    `row_chunks` is a zero-argument callable returning an iterator of row lists
+    (tuples in `columns` order), e.g. a bound
+    ReportRepository.iter_combined_filtered_transactions. Every writer calls it
+    exactly once; the PDF writer spools the cells of the later column groups to a
+    temporary file instead of re-running the query per group.
+
+    `progress(done, total)` is called after every chunk; `total` is whatever was
+    passed in (None if unknown) multiplied by the number of passes (the PDF writer
+    counts one pass per column group drawn).
+
+    Pass format_timestamps=False when the source already returns display-ready
+    timestamps (e.g. formatted with strftime in SQL); the PDF writer then skips
+    parsing them in Python.
+    """
+    def __init__(self, columns, row_chunks, total=None, progress=None, format_timestamps=True):
+        self.columns = list(columns)
+        self.row_chunks = row_chunks
+        self.total = total
+        self.progress = progress
+        self.format_timestamps = format_timestamps
+        self.rows_written = 0
+
+    def export(self, file_path, ext):
+        writers = {".csv": self.write_csv, ".xlsx": self.write_xlsx, ".pdf": self.write_pdf}
+        if ext not in writers:
+            raise ValueError("Unsupported format")
+        writers[ext](file_path)
+        return self.rows_written
+
+    def _report(self, done, passes=1):
+        if self.progress:
+            total = self.total * passes if self.total is not None else None
+            self.progress(done, total)
+
+    def write_csv(self, file_path):
+        done = 0
+        with open(file_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(self.columns)
+            for rows in self.row_chunks():
+                writer.writerows(rows)
+                done += len(rows)
+                self._report(done)
+        self.rows_written = done
+
+    def write_xlsx(self, file_path):
+        # Write-only workbooks stream rows to disk instead of keeping cell objects around
+        from openpyxl import Workbook
+
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet("Sheet1")
+        sheet.append(self.columns)
+        done = 0
+        for rows in self.row_chunks():
+            for row in rows:
+                sheet.append(row)
+            done += len(rows)
+            self._report(done)
+        workbook.save(file_path)
+        self.rows_written = done
+
+    def write_pdf(self, file_path):
+        """
+        Reads the rows once. The first group of 6 columns is drawn as rows arrive;
+        the remaining groups' cells are pickled to a temporary file per chunk and
+        drawn from there. Each page is drawn and released as soon as it fills.
+        """
+        from reportlab.pdfgen import canvas
+        from reportlab.lib.pagesizes import landscape, A4
+        from reportlab.platypus import Table, TableStyle
+        from reportlab.lib import colors
+
+        page_width, page_height = landscape(A4)
+        rows_per_page = int((page_height - 2 * _PDF_MARGIN) // _PDF_ROW_HEIGHT) - 1  # minus header row
+        style = TableStyle([
+            ('BACKGROUND', (0,0), (-1,0), colors.HexColor("#dcecf9")),
+            ('GRID', (0,0), (-1,-1), 0.5, colors.grey),
+            ('ALIGN', (0,0), (-1,-1), 'CENTER'),
+            ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0,0), (-1,-1), 8),
+            ('VALIGN', (0,0), (-1,-1), 'MIDDLE')
+        ])
+        column_chunks = [self.columns[i:i + _PDF_COLUMNS_PER_PAGE]
+                         for i in range(0, len(self.columns), _PDF_COLUMNS_PER_PAGE)]
+        pdf = canvas.Canvas(file_path, pagesize=landscape(A4))
+        done = 0
+        pages = 0
+
+        def draw_page(header, body, widths):
+            nonlocal pages
+            if pages:
+                pdf.showPage()
+            table = Table([header] + body, colWidths=widths, rowHeights=_PDF_ROW_HEIGHT)
+            table.setStyle(style)
+            _, height = table.wrapOn(pdf, page_width - 2 * _PDF_MARGIN, page_height - 2 * _PDF_MARGIN)
+            table.drawOn(pdf, (page_width - sum(widths)) / 2, page_height - _PDF_MARGIN - height)
+            pages += 1
+
+        timestamp_positions = ([pos for pos, col in enumerate(self.columns) if col in _PDF_TIMESTAMP_COLUMNS]
+                               if self.format_timestamps else ())
+        passes = len(column_chunks)
+
+        def draw_group(chunk, cell_chunks):
+            nonlocal done
+            widths = [_pdf_column_width(col) for col in chunk]
+            page_rows = []
+            for cell_rows in cell_chunks:
+                for cells in cell_rows:
+                    page_rows.append(cells)
+                    if len(page_rows) == rows_per_page:
+                        draw_page(chunk, page_rows, widths)
+                        page_rows = []
+                done += len(cell_rows)
+                self._report(done, passes=passes)
+            if page_rows or not pages:
+                draw_page(chunk, page_rows, widths)
+
+        with tempfile.TemporaryFile() as spool:
+            def read_rows():
+                for rows in self.row_chunks():
+                    cell_rows = []
+                    for row in rows:
+                        cells = ["" if value is None else value for value in row]
+                        for pos in timestamp_positions:
+                            cells[pos] = _short_timestamp(cells[pos])
+                        cell_rows.append(cells)
+                    if passes > 1:
+                        pickle.dump([cells[_PDF_COLUMNS_PER_PAGE:] for cells in cell_rows],
+                                    spool, protocol=pickle.HIGHEST_PROTOCOL)
+                    yield [cells[:_PDF_COLUMNS_PER_PAGE] for cells in cell_rows]
+
+            def read_spool(offset):
+                spool.seek(0)
+                while True:
+                    try:
+                        cell_rows = pickle.load(spool)
+                    except EOFError:
+                        return
+                    yield [cells[offset:offset + _PDF_COLUMNS_PER_PAGE] for cells in cell_rows]
+
+            for n, chunk in enumerate(column_chunks):
+                draw_group(chunk, read_rows() if n == 0 else read_spool((n - 1) * _PDF_COLUMNS_PER_PAGE))
+
+        pdf.save()
+        self.rows_written = done // max(passes, 1)
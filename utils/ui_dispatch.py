@@ -0,0 +1,59 @@
+import queue
+import logging
+
+
+class UiDispatcher:
+    """
+    Hands results from worker threads back to the Tk main loop.
+
+    Tkinter widgets must only be touched from the thread running mainloop(),
+    so workers never call widget methods directly. They post callables onto
+    a queue, and an after() loop on the Tk thread drains it - the same
+    polling approach the serial reader frame uses for incoming data.
+    """
+    def __init__(self, poll_interval_ms=50):
+        self.poll_interval_ms = poll_interval_ms
+        self._pending = queue.Queue()
+        self._widget = None
+        self._after_id = None
+
+    def attach(self, widget):
+        """Starts draining the queue on the Tk thread that owns `widget`."""
+        self._widget = widget
+        if self._after_id is None:
+            self._after_id = widget.after(self.poll_interval_ms, self._drain)
+
+    def detach(self):
+        if self._widget is not None and self._after_id is not None:
+            try:
+                self._widget.after_cancel(self._after_id)
+            except Exception:
+                pass
+        self._after_id = None
+        self._widget = None
+
+    def post(self, callback, *args):
+        """Queues `callback(*args)` to run on the Tk thread. Safe from any thread."""
+        if callback is not None:
+            self._pending.put((callback, args))
+
+    def run_pending(self):
+        """Runs everything queued so far. Useful when no widget is attached (scripts)."""
+        while True:
+            try:
+                callback, args = self._pending.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                callback(*args)
+            except Exception:
+                logging.exception("UiDispatcher: callback raised")
+
+    def _drain(self):
+        self.run_pending()
+        if self._widget is not None:
+            try:
+                self._after_id = self._widget.after(self.poll_interval_ms, self._drain)
+            except Exception:
+                # Widget destroyed while we were draining
+                self._after_id = None
@@ -1,17 +1,16 @@
 import datetime
 import uuid
+import logging
 import tkinter as tk
-import os # Added for path handling
-import json # Added for config loading
-import subprocess # Added for calling external print command
-import sys # Added for PyInstaller path handling
 
 from Model.WeighingTransactionModel import WeighingTransaction
 from repositories.vehicle_repository import VehicleRepository
 from repositories.material_repository import MaterialRepository
 from repositories.customer_repository import CustomerRepository
 from repositories.WeighingTransactionRepository import WeighingTransactionRepository
-from viewmodels.pri import ReceiptPrinter # Added for printing functionality
+from viewmodels.pri import get_receipt_printer # Added for printing functionality
+from utils.app_config import ConfigError
+from utils.print_backends import PrintError
 
 class WeighingTransactionViewModel:
     """
@@ -23,13 +22,20 @@ class WeighingTransactionViewModel:
                  material_repository: MaterialRepository,
                  customer_repository: CustomerRepository,
                  weighing_repository: WeighingTransactionRepository,
-                 serial_view_model=None):
+                 serial_view_model=None,
+                 db_executor=None,
+                 print_spooler=None):
 
         self.vehicle_repository = vehicle_repository
         self.material_repository = material_repository
         self.customer_repository = customer_repository
         self.weighing_repository = weighing_repository
         self.serial_view_model = serial_view_model
+        # Optional DbExecutor: when set, saves/cancels/list reloads run on its worker
+        # thread instead of blocking the Tk main loop.
+        self.db_executor = db_executor
+        # Optional PrintSpooler: when set, receipts are queued and printed in the background
+        self.print_spooler = print_spooler
 
         self.operator = tk.StringVar(value="")
 
@@ -49,6 +55,7 @@ class WeighingTransactionViewModel:
         self.status = tk.StringVar(value="Pending")
         self.remarks = tk.StringVar(value="")
         self.charges = tk.StringVar(value="0.00")
+        self.yard_count = tk.StringVar(value="🚚 In yard: -") # Pending transactions = trucks inside the yard
 
         self.is_second_weighing = tk.BooleanVar(value=False)
         self.current_linked_transaction_id = None
@@ -69,6 +76,7 @@ class WeighingTransactionViewModel:
 
         # Transaction state
         self.current_transaction = None
+        self._suppress_vehicle_lookup = False # Set while restoring a transaction into the form
 
         # Initialize data for comboboxes
         self._load_vehicle_types()
@@ -118,6 +126,8 @@ class WeighingTransactionViewModel:
 
     # --- Property Change Handlers ---
     def _on_vehicle_number_changed(self, *args):
+        if self._suppress_vehicle_lookup:
+            return
         vehicle_num = self.vehicle_number.get().strip().upper()
         if vehicle_num:
             self._evaluate_vehicle_history(vehicle_num)
@@ -315,6 +325,10 @@ class WeighingTransactionViewModel:
             self.current_transaction.charges = 0.00
             self.charges.set("0.00")
 
+        if self.db_executor:
+            self._save_in_background()
+            return
+
         try:
             if self.current_transaction.id:
                 self.weighing_repository.update(self.current_transaction)
@@ -336,8 +350,90 @@ class WeighingTransactionViewModel:
             if self.status_update_callback:
                 self.status_update_callback("error")
 
+    def _save_in_background(self):
+        """
+        Persists the current transaction on the DB worker thread.
+        The form is cleared straight away so the operator can start on the next
+        truck; if the write fails, the transaction is put back into the form.
+        """
+        transaction = self.current_transaction
+        is_update = bool(transaction.id)
+        short_guid = transaction.transaction_guid[:8]
+
+        def _persist(repo):
+            if is_update:
+                repo.update(transaction)
+            else:
+                repo.add(transaction)
+            return transaction
+
+        def _on_saved(saved):
+            action = "Updated" if is_update else "Saved"
+            self.status.set(f"Transaction {short_guid}... {action}! Status: {saved.status}")
+            if self.status_update_callback:
+                self.status_update_callback("updated" if is_update else "saved")
+            self.load_transactions_for_display()
+
+        def _on_failed(error):
+            self._restore_transaction_into_form(transaction)
+            if self.error_display_callback:
+                self.error_display_callback("Database Error", f"Failed to save transaction: {error}")
+            self.status.set("Error saving transaction!")
+            if self.status_update_callback:
+                self.status_update_callback("error")
+
+        self.clear_form_fields()
+        self.status.set(f"Saving transaction {short_guid}...")
+        if self.status_update_callback:
+            self.status_update_callback("neutral")
+        self.db_executor.submit(_persist, on_success=_on_saved, on_error=_on_failed)
+
+    def _cancel_in_background(self):
+        """Marks the current transaction as canceled on the DB worker thread."""
+        transaction = self.current_transaction
+        previous_status = transaction.status
+        short_guid = transaction.transaction_guid[:8]
+        transaction.status = 'Canceled'
+
+        def _on_canceled(_):
+            self.status.set(f"Transaction {short_guid}... Canceled!")
+            if self.status_update_callback:
+                self.status_update_callback("canceled")
+            self.load_transactions_for_display()
+
+        def _on_failed(error):
+            transaction.status = previous_status
+            self._restore_transaction_into_form(transaction)
+            if self.error_display_callback:
+                self.error_display_callback("Database Error", f"Failed to cancel transaction: {error}")
+            self.status.set("Error canceling transaction!")
+            if self.status_update_callback:
+                self.status_update_callback("error")
+
+        self.clear_form_fields()
+        self.status.set(f"Canceling transaction {short_guid}...")
+        if self.status_update_callback:
+            self.status_update_callback("neutral")
+        self.db_executor.submit(lambda repo: repo.update(transaction),
+                                on_success=_on_canceled, on_error=_on_failed)
+
+    def _restore_transaction_into_form(self, transaction: WeighingTransaction):
+        """Puts a transaction back into the form after a failed background write."""
+        self._suppress_vehicle_lookup = True
+        try:
+            self.current_transaction = transaction
+            self.current_linked_transaction_id = transaction.id
+            self.is_second_weighing.set(bool(transaction.id))
+            self._populate_ui_from_model()
+        finally:
+            self._suppress_vehicle_lookup = False
+        if self.load_form_callback:
+            self.load_form_callback()
+
     def cancel_transaction(self):
-        if self.current_transaction and self.current_transaction.id:
+        if self.current_transaction and self.current_transaction.id and self.db_executor:
+            self._cancel_in_background()
+        elif self.current_transaction and self.current_transaction.id:
             try:
                 self.current_transaction.status = 'Canceled'
                 self.weighing_repository.update(self.current_transaction)
@@ -359,8 +455,39 @@ class WeighingTransactionViewModel:
                 self.status_update_callback("neutral")
 
     def load_transactions_for_display(self):
-        transactions = self.weighing_repository.get_all()
-        transactions.sort(key=lambda x: x.created_at if isinstance(x.created_at, datetime.datetime) else datetime.datetime.min, reverse=True)
+        self.refresh_yard_count() # Saves and cancels end here, so the yard count follows them
+        if self.db_executor:
+            self.db_executor.submit(lambda repo: repo.get_all(),
+                                    on_success=self._publish_transactions_for_display,
+                                    on_error=self._on_load_transactions_failed)
+            return
+        self._publish_transactions_for_display(self.weighing_repository.get_all())
+
+    def refresh_yard_count(self):
+        """Updates yard_count from the pending-status partial index."""
+        def _publish(count):
+            self.yard_count.set(f"🚚 In yard: {count}")
+
+        def _failed(e):
+            logging.error(f"WeighingTransactionViewModel: failed to count pending transactions: {e}")
+            self.yard_count.set("🚚 In yard: ?")
+
+        if self.db_executor:
+            self.db_executor.submit(lambda repo: repo.count_pending(), on_success=_publish, on_error=_failed)
+            return
+        _publish(self.weighing_repository.count_pending())
+
+    def _on_load_transactions_failed(self, e):
+        logging.error(f"WeighingTransactionViewModel: failed to load transactions: {e}")
+        if self.error_display_callback:
+            self.error_display_callback("Database Error", f"Failed to load transactions: {e}")
+        self.status.set("Error loading transactions!")
+        if self.status_update_callback:
+            self.status_update_callback("error")
+
+    def _publish_transactions_for_display(self, transactions):
+        # get_all() returns newest first (ORDER BY CreatedAt DESC, rows without one last).
+        # Sorting again here would parse every lazily-mapped CreatedAt for nothing.
         display_data = []
         for t in transactions:
             vehicle_type_name = self._get_vehicle_type_name_by_id(t.vehicle_type_id)
@@ -630,8 +757,7 @@ class WeighingTransactionViewModel:
         """
         Returns a list of all transaction dicts for the side panel.
         """
-        transactions = self.weighing_repository.get_all()
-        transactions.sort(key=lambda x: x.created_at if hasattr(x, "created_at") and x.created_at else datetime.datetime.min, reverse=True)
+        transactions = self.weighing_repository.get_all() # Newest first already
         display_data = []
         for t in transactions:
             vehicle_type_name = self._get_vehicle_type_name_by_id(t.vehicle_type_id)
@@ -660,50 +786,20 @@ class WeighingTransactionViewModel:
         Handles printing the most recent completed transaction.
         This logic was moved from the View to the ViewModel.
         """
+        if self.print_spooler:
+            self._queue_last_transaction_print()
+            return
         try:
-            # Determine base directory depending on runtime environment
-            if getattr(sys, 'frozen', False):
-                base_dir = sys._MEIPASS  # PyInstaller bundle directory
-            else:
-                base_dir = os.path.dirname(os.path.abspath(__file__))
-
-            # Load config file from bundled folder or source tree
-            config_path = os.path.join(base_dir, "config.json")
-            with open(config_path, "r") as f:
-                config = json.load(f)
-
-            # Resolve paths relative to base_dir
-            config["database_path"] = os.path.join(base_dir, config.get("database_path", "weighbridge.db"))
-            config["sumatra_path"] = os.path.join(base_dir, config.get("sumatra_path", "SumatraPDFcopy/SumatraPDF.exe"))
-
-            # Setup printer and try printing the most recent transaction
-            printer = ReceiptPrinter(config=config)
-            
-            # Get the last completed transaction for the current vehicle number, if available
-            # Or, if no current vehicle, get the overall last completed transaction
-            last_transaction = None
-            if self.vehicle_number.get().strip():
-                last_transaction = self.weighing_repository.get_latest_completed_transaction(self.vehicle_number.get().strip().upper())
-            
-            # If no specific vehicle transaction, get the absolute last transaction
-            if not last_transaction:
-                all_transactions = self.weighing_repository.get_all()
-                completed_transactions = [t for t in all_transactions if t.status == 'Completed']
-                if completed_transactions:
-                    # Sort by last_updated_at or created_at to get the most recent one
-                    completed_transactions.sort(key=lambda x: x.last_updated_at if x.last_updated_at else x.created_at, reverse=True)
-                    last_transaction = completed_transactions[0]
+            # Shared printer; config.json is only re-read when it changes. The snapshot
+            # keeps the receipt format and the backend together if it changes mid-print.
+            printer = get_receipt_printer().snapshot()
 
+            last_transaction = self._find_last_completed_transaction()
 
             if last_transaction:
-                pdf_path = printer.generate_receipt_pdf(last_transaction)
+                pdf_path = printer.generate_receipt(last_transaction)
                 print(f"📄 Receipt auto-printed from ViewModel: {pdf_path}")
-                subprocess.call([
-                    config["sumatra_path"],
-                    "-print-to-default",
-                    "-silent",
-                    pdf_path
-                ])
+                printer.print_file(pdf_path)
                 self.status.set("Receipt printed successfully!")
                 if self.status_update_callback:
                     self.status_update_callback("neutral") # Or a specific "printed" status
@@ -719,7 +815,16 @@ class WeighingTransactionViewModel:
             self.status.set("Printing failed: Tool not found.")
             if self.status_update_callback:
                 self.status_update_callback("error")
-        except json.JSONDecodeError as e:
+        except PrintError as e:
+            # The backend's own message: timeout, exit code, missing device, ...
+            error_msg = f"Printing failed: {e}"
+            print(f"❌ {error_msg}")
+            if self.error_display_callback:
+                self.error_display_callback("Printing Error", error_msg)
+            self.status.set("Printing failed.")
+            if self.status_update_callback:
+                self.status_update_callback("error")
+        except ConfigError as e:
             error_msg = f"Error reading config.json: {e}"
             print(f"❌ {error_msg}")
             if self.error_display_callback:
@@ -736,3 +841,44 @@ class WeighingTransactionViewModel:
             if self.status_update_callback:
                 self.status_update_callback("error")
 
+    def _find_last_completed_transaction(self):
+        """
+        Receipt dict (with CustomerName / MaterialName) for the last completed transaction of the
+        current vehicle number, or overall if there is none. Each lookup is one index seek.
+        """
+        printer_view_model = get_receipt_printer().viewmodel
+        last_transaction = None
+        if self.vehicle_number.get().strip():
+            last_transaction = printer_view_model.get_last_completed_transaction(self.vehicle_number.get().strip().upper())
+
+        # If no specific vehicle transaction, get the absolute last transaction
+        if not last_transaction:
+            last_transaction = printer_view_model.get_last_completed_transaction()
+        return last_transaction
+
+    def _queue_last_transaction_print(self):
+        last_transaction = self._find_last_completed_transaction()
+        if not last_transaction:
+            self.status.set("No recent completed transaction found to print.")
+            if self.status_update_callback:
+                self.status_update_callback("error")
+            return
+        self.print_spooler.submit(last_transaction["Id"], on_status=self._on_print_status)
+
+    def _on_print_status(self, job):
+        """PrintSpooler callback (Tk thread) for jobs queued from this screen."""
+        status = job["Status"]
+        if status == "Queued":
+            self.status.set("Receipt queued for printing...")
+        elif status == "Printing":
+            self.status.set("Printing receipt...")
+        elif status == "Retry":
+            self.status.set(f"Printer problem, retrying (attempt {job['Attempts']}): {job['LastError']}")
+        elif status == "Done":
+            self.status.set("Receipt printed successfully!")
+        elif status == "Failed":
+            self.status.set("Printing failed.")
+            if self.error_display_callback:
+                self.error_display_callback("Printing Error", f"Could not print transaction {job['TransactionId']}: {job['LastError']}")
+        if self.status_update_callback:
+            self.status_update_callback("error" if status in ("Retry", "Failed") else "neutral")
@@ -0,0 +1,49 @@
+from Model.aggregation_model import (AggregationRepository, ADDITIVE_MEASURES, DIMENSIONS, MEASURES, TOTAL,
+                                     column_cell, pivot)
+from utils.report_export import StreamingReportExporter
+
+
+class PivotReportViewModel:
+    """Backs the Pivot Report screen: runs an aggregation and pivots it for display/export."""
+    NONE = "(none)"
+
+    def __init__(self, db_path="weighbridge.db"):
+        self.repo = AggregationRepository(db_path)
+        self.dimension_choices = list(DIMENSIONS.keys())
+        self.measure_choices = list(MEASURES.keys())
+        self.columns = [] # Headers
+        self.keys = [] # Key of each column in the table rows
+        self.table = []
+
+    def run(self, row_dimensions, column_dimension, measure, date_from=None, date_to=None):
+        """
+        Aggregates `measure` by row_dimensions (+ column_dimension) and pivots the
+        column dimension out into columns. column_dimension may be NONE for a flat
+        grouped table.
+        """
+        row_dimensions = [d for d in row_dimensions if d and d != self.NONE]
+        filters = {"date_from": date_from, "date_to": date_to}
+
+        if column_dimension and column_dimension != self.NONE:
+            rows = self.repo.aggregate(row_dimensions + [column_dimension], [measure], filters)
+            if measure in ADDITIVE_MEASURES:
+                labels, self.table = pivot(rows, row_dimensions, column_dimension, measure)
+            else:
+                # An average or maximum over all columns has to come from the rows, not the cells
+                totals = self.repo.aggregate(row_dimensions, [measure], filters)
+                labels, self.table = pivot(rows, row_dimensions, column_dimension, measure,
+                                           totals=totals, fill=None)
+            self.columns = row_dimensions + labels + ["Total"]
+            self.keys = row_dimensions + [column_cell(label) for label in labels] + [TOTAL]
+        else:
+            self.table = self.repo.aggregate(row_dimensions, [measure], filters)
+            self.columns = row_dimensions + [measure]
+            self.keys = list(self.columns)
+        return self.table
+
+    def export(self, file_path, ext):
+        """Writes the current pivot table to .csv/.xlsx/.pdf; returns the number of rows written."""
+        rows = [tuple(row.get(key) for key in self.keys) for row in self.table]
+        exporter = StreamingReportExporter(self.columns, lambda: iter([rows]) if rows else iter([]),
+                                           total=len(rows), format_timestamps=False)
+        return exporter.export(file_path, ext)
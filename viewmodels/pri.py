@@ -1,124 +1,164 @@
-import json
+import copy
 import logging
-import tempfile
-import subprocess
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import A4
-from num2words import num2words
+import threading
 from viewmodels.printerviewmodel import PrinterViewModel
-from resource_utils import resource_path
+from utils.receipt_template import ReceiptTemplate
+from utils.receipt_store import ReceiptStore
+from utils.escpos import EscPosRenderer
+from utils.print_backends import create_backend
+from utils.app_config import get_config
+
+_logging_configured = False
+_STORE_KEYS = ("receipt_store_folder", "receipt_store_max_mb", "receipt_store_max_age_days")
+
+
+def configure_print_logging(filename="print_log.txt"):
+    """Sends print logs to filename; only the first call has any effect."""
+    global _logging_configured
+    if not _logging_configured:
+        logging.basicConfig(
+            filename=filename,
+            level=logging.INFO,
+            format="%(asctime)s - %(levelname)s - %(message)s"
+        )
+        _logging_configured = True
 
 
 def load_config():
-    config_path = resource_path("config.json")
-    if not os.path.exists(config_path):
-        raise FileNotFoundError("❌ Missing config.json file.")
-    with open(config_path, "r") as f:
-        config = json.load(f)
+    """Kept for older callers; returns the shared, read-only AppConfig."""
+    return get_config()
 
-    config["database_path"] = resource_path(config.get("database_path", "weighbridge.db"))
-    config["sumatra_path"] = resource_path(config.get("sumatra_path", "SumatraPDFcopy/SumatraPDF.exe"))
-    return config
 
 class ReceiptPrinter:
-    def __init__(self):
-        config = load_config()
+    """
+    Long-lived receipt printer: use get_receipt_printer() rather than building
+    one per print. It follows config.json edits through the ConfigService,
+    rebuilding only the parts whose settings changed.
+
+    The UI thread and the print spooler share it; anything that renders and
+    then prints should work on a snapshot() so both steps see the same
+    template, renderer and backend.
+    """
+    def __init__(self, config=None):
+        self.config = None
+        self.viewmodel = None
+        self.template = None
+        self.escpos = None
+        self.store = None
+        self._frozen = False
+        self._lock = threading.RLock()
+        self._apply(config or get_config())
+        configure_print_logging()
+
+    def _apply(self, config):
+        old = self.config or {}
+        if self.viewmodel is None or old.get("database_path") != config["database_path"]:
+            self.viewmodel = PrinterViewModel(config["database_path"])
+        if self.template is None or old.get("receipt_template") != config["receipt_template"]:
+            self.template = ReceiptTemplate.load(config["receipt_template"]) # Parsed once, reused for every receipt
+        if self.store is None or any(old.get(key) != config[key] for key in _STORE_KEYS):
+            self.store = ReceiptStore(config["receipt_store_folder"],
+                                      max_bytes=int(config["receipt_store_max_mb"] * 1024 * 1024),
+                                      max_age_days=config["receipt_store_max_age_days"])
+        self.backend = create_backend(config)
+        if getattr(self.backend, "format", "pdf") != "escpos":
+            self.escpos = None
+        elif (self.escpos is None or self.escpos.template is not self.template
+              or (self.escpos.columns, self.escpos.encoding) != (config["escpos_columns"], config["escpos_encoding"])):
+            self.escpos = EscPosRenderer(self.template, config["escpos_columns"], config["escpos_encoding"])
         self.db_path = config["database_path"]
         self.sumatra_path = config["sumatra_path"]
-        self.viewmodel = PrinterViewModel(self.db_path)
-
-        logging.basicConfig(
-            filename="print_log.txt",
-            level=logging.INFO,
-            format="%(asctime)s - %(levelname)s - %(message)s"
-        )
+        self.config = config
+
+    def refresh(self):
+        """Picks up config.json changes; a no-op while the file is unchanged, or on a snapshot."""
+        if self._frozen:
+            return self
+        with self._lock:
+            config = get_config()
+            if config is not self.config:
+                self._apply(config)
+        return self
+
+    def snapshot(self) -> "ReceiptPrinter":
+        """A copy fixed to the current configuration; _apply() replaces parts, it never mutates them."""
+        with self._lock:
+            self.refresh()
+            printer = copy.copy(self)
+        printer._frozen = True
+        return printer
+
+    def job_setup(self):
+        """(render, backend) for one PrintSpooler job, both from the same snapshot."""
+        printer = self.snapshot()
+        return printer.render_transaction, printer
+
+    @property
+    def name(self):
+        return self.backend.name
+
+    def print_file(self, pdf_path):
+        """Prints through the configured backend, so the printer itself can be handed to a PrintSpooler."""
+        self.refresh().backend.print_file(pdf_path)
+
+    def _digest(self, transaction, *layout):
+        return ReceiptStore.digest(transaction.get("LastUpdatedAt"), transaction.get("CustomerName"),
+                                   transaction.get("MaterialName"), self.template.fingerprint, *layout)
 
     def generate_receipt_pdf(self, transaction: dict) -> str:
-        page_width, page_height = A4
-        half_height = page_height / 2
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-        c = canvas.Canvas(temp_file.name, pagesize=A4)
-
-        def draw_receipt(y_offset: float):
-            left_x = 60
-            label_font = "Helvetica"
-            label_size = 10
-            line_y = y_offset + 260
-
-            c.setFont("Helvetica-Bold", 14)
-            c.drawCentredString(page_width / 2, line_y, "AGM BLUE METALS")
-            c.setFont(label_font, label_size)
-            for text in [
-                "GST NO: 33AARFA8461G1Z9",
-                "144/1-C, Karanampettai,",
-                "COIMBATORE, TAMILNADU, 641401."
-            ]:
-                line_y -= 15
-                c.drawCentredString(page_width / 2, line_y, text)
-
-            line_y -= 30
-            c.drawString(left_x, line_y, f"SL NO       : {transaction['Id']}")
-            c.drawString(left_x, line_y - 15, f"MATERIAL    : {transaction.get('MaterialName', '-')}")
-            c.drawRightString(page_width - 60, line_y, f"VEHICLE NO : {transaction['VehicleNumber']}")
-            c.drawRightString(page_width - 60, line_y - 15, f"CUSTOMER     : {transaction.get('CustomerName', '-')}")
-
-            line_y -= 30
-            c.line(left_x, line_y, page_width - 60, line_y)
-
-            line_y -= 20
-            c.drawString(left_x, line_y, f"GROSS WEIGHT : {transaction['FirstWeight']} Tons")
-            c.drawString(left_x, line_y - 15, f"TARE WEIGHT  : {transaction['SecondWeight']} Tons")
-            c.drawString(left_x, line_y - 30, f"NET WEIGHT   : {transaction['NetWeight']} Tons")
-
-            c.drawRightString(page_width - 60, line_y, f"DATE TIME (Gross): {transaction['FirstWeightTimestamp']}")
-            c.drawRightString(page_width - 60, line_y - 15, f"DATE TIME (Tare) : {transaction['SecondWeightTimestamp']}")
-            charges = transaction.get("Charges")
-            charges_str = f"{charges:.2f}" if charges is not None else "0.00"
-            c.drawRightString(page_width - 60, line_y - 30, f"CHARGES         : Rs. {charges_str}")
-
-            line_y -= 50
-            c.line(left_x, line_y, page_width - 60, line_y)
-            net_words = num2words(int(transaction["NetWeight"] or 0)).upper()
-            c.drawString(left_x, line_y - 20, f"NET WT (in words): {net_words} TONS")
-            c.drawString(left_x, line_y - 50, "OPERATOR SIGNATURE ___________________________")
-
-        draw_receipt(half_height)
-        draw_receipt(0)
-        c.showPage()
-        c.save()
-        return temp_file.name
+        """
+        Path of the receipt PDF in the ReceiptStore. A reprint of an unchanged
+        transaction reuses the stored file; the caller must not delete it.
+        """
+        template = self.template
+        # The static header/labels are one form XObject; only the fields are drawn per copy
+        return self.store.get_or_render(transaction["Id"], self._digest(transaction),
+                                        lambda path: template.render(path, [transaction]))
+
+    def generate_receipt(self, transaction: dict) -> str:
+        """Receipt file in the format the configured backend prints: ESC/POS bytes or a PDF."""
+        escpos = self.escpos
+        if escpos is None:
+            return self.generate_receipt_pdf(transaction)
+        digest = self._digest(transaction, "escpos", escpos.columns, escpos.encoding)
+        return self.store.get_or_render(transaction["Id"], digest, lambda path: escpos.render_to(path, transaction),
+                                        suffix=".bin")
+
+    def render_transaction(self, transaction_id) -> str:
+        """Receipt for a transaction id; the PrintSpooler's render hook. Raises LookupError if it doesn't exist."""
+        transaction = self.refresh().viewmodel.get_transaction_by_id(transaction_id)
+        if not transaction:
+            raise LookupError(f"Transaction {transaction_id} not found")
+        return self.generate_receipt(transaction)
 
     def print_last_transaction(self):
-        transaction = self.viewmodel.get_last_transaction()
+        printer = self.snapshot()
+        transaction = printer.viewmodel.get_last_transaction()
         if not transaction:
             logging.warning("❌ No transaction found for printing.")
             print("❌ No transaction found.")
             return
 
         try:
-            pdf_path = self.generate_receipt_pdf(transaction)
-            print(f"📄 PDF saved at: {pdf_path}")
-            if not os.path.exists(self.sumatra_path):
-                raise FileNotFoundError("❌ SumatraPDF executable not found.")
-
-            command = [self.sumatra_path, "-print-to-default", "-silent", pdf_path]
-            exit_code = subprocess.call(command)
-
-            if exit_code == 0:
-                logging.info(f"🖨️ Successfully printed transaction ID {transaction['Id']}")
-                print("✅ Print successful.")
-            else:
-                logging.error(f"⚠️ Print failed with exit code {exit_code}")
-                print(f"❌ Print command failed (exit code {exit_code}).")
+            pdf_path = printer.generate_receipt(transaction)
+            print(f"📄 Receipt saved at: {pdf_path}")
+            printer.backend.print_file(pdf_path)
+            logging.info(f"🖨️ Successfully printed transaction ID {transaction['Id']}")
+            print("✅ Print successful.")
 
         except Exception as e:
             logging.exception(f"❌ Exception during printing: {e}")
             print(f"❌ Exception occurred: {e}")
 
-        finally:
-            if os.path.exists(pdf_path):
-                try:
-                    os.remove(pdf_path)
-                    print("🧹 Temporary PDF cleaned up.")
-                except Exception as cleanup_error:
-                    logging.warning(f"Could not delete temp file: {cleanup_error}")
\ No newline at end of file
+
+_printer = None
+_printer_lock = threading.Lock()
+
+
+def get_receipt_printer() -> ReceiptPrinter:
+    """The application-wide ReceiptPrinter (created on first use)."""
+    global _printer
+    with _printer_lock:
+        if _printer is None:
+            _printer = ReceiptPrinter()
+        return _printer.refresh()
@@ -1,23 +1,30 @@
 import sqlite3
 from typing import Optional, Dict
 from resource_utils import resource_path
+from repositories.master_data_resolver import get_resolver
 
 
 class PrinterViewModel:
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, resolver=None):
         self.db_path = db_path
+        # Customer and material names come from the shared master-data cache, not a JOIN per receipt
+        self.resolver = resolver or get_resolver(db_path)
 
     def _connect(self):
         return sqlite3.connect(self.db_path)
 
+    def _with_names(self, row) -> Optional[Dict]:
+        if not row:
+            return None
+        transaction = dict(row)
+        transaction["CustomerName"] = self.resolver.customer_name(transaction["CustomerId"])
+        transaction["MaterialName"] = self.resolver.material_name(transaction["MaterialTypeId"])
+        return transaction
+
     def get_transaction_by_id(self, transaction_id: int) -> Optional[Dict]:
         query = """
-        SELECT wt.*, 
-           c.Name AS CustomerName, 
-           mt.Name AS MaterialName
+        SELECT wt.*
         FROM WeighingTransactions wt
-        LEFT JOIN Customers c ON wt.CustomerId = c.Id
-        LEFT JOIN MaterialTypes mt ON wt.MaterialTypeId = mt.Id
         WHERE wt.Id = ?
         """
         with self._connect() as conn:
@@ -25,15 +32,35 @@ class PrinterViewModel:
             cursor = conn.cursor()
             cursor.execute(query, (transaction_id,))
             row = cursor.fetchone()
-            return dict(row) if row else None
+            return self._with_names(row)
+
 
+    def get_last_completed_transaction(self, vehicle_number: Optional[str] = None) -> Optional[Dict]:
+        """
+        Most recently updated completed transaction, optionally for one vehicle.
+        Walks IX_WeighingTransactions_Status_LastUpdatedAt (or, for a vehicle,
+        IX_WeighingTransactions_VehicleNumber_Status_LastUpdatedAt) backwards, so
+        it is a single index seek rather than a table scan and sort.
+        """
+        query = """
+        SELECT wt.*
+        FROM WeighingTransactions wt
+        WHERE wt.Status = 'Completed'
+        """
+        params = ()
+        if vehicle_number:
+            query += " AND wt.VehicleNumber = ?"
+            params = (vehicle_number,)
+        query += " ORDER BY wt.LastUpdatedAt DESC LIMIT 1"
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            row = conn.execute(query, params).fetchone()
+            return self._with_names(row)
 
     def get_last_transaction(self) -> Optional[Dict]:
         query = """
-        SELECT wt.*, mt.Name AS MaterialName, c.Name AS CustomerName
+        SELECT wt.*
         FROM WeighingTransactions wt
-        LEFT JOIN MaterialTypes mt ON wt.MaterialTypeId = mt.Id
-        LEFT JOIN Customers c ON wt.CustomerId = c.Id
         ORDER BY wt.CreatedAt DESC
         LIMIT 1
 
@@ -43,4 +70,4 @@ class PrinterViewModel:
             cursor = conn.cursor()
             cursor.execute(query)
             row = cursor.fetchone()
-            return dict(row) if row else None
+            return self._with_names(row)
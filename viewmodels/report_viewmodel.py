@@ -1,19 +1,42 @@
 from Model.report_model import ReportRepository
+from Model.transaction_snapshot import TransactionSnapshot
+from repositories.master_data_resolver import MasterDataResolver, get_resolver
+from utils.report_export import StreamingReportExporter
+from utils.export_jobs import ExportJob
+from utils.query_cache import QueryResultCache
 # REMOVED: No longer needed, as ReportRepository now handles VehicleTypeName via join
 # from repositories.vehicle_repository import VehicleRepository 
 
 class ReportViewModel:
-    def __init__(self):
+    def __init__(self, export_runner=None):
         self.repo = ReportRepository()
+        self.export_runner = export_runner # ExportJobRunner; exports run synchronously without one
         self.daily_summary_data = []
+        self.weekly_summary_data = []
+        self.monthly_summary_data = []
         self.available_dates = []
         self.transactions_for_date = []
         self.filtered_transactions = []
+        self.current_filter = {} # Filter behind filtered_transactions; exports re-run it as a stream
+        self.page_size = 500
+        self.live_search_rows = 2000 # First load for live search; a complete result can be refined in memory
+        self.filtered_total = 0 # Rows matching current_filter; filtered_transactions holds the pages loaded so far
+        self.query_cache = QueryResultCache(self.repo.db_path) # Counts and pages, dropped when the DB changes
+        self.snapshot = None # TransactionSnapshot, created on first use
+        self.snapshot_summary = []
         
     def load_daily_summary(self):
         rows = self.repo.fetch_daily_summary()
         self.daily_summary_data = [dict(row) for row in rows]
 
+    def load_weekly_summary(self):
+        rows = self.repo.fetch_weekly_summary()
+        self.weekly_summary_data = [dict(row) for row in rows]
+
+    def load_monthly_summary(self):
+        rows = self.repo.fetch_monthly_summary()
+        self.monthly_summary_data = [dict(row) for row in rows]
+
     def load_available_dates(self):
         # Ensure "All Dates" is always the first option
         self.available_dates = ["All Dates"] + self.repo.fetch_available_dates() 
@@ -34,7 +57,213 @@ class ReportViewModel:
         rows = self.repo.fetch_raw_transactions()
         self.filtered_transactions = [dict(row) for row in rows]
     
-    def load_combined_filtered_transactions(self, column=None, keyword=None, date=None):
-        rows = self.repo.fetch_combined_filtered_transactions(column, keyword, date)
+    def load_transactions_in_range(self, date_from=None, date_to=None):
+        rows = self.repo.fetch_transactions_in_range(date_from, date_to)
+        self.transactions_for_date = [dict(row) for row in rows]
+
+    def load_combined_filtered_transactions(self, column=None, keyword=None, date=None,
+                                            date_from=None, date_to=None):
+        rows = self.repo.fetch_combined_filtered_transactions(column, keyword, date, date_from, date_to)
         self.filtered_transactions = [dict(row) for row in rows]
+        self.current_filter = dict(column=column, keyword=keyword, date=date,
+                                   date_from=date_from, date_to=date_to)
+
+    def load_first_page(self, column=None, keyword=None, date=None, date_from=None, date_to=None):
+        """Starts a paged load of the filter: fetches the total count and the first page."""
+        self.current_filter = dict(column=column, keyword=keyword, date=date,
+                                   date_from=date_from, date_to=date_to)
+        self.filtered_total = self.query_cache.get_or_load(
+            ("count",) + self._filter_key(),
+            lambda: self.repo.count_combined_filtered_transactions(**self.current_filter))
+        self.filtered_transactions = []
+        return self.load_next_page()
+
+    @property
+    def has_more_pages(self):
+        return len(self.filtered_transactions) < self.filtered_total
+
+    def load_next_page(self):
+        """Fetches the next page of the current filter; returns only the new rows."""
+        if not self.has_more_pages:
+            return []
+        offset = len(self.filtered_transactions)
+        page = self.query_cache.get_or_load(
+            ("page",) + self._filter_key() + (offset, self.page_size),
+            lambda: [dict(row) for row in self.repo.fetch_combined_filtered_page(
+                limit=self.page_size, offset=offset, **self.current_filter)])
+        self.filtered_transactions.extend(page)
+        if len(page) < self.page_size:
+            # Rows were deleted since the count; don't keep asking for more
+            self.filtered_total = len(self.filtered_transactions)
+        return page
+
+    # Report fields searched by each Search box column, for in-memory refinement
+    _REFINE_FIELDS = {
+        "VehicleNumber": ("VehicleNumber",),
+        "CustomerName": ("CustomerName",),
+        "MaterialName": ("MaterialName",),
+        "Status": ("Status",),
+        "VehicleTypeName": ("VehicleTypeName",),
+        "OperatorName": ("OperatorName",),
+        "Remarks": ("Remarks",),
+        "AllFields": ("VehicleNumber", "CustomerName", "MaterialName", "OperatorName", "Remarks"),
+    }
+
+    def refine_in_memory(self, column, keyword, date=None, date_from=None, date_to=None):
+        """
+        Narrows the loaded result without touching SQLite when the new keyword
+        contains the previous one (so its matches are a subset) on the same
+        column and dates, and the previous result was fully loaded.
+        Returns True if it did, False if a query is needed.
+        """
+        previous = self.current_filter
+        previous_keyword = previous.get("keyword")
+        same_scope = (previous.get("column") == column and previous.get("date") == date
+                      and previous.get("date_from") == date_from and previous.get("date_to") == date_to)
+        if not (same_scope and previous_keyword and keyword and column in self._REFINE_FIELDS
+                and previous_keyword.lower() in keyword.lower() and not self.has_more_pages):
+            return False
+
+        needle = keyword.lower()
+        fields = self._REFINE_FIELDS[column]
+        self.filtered_transactions = [
+            row for row in self.filtered_transactions
+            if any(needle in str(row.get(field) or "").lower() for field in fields)
+        ]
+        self.filtered_total = len(self.filtered_transactions)
+        self.current_filter = dict(previous, keyword=keyword)
+        return True
+
+    def start_live_search(self, runner, column, keyword, date=None, date_from=None, date_to=None,
+                          on_done=None, on_error=None):
+        """
+        Loads the first page for a search-as-you-type keystroke. Cached results
+        apply immediately; otherwise the count and first page are read on the
+        LatestQueryRunner, which aborts them if another keystroke supersedes
+        them. on_done() runs on the Tk thread once the VM holds the new result.
+        """
+        new_filter = dict(column=column, keyword=keyword, date=date, date_from=date_from, date_to=date_to)
+        count_key = ("count",) + self._filter_key(new_filter)
+        page_key = ("page",) + self._filter_key(new_filter) + (0, self.live_search_rows)
+        token = self.query_cache.current_token()
+
+        found_count, total = self.query_cache.lookup(count_key)
+        found_page, page = self.query_cache.lookup(page_key) if found_count else (False, None)
+        if found_count and found_page:
+            runner.cancel()
+            self._apply_first_page(new_filter, total, page, self.live_search_rows)
+            if on_done:
+                on_done()
+            return
+
+        page_size = self.live_search_rows
+
+        def query(conn):
+            total = self.repo.count_combined_filtered_transactions(conn=conn, **new_filter)
+            rows = self.repo.fetch_combined_filtered_page(limit=page_size, offset=0, conn=conn, **new_filter)
+            return total, [dict(row) for row in rows]
+
+        def apply(result):
+            total, page = result
+            self.query_cache.put(count_key, total, token=token)
+            self.query_cache.put(page_key, page, token=token)
+            self._apply_first_page(new_filter, total, page, page_size)
+            if on_done:
+                on_done()
+
+        runner.submit(query, on_result=apply, on_error=on_error)
+
+    def _apply_first_page(self, new_filter, total, page, requested):
+        self.current_filter = new_filter
+        self.filtered_total = total
+        self.filtered_transactions = list(page)
+        if len(page) < requested:
+            self.filtered_total = len(page)
+
+    def _filter_key(self, f=None):
+        f = self.current_filter if f is None else f
+        return (f["column"], f["keyword"], f["date"], str(f["date_from"] or ""), str(f["date_to"] or ""))
+
+    def cache_stats(self):
+        return self.query_cache.stats()
+
+    def export_filtered_transactions(self, file_path, ext, total=None, progress=None, chunk_size=1000,
+                                     filter_args=None):
+        """
+        Streams the current filter's rows from SQLite into file_path (.csv/.xlsx/.pdf).
+        Returns the number of rows written.
+        """
+        filter_args = self.current_filter if filter_args is None else filter_args
+        # The PDF shows minute-precision timestamps; SQLite formats them so Python never parses them
+        short_timestamps = ext == ".pdf"
+        exporter = StreamingReportExporter(
+            self.repo.REPORT_COLUMNS,
+            lambda: self.repo.iter_combined_filtered_transactions(chunk_size=chunk_size,
+                                                                  short_timestamps=short_timestamps,
+                                                                  **filter_args),
+            total=total,
+            progress=progress,
+            format_timestamps=not short_timestamps,
+        )
+        return exporter.export(file_path, ext)
+
+    def start_export(self, file_path, ext, on_progress=None, on_done=None, on_error=None, on_cancelled=None):
+        """
+        Queues an export of the current filter on the export runner and returns the ExportJob.
+        Callbacks run on the Tk thread: on_progress(job, percent), on_done(job, rows_written),
+        on_error(job, exception), on_cancelled(job).
+        """
+        filter_args = dict(self.current_filter) # Later filter changes must not affect a queued job
+
+        def run(job):
+            total = self.repo.count_combined_filtered_transactions(**filter_args)
+            job.check_cancelled()
+            return self.export_filtered_transactions(job.temp_path, ext, total=total, progress=job.report,
+                                                     filter_args=filter_args)
+
+        job = ExportJob(run, description=f"{ext} export", output_path=file_path,
+                        on_progress=on_progress, on_done=on_done, on_error=on_error, on_cancelled=on_cancelled)
+        if self.export_runner is None:
+            try:
+                rows = run(job)
+                job.publish_output()
+            finally:
+                job.discard_output()
+            if on_done:
+                on_done(job, rows)
+            return job
+        return self.export_runner.submit(job)
+
+    def load_snapshot_summary(self, group_by="day", date_from=None, date_to=None, status=None, conn=None):
+        """
+        Aggregates from the in-memory columnar snapshot instead of SQL.
+        The snapshot is refreshed incrementally before each aggregation.
+        Customer, material and vehicle type keys are returned as names.
+        Runs wherever it is called; the report screen uses start_snapshot_summary().
+        """
+        if self.snapshot is None:
+            self.snapshot = TransactionSnapshot(self.repo.db_path)
+        self.snapshot.refresh(conn)
+        mask = self.snapshot.mask(date_from=date_from, date_to=date_to, status=status)
+        groups = self.snapshot.group_totals(group_by, mask)
+        if group_by in MasterDataResolver.TABLES:
+            names = get_resolver() # Same default database as ReportRepository()
+            for group in groups:
+                group["Key"] = names.name(group_by, group["Key"])
+        return groups
+
+    def start_snapshot_summary(self, executor, group_by="day", date_from=None, date_to=None, status=None,
+                               on_done=None, on_error=None):
+        """
+        Refreshes the snapshot and aggregates on a DbExecutor whose resource is a
+        sqlite3 connection (only that thread touches the snapshot), so a large
+        refresh never blocks the Tk thread. on_done(groups) and on_error(e) run
+        on the Tk thread.
+        """
+        def apply(groups):
+            self.snapshot_summary = groups
+            if on_done:
+                on_done(groups)
 
+        return executor.submit(lambda conn: self.load_snapshot_summary(group_by, date_from, date_to, status, conn),
+                               on_success=apply, on_error=on_error)
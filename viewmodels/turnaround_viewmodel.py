@@ -0,0 +1,19 @@
+from Model.turnaround_model import TurnaroundRepository, GROUPS, DEFAULT_PERCENTILES
+
+
+class TurnaroundViewModel:
+    """Backs the Turnaround screen: dwell-time percentiles and the trucks still in the yard."""
+    def __init__(self, db_path="weighbridge.db"):
+        self.repo = TurnaroundRepository(db_path)
+        self.group_choices = list(GROUPS.keys())
+        self.percentile_columns = ["group", "count", "avg"] + [f"p{pct}" for pct in DEFAULT_PERCENTILES]
+        self.percentiles = []
+        self.in_yard = []
+
+    def load_percentiles(self, group_by="hour", date_from=None, date_to=None):
+        self.percentiles = self.repo.fetch_dwell_percentiles(group_by, date_from, date_to)
+        return self.percentiles
+
+    def load_in_yard(self):
+        self.in_yard = self.repo.fetch_in_yard()
+        return self.in_yard